@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import os
+from typing import Any
+
+from hatchling.builders.constants import BuildEnvVars
+
+# Files modified this recently may change again without their size or modification time changing
+RACY_INTERVAL_NS = 2_000_000_000
+
+
+class FileHashCache:
+    """
+    The hashes of files added to artifacts, persisted so that subsequent builds of the same project need not
+    rehash files whose path, size, modification time and inode are unchanged.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.entries: dict[str, list[Any]] | None = None
+        self.modified = False
+
+    @classmethod
+    def from_environment(cls, root: str) -> FileHashCache | None:
+        cache_dir = os.environ.get(BuildEnvVars.HASH_CACHE_DIR)
+        if not cache_dir:
+            return None
+
+        from hashlib import sha256
+
+        project_id = sha256(os.path.normcase(os.path.realpath(root)).encode("utf-8")).hexdigest()
+        return cls(os.path.join(cache_dir, f"{project_id[:32]}.json"))
+
+    def get(self, path: str, file_stat: os.stat_result) -> str | None:
+        entry = self.load().get(path)
+        if entry is None or entry[:3] != [file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_ino]:
+            return None
+
+        return entry[3]
+
+    def set(self, path: str, file_stat: os.stat_result, file_hash: str) -> None:
+        from time import time_ns
+
+        if time_ns() - file_stat.st_mtime_ns < RACY_INTERVAL_NS:
+            return
+
+        self.load()[path] = [file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_ino, file_hash]
+        self.modified = True
+
+    def load(self) -> dict[str, list[Any]]:
+        if self.entries is None:
+            import json
+
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                data = None
+
+            if isinstance(data, dict) and data.get("version") == self.VERSION and isinstance(data.get("files"), dict):
+                self.entries = data["files"]
+            else:
+                self.entries = {}
+
+        return self.entries
+
+    def save(self) -> None:
+        if not self.modified:
+            return
+
+        import json
+
+        from hatchling.utils.fs import write_file_atomic
+
+        write_file_atomic(self.path, json.dumps({"version": self.VERSION, "files": self.entries}))
+        self.modified = False
@@ -40,6 +40,9 @@ class BuildEnvVars:
     HOOK_ENABLE_PREFIX = "HATCH_BUILD_HOOK_ENABLE_"
     CLEAN = "HATCH_BUILD_CLEAN"
     CLEAN_HOOKS_AFTER = "HATCH_BUILD_CLEAN_HOOKS_AFTER"
+    HOOK_CACHE_DIR = "HATCH_BUILD_HOOK_CACHE_DIR"
+    HASH_CACHE_DIR = "HATCH_BUILD_HASH_CACHE_DIR"
+    PROFILE = "HATCH_BUILD_PROFILE"
 
 
 EDITABLES_REQUIREMENT = "editables~=0.3"
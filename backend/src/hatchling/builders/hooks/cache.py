@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import os
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any
+
+from hatchling.builders.constants import BuildEnvVars
+from hatchling.utils.constants import DEFAULT_BUILD_SCRIPT
+
+if TYPE_CHECKING:
+    from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+    from hatchling.builders.profile import BuildProfile
+
+
+class BuildHookCache:
+    """
+    The changes that a build hook made to the build data, persisted along with the state of the outputs that it
+    declared so that subsequent builds may skip the hook for as long as its declared inputs are unchanged.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str, key: str, output_paths: list[str]) -> None:
+        self.path = path
+        self.key = key
+        self.output_paths = output_paths
+
+    @classmethod
+    def from_environment(
+        cls, build_hook: BuildHookInterface, version: str, build_data: dict[str, Any]
+    ) -> BuildHookCache | None:
+        cache_dir = os.environ.get(BuildEnvVars.HOOK_CACHE_DIR)
+        if not cache_dir:
+            return None
+
+        # Errors are deferred to the actual execution of the hook so that they are reported consistently
+        try:
+            input_globs = build_hook.get_input_globs()
+            if input_globs is None:
+                return None
+
+            input_env_vars = build_hook.get_input_env_vars()
+            output_paths = build_hook.get_output_paths()
+        except Exception:  # noqa: BLE001
+            return None
+
+        import inspect
+        import json
+        from glob import glob
+        from hashlib import sha256
+
+        from hatchling.__about__ import __version__
+        from hatchling.utils.fs import get_file_digest
+
+        root = build_hook.root
+        input_files = {
+            path
+            for pattern in input_globs
+            for path in glob(os.path.join(root, pattern), recursive=True)
+            if os.path.isfile(path)
+        }
+
+        # The implementation of the hook itself is an input
+        if build_hook.PLUGIN_NAME == "custom":
+            input_files.add(os.path.join(root, build_hook.config.get("path", DEFAULT_BUILD_SCRIPT)))
+        else:
+            with suppress(OSError, TypeError):
+                input_files.add(inspect.getfile(type(build_hook)))
+
+        file_digests = {}
+        for path in sorted(input_files):
+            try:
+                file_digests[os.path.relpath(path, root)] = get_file_digest(path)
+            except OSError:
+                file_digests[os.path.relpath(path, root)] = None
+
+        try:
+            key_data = json.dumps(
+                [
+                    cls.VERSION,
+                    __version__,
+                    build_hook.target_name,
+                    version,
+                    build_hook.PLUGIN_NAME,
+                    build_hook.config,
+                    build_data,
+                    file_digests,
+                    {env_var: os.environ.get(env_var) for env_var in input_env_vars},
+                ],
+                sort_keys=True,
+            )
+        except (TypeError, ValueError):
+            return None
+
+        key = sha256(key_data.encode("utf-8")).hexdigest()
+        hook_id = sha256(
+            f"{os.path.normcase(os.path.realpath(root))}\0{build_hook.target_name}\0{version}\0{build_hook.PLUGIN_NAME}".encode()
+        ).hexdigest()
+        return cls(
+            os.path.join(cache_dir, f"{hook_id[:32]}.json"),
+            key,
+            [os.path.join(root, path) for path in output_paths],
+        )
+
+    def get(self) -> dict[str, Any] | None:
+        """
+        Returns the recorded changes if the hook may be skipped.
+        """
+        import json
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or data.get("key") != self.key:
+            return None
+
+        # Outputs may have been cleaned or modified since the hook last ran
+        if data.get("outputs") != self.get_output_fingerprint():
+            return None
+
+        changes = data.get("changes")
+        return changes if isinstance(changes, dict) else None
+
+    def set(self, changes: dict[str, Any]) -> None:
+        import json
+
+        from hatchling.utils.fs import write_file_atomic
+
+        try:
+            contents = json.dumps({"key": self.key, "outputs": self.get_output_fingerprint(), "changes": changes})
+        except (TypeError, ValueError):
+            return
+
+        write_file_atomic(self.path, contents)
+
+    def get_output_fingerprint(self) -> dict[str, list[int] | None]:
+        fingerprint: dict[str, list[int] | None] = {}
+        for path in self.output_paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                fingerprint[path] = None
+            else:
+                fingerprint[path] = [stat.st_size, stat.st_mtime_ns]
+
+        return fingerprint
+
+
+def initialize_build_hook(
+    build_hook: BuildHookInterface,
+    version: str,
+    build_data: dict[str, Any],
+    profile: BuildProfile | None = None,
+) -> tuple[bool, tuple[BuildHookCache, dict[str, Any]] | None]:
+    """
+    Let the hook modify the build data in-place, replaying its cached changes instead if possible.
+
+    Returns whether the hook was executed and, if its changes should be recorded once the build
+    succeeds, the cache along with those changes.
+    """
+    if profile is not None:
+        with profile.hook(build_hook.PLUGIN_NAME, "initialize"):
+            return initialize_build_hook(build_hook, version, build_data)
+
+    cache = BuildHookCache.from_environment(build_hook, version, build_data)
+    if cache is None:
+        build_hook.initialize(version, build_data)
+        return True, None
+
+    from hatchling.metadata.cache import apply_changes, get_changes
+
+    changes = cache.get()
+    if changes is not None:
+        build_hook.app.display_debug(f"Skipping unchanged build hook `{build_hook.PLUGIN_NAME}`")
+        apply_changes(build_data, changes)
+        return False, None
+
+    from copy import deepcopy
+
+    original_build_data = deepcopy(build_data)
+    build_hook.initialize(version, build_data)
+    return True, (cache, get_changes(original_build_data, build_data))
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from hatchling.builders.hooks.cache import BuildHookCache
+    from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+    from hatchling.builders.profile import BuildProfile
+
+
+def get_build_hook_batches(build_hooks: dict[str, BuildHookInterface]) -> list[list[str]]:
+    """
+    Group hooks into batches that must run one after the other. Hooks in the same batch are all parallel-safe
+    and do not depend on each other. The configured order is preserved unless a hook depends on one defined
+    after it.
+    """
+    dependencies: dict[str, list[str]] = {}
+    for hook_name, build_hook in build_hooks.items():
+        # Dependencies on hooks that are not enabled are meaningless
+        dependencies[hook_name] = [
+            dependency for dependency in build_hook.get_hook_dependencies() if dependency in build_hooks
+        ]
+
+    execution_order: list[str] = []
+    pending = list(build_hooks)
+    while pending:
+        for hook_name in pending:
+            if all(dependency in execution_order for dependency in dependencies[hook_name]):
+                execution_order.append(hook_name)
+                pending.remove(hook_name)
+                break
+        else:
+            message = f"Build hooks have circular dependencies: {', '.join(pending)}"
+            raise ValueError(message)
+
+    batches: list[list[str]] = []
+    batch_parallel_safe = False
+    for hook_name in execution_order:
+        parallel_safe = build_hooks[hook_name].is_parallel_safe()
+        if (
+            parallel_safe
+            and batch_parallel_safe
+            and not any(dependency in batches[-1] for dependency in dependencies[hook_name])
+        ):
+            batches[-1].append(hook_name)
+        else:
+            batches.append([hook_name])
+            batch_parallel_safe = parallel_safe
+
+    return batches
+
+
+def merge_build_data(
+    build_data: dict[str, Any], original_build_data: dict[str, Any], new_build_data: dict[str, Any]
+) -> None:
+    """
+    Merge the modifications that a hook made to its own copy of the build data. Items appended to arrays
+    and keys set on tables are combined with those of other hooks rather than replacing them.
+    """
+    for key, value in new_build_data.items():
+        if key not in original_build_data:
+            build_data[key] = value
+            continue
+
+        original_value = original_build_data[key]
+        if value == original_value:
+            continue
+
+        current_value = build_data.get(key)
+        if (
+            isinstance(value, list)
+            and isinstance(original_value, list)
+            and isinstance(current_value, list)
+            and value[: len(original_value)] == original_value
+        ):
+            current_value.extend(value[len(original_value) :])
+        elif isinstance(value, dict) and isinstance(original_value, dict) and isinstance(current_value, dict):
+            for item_key, item_value in value.items():
+                if original_value.get(item_key, Ellipsis) != item_value:
+                    current_value[item_key] = item_value
+
+            for item_key in original_value:
+                if item_key not in value:
+                    current_value.pop(item_key, None)
+        else:
+            build_data[key] = value
+
+    for key in original_build_data:
+        if key not in new_build_data:
+            build_data.pop(key, None)
+
+
+def initialize_build_hooks_concurrently(
+    build_hooks: list[BuildHookInterface],
+    version: str,
+    build_data: dict[str, Any],
+    profile: BuildProfile | None = None,
+) -> list[tuple[bool, tuple[BuildHookCache, dict[str, Any]] | None]]:
+    """
+    Initialize hooks at the same time, each with its own copy of the build data, and then merge their
+    modifications in order. The first error, in the same order, is raised once all hooks have finished.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from copy import deepcopy
+
+    from hatchling.builders.hooks.cache import initialize_build_hook
+
+    original_build_data = deepcopy(build_data)
+    hook_build_data = [deepcopy(build_data) for _ in build_hooks]
+    with ThreadPoolExecutor(max_workers=len(build_hooks)) as executor:
+        futures = [
+            executor.submit(initialize_build_hook, build_hook, version, data, profile)
+            for build_hook, data in zip(build_hooks, hook_build_data, strict=True)
+        ]
+
+    results = [future.result() for future in futures]
+    for data in hook_build_data:
+        merge_build_data(build_data, original_build_data, data)
+
+    return results
@@ -125,6 +125,78 @@ class BuildHookInterface(Generic[BuilderConfigBound]):  # no cov
         """
         return []
 
+    def get_input_globs(self) -> list[str] | None:  # noqa: PLR6301
+        """
+        This may return a list of glob patterns relative to the [root](#root) that match every file
+        influencing the hook other than its configuration and the build data it is given. When the
+        `HATCH_BUILD_HOOK_CACHE_DIR` environment variable is set, the modifications to the build data made
+        by [initialize](#initialize) are recorded after each successful build. Subsequent builds of the same
+        target version then skip the hook entirely, calling neither `initialize` nor `finalize`, and replay
+        the modifications for as long as those inputs and the [outputs](#get_output_paths) are unchanged.
+
+        The default is `None`, which disables caching.
+        """
+        return None
+
+    def get_input_env_vars(self) -> list[str]:  # noqa: PLR6301
+        """
+        This returns the names of environment variables that influence the hook and is only relevant
+        if [input globs](#get_input_globs) are declared.
+        """
+        return []
+
+    def get_output_paths(self) -> list[str]:  # noqa: PLR6301
+        """
+        This returns paths relative to the [root](#root) of the files that the hook generates, such as
+        compiled extension modules, and is only relevant if [input globs](#get_input_globs) are declared.
+        The hook will run again if any of them were removed or modified since it last ran.
+        """
+        return []
+
+    def is_parallel_safe(self) -> bool:
+        """
+        Whether the hook may run at the same time as adjacent parallel-safe hooks. Such hooks
+        receive their own copy of the build data and their modifications are merged in the order in
+        which the hooks are defined, with items appended to arrays and keys set on tables combined.
+
+        ```toml config-example
+        [tool.hatch.build.hooks.<PLUGIN_NAME>]
+        parallel-safe = true
+        ```
+
+        The default is the `parallel-safe` option, which defaults to `false`.
+        """
+        parallel_safe = self.config.get("parallel-safe", False)
+        if not isinstance(parallel_safe, bool):
+            message = f"Option `parallel-safe` of build hook `{self.PLUGIN_NAME}` must be a boolean"
+            raise TypeError(message)
+
+        return parallel_safe
+
+    def get_hook_dependencies(self) -> list[str]:
+        """
+        The names of other build hooks that must finish before this hook may run. Hooks that are not
+        enabled are ignored.
+
+        ```toml config-example
+        [tool.hatch.build.hooks.<PLUGIN_NAME>]
+        depends-on = ["<HOOK_NAME>"]
+        ```
+
+        The default is the `depends-on` option, which defaults to an empty array.
+        """
+        dependencies = self.config.get("depends-on", [])
+        if not isinstance(dependencies, list):
+            message = f"Option `depends-on` of build hook `{self.PLUGIN_NAME}` must be an array"
+            raise TypeError(message)
+
+        for i, dependency in enumerate(dependencies, 1):
+            if not isinstance(dependency, str):
+                message = f"Dependency #{i} of option `depends-on` of build hook `{self.PLUGIN_NAME}` must be a string"
+                raise TypeError(message)
+
+        return dependencies
+
     def clean(self, versions: list[str]) -> None:
         """
         This occurs before the build process if the `-c`/`--clean` flag was passed to
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import os
 import re
+import time
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from typing import TYPE_CHECKING, Any, Generic, cast
 
 from hatchling.builders.config import BuilderConfig, BuilderConfigBound, env_var_enabled
@@ -15,6 +17,7 @@ if TYPE_CHECKING:
 
     from hatchling.bridge.app import Application
     from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+    from hatchling.builders.profile import BuildProfile
     from hatchling.metadata.core import ProjectMetadata
 
 
@@ -78,6 +81,9 @@ class BuilderInterface(ABC, Generic[BuilderConfigBound, PluginManagerBound]):
         # Metadata
         self.__project_id: str | None = None
 
+        # Only set while building an artifact with profiling enabled
+        self.__profile: BuildProfile | None = None
+
     def build(
         self,
         *,
@@ -88,9 +94,16 @@ class BuilderInterface(ABC, Generic[BuilderConfigBound, PluginManagerBound]):
         clean_hooks_after: bool | None = None,
         clean_only: bool | None = False,
     ) -> Generator[str, None, None]:
+        from hatchling.builders.profile import BuildProfile
+
+        profile_enabled = env_var_enabled(BuildEnvVars.PROFILE)
+        wall, cpu = time.perf_counter(), time.process_time()
+
         # Fail early for invalid project metadata
         self.metadata.validate_fields()
 
+        metadata_time: tuple[float, float] | None = (time.perf_counter() - wall, time.process_time() - cpu)
+
         if directory is None:
             directory = (
                 self.config.normalize_build_directory(os.environ[BuildEnvVars.LOCATION])
@@ -135,30 +148,82 @@ class BuilderInterface(ABC, Generic[BuilderConfigBound, PluginManagerBound]):
         if clean_hooks_after is None:
             clean_hooks_after = env_var_enabled(BuildEnvVars.CLEAN_HOOKS_AFTER)
 
+        from hatchling.builders.hooks.cache import initialize_build_hook
+        from hatchling.builders.hooks.parallel import get_build_hook_batches, initialize_build_hooks_concurrently
+
+        build_hook_batches = get_build_hook_batches(configured_build_hooks)
+
         for version in versions:
             self.app.display_debug(f"Building `{self.PLUGIN_NAME}` version `{version}`")
 
+            profile = BuildProfile(self.PLUGIN_NAME, version) if profile_enabled else None
+            if profile is not None and metadata_time is not None:
+                # Metadata is shared by all versions so it is only attributed to the first
+                profile.add_phase("metadata", *metadata_time)
+                metadata_time = None
+
             build_data = self.get_default_build_data()
             self.set_build_data_defaults(build_data)
 
             # Allow inspection of configured build hooks and the order in which they run
-            build_data["build_hooks"] = tuple(configured_build_hooks)
-
-            # Execute all `initialize` build hooks
-            for build_hook in build_hooks:
-                build_hook.initialize(version, build_data)
+            build_data["build_hooks"] = tuple(hook_name for batch in build_hook_batches for hook_name in batch)
+
+            # Execute all `initialize` build hooks, except for those with unchanged inputs whose
+            # modifications to the build data are replayed instead
+            executed_build_hooks = []
+            build_hook_caches = []
+            with profile.phase("initialize hooks") if profile is not None else nullcontext():
+                for batch in build_hook_batches:
+                    if len(batch) == 1:
+                        results = [
+                            initialize_build_hook(configured_build_hooks[batch[0]], version, build_data, profile)
+                        ]
+                    else:
+                        results = initialize_build_hooks_concurrently(
+                            [configured_build_hooks[hook_name] for hook_name in batch], version, build_data, profile
+                        )
+
+                    for hook_name, (executed, cache_entry) in zip(batch, results, strict=True):
+                        if executed:
+                            executed_build_hooks.append(configured_build_hooks[hook_name])
+                        if cache_entry is not None:
+                            build_hook_caches.append(cache_entry)
 
             if hooks_only:
+                for cache, changes in build_hook_caches:
+                    cache.set(changes)
+
                 self.app.display_debug(f"Only ran build hooks for `{self.PLUGIN_NAME}` version `{version}`")
                 continue
 
             # Build the artifact
-            with self.config.set_build_data(build_data):
-                artifact = version_api[version](directory, **build_data)
+            self.__profile = profile
+            try:
+                with (
+                    self.config.set_build_data(build_data),
+                    profile.archive() if profile is not None else nullcontext(),
+                ):
+                    artifact = version_api[version](directory, **build_data)
+            finally:
+                self.__profile = None
 
             # Execute all `finalize` build hooks
-            for build_hook in build_hooks:
-                build_hook.finalize(version, build_data, artifact)
+            if profile is None:
+                for build_hook in executed_build_hooks:
+                    build_hook.finalize(version, build_data, artifact)
+            else:
+                with profile.phase("finalize hooks"):
+                    for build_hook in executed_build_hooks:
+                        with profile.hook(build_hook.PLUGIN_NAME, "finalize"):
+                            build_hook.finalize(version, build_data, artifact)
+
+                profile.record_artifact(artifact)
+                profile.write(f"{artifact}.profile.json")
+                self.app.display_info(profile.format())
+
+            # Only successful builds are recorded
+            for cache, changes in build_hook_caches:
+                cache.set(changes)
 
             if clean_hooks_after:
                 for build_hook in build_hooks:
@@ -175,6 +240,12 @@ class BuilderInterface(ABC, Generic[BuilderConfigBound, PluginManagerBound]):
         - `relative_path` - the path relative to the project root; will be an empty string for external files
         - `distribution_path` - the path to be distributed as
         """
+        if self.__profile is not None:
+            yield from self.__profile.select_files(self.__recurse_included_files())
+        else:
+            yield from self.__recurse_included_files()
+
+    def __recurse_included_files(self) -> Iterable[IncludedFile]:
         yield from self.recurse_selected_project_files()
         yield from self.recurse_forced_files(self.config.get_force_include())
 
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+
+    from hatchling.builders.plugin.interface import IncludedFile
+
+
+class BuildProfile:
+    """
+    The wall and CPU time spent in each phase of building a single artifact, along with the number
+    of selected files, the number of bytes written and the time taken by every build hook.
+    """
+
+    PHASES = ("metadata", "initialize hooks", "file selection", "archive writing", "finalize hooks")
+
+    def __init__(self, target: str, version: str) -> None:
+        self.target = target
+        self.version = version
+        self.phases: dict[str, dict[str, float]] = {}
+        self.hooks: list[dict[str, Any]] = []
+        self.file_count = 0
+        self.bytes_written = 0
+
+        # Hooks may be initialized concurrently
+        self.__lock = threading.Lock()
+
+    def add_phase(self, name: str, wall: float, cpu: float) -> None:
+        phase = self.phases.setdefault(name, {"wall": 0.0, "cpu": 0.0})
+        phase["wall"] += wall
+        phase["cpu"] += cpu
+
+    @contextmanager
+    def phase(self, name: str) -> Generator[None, None, None]:
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            self.add_phase(name, time.perf_counter() - wall, time.process_time() - cpu)
+
+    @contextmanager
+    def hook(self, name: str, stage: str) -> Generator[None, None, None]:
+        # Use the time of the current thread so that concurrent hooks are not attributed each other's work
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            wall, cpu = time.perf_counter() - wall, time.thread_time() - cpu
+            with self.__lock:
+                self.hooks.append({"name": name, "stage": stage, "wall": wall, "cpu": cpu})
+
+    @contextmanager
+    def archive(self) -> Generator[None, None, None]:
+        """
+        Measure the building of the artifact itself. Time spent selecting files during the build is
+        recorded separately, so only the remainder is attributed to writing the archive.
+        """
+        selection = dict(self.phases.get("file selection", {"wall": 0.0, "cpu": 0.0}))
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            new_selection = self.phases.get("file selection", {"wall": 0.0, "cpu": 0.0})
+            self.add_phase(
+                "archive writing",
+                wall - (new_selection["wall"] - selection["wall"]),
+                cpu - (new_selection["cpu"] - selection["cpu"]),
+            )
+
+    def select_files(self, files: Iterable[IncludedFile]) -> Iterable[IncludedFile]:
+        # Selection is lazy and interleaved with writing so only the time spent producing files is measured
+        iterator = iter(files)
+        while True:
+            wall, cpu = time.perf_counter(), time.process_time()
+            try:
+                included_file = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.add_phase("file selection", time.perf_counter() - wall, time.process_time() - cpu)
+
+            self.file_count += 1
+            yield included_file
+
+    def record_artifact(self, artifact: str) -> None:
+        if os.path.isfile(artifact):
+            self.bytes_written = os.path.getsize(artifact)
+        elif os.path.isdir(artifact):
+            self.bytes_written = sum(
+                os.path.getsize(os.path.join(root, f)) for root, _, files in os.walk(artifact) for f in files
+            )
+
+    def to_dict(self) -> dict[str, Any]:
+        phases = {name: self.phases[name] for name in self.PHASES if name in self.phases}
+        return {
+            "target": self.target,
+            "version": self.version,
+            "wall": sum(phase["wall"] for phase in phases.values()),
+            "cpu": sum(phase["cpu"] for phase in phases.values()),
+            "phases": phases,
+            "hooks": self.hooks,
+            "files": self.file_count,
+            "bytes_written": self.bytes_written,
+        }
+
+    def write(self, path: str) -> None:
+        import json
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+            f.write("\n")
+
+    def format(self) -> str:
+        """
+        Return a human readable breakdown.
+        """
+        data = self.to_dict()
+        rows = []
+        for name, phase in data["phases"].items():
+            rows.append((name, phase["wall"], phase["cpu"]))
+            rows.extend(
+                (f"  {hook['name']}", hook["wall"], hook["cpu"])
+                for hook in data["hooks"]
+                if name == f"{hook['stage']} hooks"
+            )
+
+        rows.append(("total", data["wall"], data["cpu"]))
+
+        width = max(len(name) for name, _, _ in rows)
+        lines = [f"{name:<{width}}  {wall:8.3f}s wall  {cpu:8.3f}s cpu" for name, wall, cpu in rows]
+        lines.append(f"{data['files']} files selected, {data['bytes_written']} bytes written")
+        return "\n".join(lines)
@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import gzip
 import os
+import stat
+import struct
 import tarfile
 import tempfile
 from contextlib import closing
 from copy import copy
 from io import BytesIO
 from time import time as get_current_timestamp
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, BinaryIO
 
 from hatchling.builders.config import BuilderConfig
 from hatchling.builders.plugin.interface import BuilderInterface
@@ -25,11 +27,91 @@ from hatchling.utils.constants import DEFAULT_BUILD_SCRIPT, DEFAULT_CONFIG_FILE
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from concurrent.futures import Future
     from types import TracebackType
 
 
+class ParallelGzipFile:
+    """
+    A write-only file object that produces a single gzip stream, in the style of pigz. Data is split into
+    blocks that are compressed concurrently, each primed with the end of the previous block, and then
+    concatenated using sync flushes. The output only depends on the block size and not on the number of workers.
+    """
+
+    BLOCK_SIZE = 128 * 1024
+    DICTIONARY_SIZE = 32 * 1024
+
+    def __init__(
+        self, fileobj: BinaryIO, *, mtime: int | None, compresslevel: int = 9, workers: int | None = None
+    ) -> None:
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.fileobj = fileobj
+        self.compresslevel = compresslevel
+        self.workers = workers or min(32, os.cpu_count() or 1)
+        self.executor = ThreadPoolExecutor(max_workers=self.workers)
+        self.pending: deque[Future[bytes]] = deque()
+        self.buffer = bytearray()
+        self.dictionary = b""
+        self.crc = 0
+        self.size = 0
+
+        # Same header as `gzip.GzipFile` without a file name
+        mtime = int(get_current_timestamp()) if mtime is None else mtime
+        extra_flags = 2 if compresslevel == 9 else 4 if compresslevel == 1 else 0  # noqa: PLR2004
+        self.fileobj.write(b"\x1f\x8b\x08\x00" + struct.pack("<L", mtime) + bytes((extra_flags, 255)))
+
+    def write(self, data: bytes) -> int:
+        import zlib
+
+        self.crc = zlib.crc32(data, self.crc)
+        self.size += len(data)
+        self.buffer += data
+        while len(self.buffer) >= self.BLOCK_SIZE:
+            block = bytes(self.buffer[: self.BLOCK_SIZE])
+            del self.buffer[: self.BLOCK_SIZE]
+            self.submit(block, final=False)
+
+        return len(data)
+
+    def tell(self) -> int:
+        return self.size
+
+    def submit(self, block: bytes, *, final: bool) -> None:
+        self.pending.append(self.executor.submit(self.compress, block, self.dictionary, self.compresslevel, final))
+        self.dictionary = block[-self.DICTIONARY_SIZE :]
+
+        # Bound memory usage by writing completed blocks in order
+        while len(self.pending) > self.workers * 2:
+            self.fileobj.write(self.pending.popleft().result())
+
+    def close(self) -> None:
+        try:
+            self.submit(bytes(self.buffer), final=True)
+            self.buffer.clear()
+            while self.pending:
+                self.fileobj.write(self.pending.popleft().result())
+        finally:
+            self.executor.shutdown()
+
+        self.fileobj.write(struct.pack("<LL", self.crc, self.size & 0xFFFFFFFF))
+
+    @staticmethod
+    def compress(block: bytes, dictionary: bytes, compresslevel: int, final: bool) -> bytes:  # noqa: FBT001
+        import zlib
+
+        # Raw deflate data may refer to the previous block because all blocks form a single stream
+        compressor = (
+            zlib.compressobj(compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=dictionary)
+            if dictionary
+            else zlib.compressobj(compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS)
+        )
+        return compressor.compress(block) + compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
 class SdistArchive:
-    def __init__(self, name: str, *, reproducible: bool) -> None:
+    def __init__(self, name: str, *, reproducible: bool, parallel_compression: bool = False) -> None:
         """
         https://peps.python.org/pep-0517/#source-distributions
         """
@@ -39,10 +121,35 @@ class SdistArchive:
 
         raw_fd, self.path = tempfile.mkstemp(suffix=".tar.gz")
         self.fd = os.fdopen(raw_fd, "w+b")
-        self.gz = gzip.GzipFile(fileobj=self.fd, mode="wb", mtime=self.timestamp)
-        self.tf = tarfile.TarFile(fileobj=self.gz, mode="w", format=tarfile.PAX_FORMAT)
+        self.gz: gzip.GzipFile | ParallelGzipFile = (
+            ParallelGzipFile(self.fd, mtime=self.timestamp)
+            if parallel_compression
+            else gzip.GzipFile(fileobj=self.fd, mode="wb", mtime=self.timestamp)
+        )
+        self.tf = tarfile.TarFile(fileobj=self.gz, mode="w", format=tarfile.PAX_FORMAT)  # type: ignore[arg-type]
         self.gettarinfo = lambda *args, **kwargs: self.normalize_tar_metadata(self.tf.gettarinfo(*args, **kwargs))
 
+    def add_regular_file(self, path: str, archive_path: str) -> None:
+        """
+        Add a file using only the status of its open descriptor, avoiding the lookups of owner names and
+        the detection of links that `gettarinfo` performs. Symbolic links are stored as the files they point to.
+        """
+        with open(path, "rb") as f:
+            file_stat = os.fstat(f.fileno())
+
+            tar_info = tarfile.TarInfo(archive_path)
+            tar_info.size = file_stat.st_size
+            if self.reproducible:
+                tar_info.mode = normalize_file_permissions(stat.S_IMODE(file_stat.st_mode))
+                tar_info.mtime = self.timestamp if self.timestamp is not None else int(file_stat.st_mtime)
+            else:
+                tar_info.mode = stat.S_IMODE(file_stat.st_mode)
+                tar_info.mtime = int(file_stat.st_mtime)
+                tar_info.uid = file_stat.st_uid
+                tar_info.gid = file_stat.st_gid
+
+            self.tf.addfile(tar_info, f)
+
     def create_file(self, contents: str | bytes, *relative_paths: str) -> None:
         if not isinstance(contents, bytes):
             contents = contents.encode("utf-8")
@@ -94,6 +201,8 @@ class SdistBuilderConfig(BuilderConfig):
         self.__core_metadata_constructor: Callable[..., str] | None = None
         self.__strict_naming: bool | None = None
         self.__support_legacy: bool | None = None
+        self.__parallel_compression: bool | None = None
+        self.__fast_members: bool | None = None
 
     @property
     def core_metadata_constructor(self) -> Callable[..., str]:
@@ -141,6 +250,30 @@ class SdistBuilderConfig(BuilderConfig):
 
         return self.__support_legacy
 
+    @property
+    def parallel_compression(self) -> bool:
+        if self.__parallel_compression is None:
+            parallel_compression = self.target_config.get("parallel-compression", False)
+            if not isinstance(parallel_compression, bool):
+                message = f"Field `tool.hatch.build.targets.{self.plugin_name}.parallel-compression` must be a boolean"
+                raise TypeError(message)
+
+            self.__parallel_compression = parallel_compression
+
+        return self.__parallel_compression
+
+    @property
+    def fast_members(self) -> bool:
+        if self.__fast_members is None:
+            fast_members = self.target_config.get("fast-members", False)
+            if not isinstance(fast_members, bool):
+                message = f"Field `tool.hatch.build.targets.{self.plugin_name}.fast-members` must be a boolean"
+                raise TypeError(message)
+
+            self.__fast_members = fast_members
+
+        return self.__fast_members
+
 
 class SdistBuilder(BuilderInterface):
     """
@@ -167,19 +300,25 @@ class SdistBuilder(BuilderInterface):
     def build_standard(self, directory: str, **build_data: Any) -> str:
         found_packages = set()
 
-        with SdistArchive(self.artifact_project_id, reproducible=self.config.reproducible) as archive:
+        with SdistArchive(
+            self.artifact_project_id,
+            reproducible=self.config.reproducible,
+            parallel_compression=self.config.parallel_compression,
+        ) as archive:
             for included_file in self.recurse_included_files():
                 if self.config.support_legacy:
                     possible_package, file_name = os.path.split(included_file.relative_path)
                     if file_name == "__init__.py":
                         found_packages.add(possible_package)
 
-                tar_info = archive.gettarinfo(
-                    included_file.path,
-                    arcname=normalize_archive_path(
-                        os.path.join(self.artifact_project_id, included_file.distribution_path)
-                    ),
+                archive_path = normalize_archive_path(
+                    os.path.join(self.artifact_project_id, included_file.distribution_path)
                 )
+                if self.config.fast_members:
+                    archive.add_regular_file(included_file.path, archive_path)
+                    continue
+
+                tar_info = archive.gettarinfo(included_file.path, arcname=archive_path)
                 if tar_info is None:  # no cov
                     continue
 
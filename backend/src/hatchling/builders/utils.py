@@ -3,10 +3,10 @@ from __future__ import annotations
 import os
 import shutil
 from base64 import urlsafe_b64encode
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, BinaryIO
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
     from zipfile import ZipInfo
 
 
@@ -126,3 +126,82 @@ def set_zip_info_mode(zip_info: ZipInfo, mode: int = 0o644) -> None:
     https://github.com/takluyver/flit/commit/3889583719888aef9f28baaa010e698cb7884904
     """
     zip_info.external_attr = (mode & 0xFFFF) << 16
+
+
+def iter_file_chunks(source: BinaryIO, size: int) -> Iterator[bytes | memoryview]:
+    """
+    Yield the first `size` bytes of the file in large chunks, memory mapping the file where possible so that
+    the data is not copied into intermediate buffers.
+    """
+    chunk_size = 8 * 1024 * 1024
+    if not size:
+        return
+
+    import mmap
+
+    try:
+        mapped = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        source.seek(0)
+        remaining = size
+        while remaining:
+            chunk = source.read(min(remaining, chunk_size))
+            if not chunk:
+                break
+
+            yield chunk
+            remaining -= len(chunk)
+
+        return
+
+    with mapped, memoryview(mapped) as view:
+        for offset in range(0, min(size, len(mapped)), chunk_size):
+            with view[offset : min(offset + chunk_size, size)] as chunk:
+                yield chunk
+
+
+def copy_file_data(source: BinaryIO, destination: BinaryIO, size: int) -> None:
+    """
+    Append the first `size` bytes of the source file to the destination file, letting the kernel copy the
+    data directly between file descriptors where supported and falling back to buffered copying otherwise.
+    """
+    import errno
+
+    destination.flush()
+    destination_offset = destination.tell()
+
+    copied = 0
+    try:
+        if hasattr(os, "copy_file_range"):
+            while copied < size:
+                count = os.copy_file_range(
+                    source.fileno(), destination.fileno(), size - copied, copied, destination_offset + copied
+                )
+                if not count:
+                    break
+
+                copied += count
+        elif hasattr(os, "sendfile"):
+            os.lseek(destination.fileno(), destination_offset, os.SEEK_SET)
+            while copied < size:
+                count = os.sendfile(destination.fileno(), source.fileno(), copied, size - copied)
+                if not count:
+                    break
+
+                copied += count
+    # Happens for unsupported combinations of file systems or file types
+    except OSError as e:
+        if e.errno not in {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSOCK, errno.EBADF}:
+            raise
+
+    # The position of buffered file objects must be synchronized with that of the descriptor
+    destination.seek(destination_offset + copied)
+    source.seek(copied)
+    while copied < size:
+        chunk = source.read(min(size - copied, 1048576))
+        if not chunk:
+            message = f"File shrank while being copied: {getattr(source, 'name', source)}"
+            raise OSError(message)
+
+        destination.write(chunk)
+        copied += len(chunk)
@@ -7,18 +7,24 @@ import stat
 import sys
 import tempfile
 import zipfile
+import zlib
 from functools import cached_property
 from io import StringIO
-from typing import TYPE_CHECKING, Any, NamedTuple, cast
+from typing import TYPE_CHECKING, Any, BinaryIO, NamedTuple, cast
+
+import pathspec
 
 from hatchling.__about__ import __version__
+from hatchling.builders.cache import FileHashCache
 from hatchling.builders.config import BuilderConfig
 from hatchling.builders.constants import EDITABLES_REQUIREMENT
 from hatchling.builders.plugin.interface import BuilderInterface
 from hatchling.builders.utils import (
+    copy_file_data,
     format_file_hash,
     get_known_python_major_versions,
     get_reproducible_timestamp,
+    iter_file_chunks,
     normalize_archive_path,
     normalize_artifact_permissions,
     normalize_file_permissions,
@@ -71,8 +77,34 @@ class RecordFile:
 
 class _WheelZipFile(zipfile.ZipFile):
     def open(self, name, mode="r", pwd=None, *, force_zip64=False):
-        filename = name.filename if isinstance(name, zipfile.ZipInfo) else name
-        if mode == "w" and filename in self.NameToInfo:
+        if mode == "w":
+            self.__ensure_new_member(name.filename if isinstance(name, zipfile.ZipInfo) else name)
+
+        return super().open(name, mode, pwd, force_zip64=force_zip64)
+
+    def write_stored(self, zip_info: zipfile.ZipInfo, source: BinaryIO, size: int) -> None:
+        """
+        Add an uncompressed member whose CRC is already set. The local header is written first and the data
+        is then copied by the kernel directly from the source file to the archive.
+        """
+        self.__ensure_new_member(zip_info.filename)
+
+        zip_info.compress_type = zipfile.ZIP_STORED
+        zip_info.file_size = zip_info.compress_size = size
+        # The sizes and CRC are known up front so no data descriptor follows the data
+        zip_info.flag_bits &= ~0x08
+
+        self.fp.seek(self.start_dir)
+        zip_info.header_offset = self.start_dir
+        self.fp.write(zip_info.FileHeader(zip64=size > zipfile.ZIP64_LIMIT))
+        copy_file_data(source, self.fp, size)
+
+        self.filelist.append(zip_info)
+        self.NameToInfo[zip_info.filename] = zip_info
+        self.start_dir = self.fp.tell()
+
+    def __ensure_new_member(self, filename: str) -> None:
+        if filename in self.NameToInfo:
             message = (
                 f"A second file is being added to the wheel archive at the same path: `{filename}`.\n\n"
                 f"The most likely cause of this is an entry in the "
@@ -81,14 +113,21 @@ class _WheelZipFile(zipfile.ZipFile):
             )
             raise ValueError(message)
 
-        return super().open(name, mode, pwd, force_zip64=force_zip64)
-
 
 class WheelArchive:
-    def __init__(self, project_id: str, *, reproducible: bool) -> None:
+    def __init__(
+        self,
+        project_id: str,
+        *,
+        reproducible: bool,
+        hash_cache: FileHashCache | None = None,
+        stored_spec: pathspec.GitIgnoreSpec | None = None,
+    ) -> None:
         """
         https://peps.python.org/pep-0427/#abstract
         """
+        self.hash_cache = hash_cache
+        self.stored_spec = stored_spec
         self.metadata_directory = f"{project_id}.dist-info"
         self.shared_data_directory = f"{project_id}.data"
         self.time_tuple: TIME_TUPLE | None = None
@@ -131,17 +170,38 @@ class WheelArchive:
 
         zip_info.compress_type = zipfile.ZIP_DEFLATED
 
-        hash_obj = hashlib.sha256()
-        with open(included_file.path, "rb") as in_file, self.zf.open(zip_info, "w") as out_file:
-            while True:
-                chunk = in_file.read(16384)
-                if not chunk:
-                    break
+        hash_digest = None if self.hash_cache is None else self.hash_cache.get(included_file.path, file_stat)
+        hash_obj = hashlib.sha256() if hash_digest is None else None
+        if (
+            self.stored_spec is not None
+            and self.stored_spec.match_file(relative_path)
+            and stat.S_ISREG(file_stat.st_mode)
+        ):
+            with open(included_file.path, "rb") as in_file:
+                crc = 0
+                for chunk in iter_file_chunks(in_file, file_stat.st_size):
+                    crc = zlib.crc32(chunk, crc)
+                    if hash_obj is not None:
+                        hash_obj.update(chunk)
+
+                zip_info.CRC = crc
+                self.zf.write_stored(zip_info, in_file, file_stat.st_size)
+        else:
+            with open(included_file.path, "rb") as in_file, self.zf.open(zip_info, "w") as out_file:
+                while True:
+                    chunk = in_file.read(16384)
+                    if not chunk:
+                        break
 
-                hash_obj.update(chunk)
-                out_file.write(chunk)
+                    if hash_obj is not None:
+                        hash_obj.update(chunk)
+                    out_file.write(chunk)
+
+        if hash_obj is not None:
+            hash_digest = format_file_hash(hash_obj.digest())
+            if self.hash_cache is not None:
+                self.hash_cache.set(included_file.path, file_stat, hash_digest)
 
-        hash_digest = format_file_hash(hash_obj.digest())
         return relative_path, f"sha256={hash_digest}", str(file_stat.st_size)
 
     def write_metadata(self, relative_path: str, contents: str | bytes) -> tuple[str, str, str]:
@@ -213,6 +273,9 @@ class WheelArchive:
         self.zf.close()
         self.fd.close()
 
+        if self.hash_cache is not None:
+            self.hash_cache.save()
+
 
 class WheelBuilderConfig(BuilderConfig):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -473,6 +536,28 @@ class WheelBuilderConfig(BuilderConfig):
 
         return bypass_selection
 
+    @cached_property
+    def stored_spec(self) -> pathspec.GitIgnoreSpec | None:
+        stored_location = f"tool.hatch.build.targets.{self.plugin_name}.stored-files"
+        stored_patterns = self.target_config.get("stored-files", [])
+        if not isinstance(stored_patterns, list):
+            message = f"Field `{stored_location}` must be an array of strings"
+            raise TypeError(message)
+
+        for i, stored_pattern in enumerate(stored_patterns, 1):
+            if not isinstance(stored_pattern, str):
+                message = f"Pattern #{i} in field `{stored_location}` must be a string"
+                raise TypeError(message)
+
+            if not stored_pattern:
+                message = f"Pattern #{i} in field `{stored_location}` cannot be an empty string"
+                raise ValueError(message)
+
+        if stored_patterns:
+            return pathspec.GitIgnoreSpec.from_lines(stored_patterns)
+
+        return None
+
     if sys.platform in {"darwin", "win32"}:
 
         @staticmethod
@@ -522,7 +607,12 @@ class WheelBuilder(BuilderInterface):
                 build_data["tag"] = self.get_default_tag()
 
         with (
-            WheelArchive(self.artifact_project_id, reproducible=self.config.reproducible) as archive,
+            WheelArchive(
+                self.artifact_project_id,
+                reproducible=self.config.reproducible,
+                hash_cache=FileHashCache.from_environment(self.root),
+                stored_spec=self.config.stored_spec,
+            ) as archive,
             RecordFile() as records,
         ):
             for included_file in self.recurse_included_files():
@@ -552,7 +642,12 @@ class WheelBuilder(BuilderInterface):
         build_data["tag"] = self.get_default_tag()
 
         with (
-            WheelArchive(self.artifact_project_id, reproducible=self.config.reproducible) as archive,
+            WheelArchive(
+                self.artifact_project_id,
+                reproducible=self.config.reproducible,
+                hash_cache=FileHashCache.from_environment(self.root),
+                stored_spec=self.config.stored_spec,
+            ) as archive,
             RecordFile() as records,
         ):
             exposed_packages = {}
@@ -634,7 +729,12 @@ class WheelBuilder(BuilderInterface):
         build_data["tag"] = self.get_default_tag()
 
         with (
-            WheelArchive(self.artifact_project_id, reproducible=self.config.reproducible) as archive,
+            WheelArchive(
+                self.artifact_project_id,
+                reproducible=self.config.reproducible,
+                hash_cache=FileHashCache.from_environment(self.root),
+                stored_spec=self.config.stored_spec,
+            ) as archive,
             RecordFile() as records,
         ):
             directories = sorted(
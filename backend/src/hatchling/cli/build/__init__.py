@@ -94,6 +94,16 @@ def build_impl(
 
     if show_dynamic_deps:
         app.display(str(list(dynamic_dependencies)))
+    elif not (hooks_only or clean_only):
+        from hatchling.utils.constants import MetadataEnvVars
+
+        # Share the resolved metadata with subsequent builds, as requested by the frontend
+        snapshot_path = os.environ.get(MetadataEnvVars.SNAPSHOT)
+        if snapshot_path:
+            from contextlib import suppress
+
+            with suppress(OSError, TypeError, ValueError):
+                metadata.create_snapshot(snapshot_path)
 
 
 def build_command(subparsers: argparse._SubParsersAction, defaults: Any) -> None:
@@ -48,15 +48,15 @@ def version_impl(
             app.display(version)
         return
 
+    if not desired_version:
+        app.display(metadata.hatch.version.cached)
+        return
+
     source = metadata.hatch.version.source
 
     version_data = source.get_version_data()
     original_version = version_data["version"]
 
-    if not desired_version:
-        app.display(original_version)
-        return
-
     updated_version = metadata.hatch.version.scheme.update(desired_version, original_version, version_data)
     source.set_version(updated_version, version_data)
 
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import os
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any
+
+from hatchling.utils.constants import DEFAULT_BUILD_SCRIPT, MetadataEnvVars
+
+if TYPE_CHECKING:
+    from hatchling.metadata.plugin.interface import MetadataHookInterface
+
+
+class MetadataHookCache:
+    """
+    The changes that a metadata hook made to the `project` table, persisted so that other processes may replay
+    them for as long as the metadata given to the hook and the inputs that it declared are unchanged.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str, key: str) -> None:
+        self.path = path
+        self.key = key
+
+    @classmethod
+    def from_environment(
+        cls, root: str, hook: MetadataHookInterface, metadata: dict[str, Any]
+    ) -> MetadataHookCache | None:
+        cache_dir = os.environ.get(MetadataEnvVars.HOOK_CACHE_DIR)
+        if not cache_dir:
+            return None
+
+        # Errors are deferred to the actual execution of the hook so that they are reported consistently
+        try:
+            input_files = hook.get_input_files()
+            if input_files is None:
+                return None
+
+            input_env_vars = hook.get_input_env_vars()
+        except Exception:  # noqa: BLE001
+            return None
+
+        import inspect
+        import json
+        from hashlib import sha256
+
+        from hatchling.__about__ import __version__
+        from hatchling.utils.fs import get_file_digest
+
+        # The implementation of the hook itself is an input
+        hook_files = [os.path.join(root, path) for path in input_files]
+        if hook.PLUGIN_NAME == "custom":
+            hook_files.append(os.path.join(root, hook.config.get("path", DEFAULT_BUILD_SCRIPT)))
+        else:
+            with suppress(OSError, TypeError):
+                hook_files.append(inspect.getfile(type(hook)))
+
+        file_digests = {}
+        for path in hook_files:
+            try:
+                file_digests[path] = get_file_digest(path)
+            except OSError:
+                file_digests[path] = None
+
+        try:
+            key_data = json.dumps(
+                [
+                    cls.VERSION,
+                    __version__,
+                    hook.PLUGIN_NAME,
+                    hook.config,
+                    metadata,
+                    file_digests,
+                    {env_var: os.environ.get(env_var) for env_var in input_env_vars},
+                ],
+                sort_keys=True,
+            )
+        except (TypeError, ValueError):
+            return None
+
+        key = sha256(key_data.encode("utf-8")).hexdigest()
+        hook_id = sha256(f"{os.path.normcase(os.path.realpath(root))}\0{hook.PLUGIN_NAME}".encode()).hexdigest()
+        return cls(os.path.join(cache_dir, f"{hook_id[:32]}.json"), key)
+
+    def get(self) -> dict[str, Any] | None:
+        import json
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or data.get("key") != self.key:
+            return None
+
+        changes = data.get("changes")
+        return changes if isinstance(changes, dict) else None
+
+    def set(self, changes: dict[str, Any]) -> None:
+        import json
+
+        from hatchling.utils.fs import write_file_atomic
+
+        try:
+            contents = json.dumps({"key": self.key, "changes": changes})
+        except (TypeError, ValueError):
+            return
+
+        write_file_atomic(self.path, contents)
+
+
+def update_metadata(hook: MetadataHookInterface, metadata: dict[str, Any]) -> None:
+    """
+    Let the hook update the metadata in-place, replaying its cached changes instead if possible.
+    """
+    cache = MetadataHookCache.from_environment(hook.root, hook, metadata)
+    if cache is None:
+        hook.update(metadata)
+        return
+
+    changes = cache.get()
+    if changes is not None:
+        apply_changes(metadata, changes)
+        return
+
+    from copy import deepcopy
+
+    original_metadata = deepcopy(metadata)
+    hook.update(metadata)
+    cache.set(get_changes(original_metadata, metadata))
+
+
+def get_changes(original_metadata: dict[str, Any], metadata: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "set": {key: value for key, value in metadata.items() if original_metadata.get(key, Ellipsis) != value},
+        "removed": [key for key in original_metadata if key not in metadata],
+    }
+
+
+def apply_changes(metadata: dict[str, Any], changes: dict[str, Any]) -> None:
+    from copy import deepcopy
+
+    metadata.update(deepcopy(changes["set"]))
+    for key in changes["removed"]:
+        metadata.pop(key, None)
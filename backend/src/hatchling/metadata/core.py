@@ -14,7 +14,7 @@ from hatchling.metadata.utils import (
     normalize_requirement,
 )
 from hatchling.plugin.manager import PluginManagerBound
-from hatchling.utils.constants import DEFAULT_CONFIG_FILE
+from hatchling.utils.constants import DEFAULT_CONFIG_FILE, MetadataEnvVars
 from hatchling.utils.fs import locate_file
 
 if TYPE_CHECKING:
@@ -180,6 +180,10 @@ class ProjectMetadata(Generic[PluginManagerBound]):
     @property
     def core(self) -> CoreMetadata:
         if self._core is None:
+            snapshot_path = os.environ.get(MetadataEnvVars.SNAPSHOT)
+            if snapshot_path and self.load_snapshot(snapshot_path):
+                return cast(CoreMetadata, self._core)
+
             metadata = CoreMetadata(self.root, self.core_raw_metadata, self.hatch.metadata, self.context)
 
             # Save the fields
@@ -193,8 +197,10 @@ class ProjectMetadata(Generic[PluginManagerBound]):
                     self.core_raw_metadata["version"] = self.version
 
                 if metadata.dynamic:
+                    from hatchling.metadata.cache import update_metadata
+
                     for metadata_hook in metadata_hooks.values():
-                        metadata_hook.update(self.core_raw_metadata)
+                        update_metadata(metadata_hook, self.core_raw_metadata)
                         metadata.add_known_classifiers(metadata_hook.get_known_classifiers())
 
                     new_fields = set(self.core_raw_metadata) - static_fields
@@ -212,6 +218,35 @@ class ProjectMetadata(Generic[PluginManagerBound]):
 
         return self._core
 
+    def load_snapshot(self, path: str) -> bool:
+        """
+        Restore fully resolved core metadata from a snapshot, bypassing validation and
+        metadata hooks, if the snapshot was created for this project and none of the files
+        that influenced it have changed. Returns whether the snapshot was used.
+        """
+        from hatchling.metadata.snapshot import MetadataSnapshot
+
+        snapshot = MetadataSnapshot.load(path)
+        if snapshot is None or not snapshot.matches(self.root):
+            return False
+
+        metadata = CoreMetadata(self.root, snapshot.data["config"], self.hatch.metadata, self.context)
+        snapshot.populate(metadata)
+
+        self._core_raw_metadata = metadata.config
+        self._dynamic = snapshot.data["dynamic"]
+        self._version = snapshot.data["version"]
+        self._core = metadata
+        return True
+
+    def create_snapshot(self, path: str) -> None:
+        """
+        Write the fully resolved core metadata to a snapshot that other processes may restore.
+        """
+        from hatchling.metadata.snapshot import MetadataSnapshot
+
+        MetadataSnapshot.from_metadata(self).save(path)
+
     @property
     def hatch(self) -> HatchMetadata:
         if self._hatch is None:
@@ -1527,12 +1562,23 @@ class HatchVersionConfig(Generic[PluginManagerBound]):
     @property
     def cached(self) -> str:
         if self._cached is None:
+            from hatchling.version.cache import VersionCache
+
+            cache = VersionCache.from_environment(self.root, self.source)
+            if cache is not None:
+                self._cached = cache.get()
+                if self._cached is not None:
+                    return self._cached
+
             try:
                 self._cached = self.source.get_version_data()["version"]
             except Exception as e:  # noqa: BLE001
                 message = f"Error getting the version from source `{self.source.PLUGIN_NAME}`: {e}"
                 raise type(e)(message) from None
 
+            if cache is not None and isinstance(self._cached, str):
+                cache.set(self._cached)
+
         return self._cached
 
     @property
@@ -59,6 +59,24 @@ class MetadataHookInterface(ABC):  # no cov
         This updates the metadata mapping of the `project` table in-place.
         """
 
+    def get_input_files(self) -> list[str] | None:  # noqa: PLR6301
+        """
+        This may return a list of paths relative to the [root](#root) of every file that influences the
+        changes made by [update](#update) other than the metadata it is given and its configuration. When the
+        `HATCH_METADATA_HOOK_CACHE_DIR` environment variable is set, the changes are cached and replayed by other
+        processes, without calling `update`, until any of those inputs change.
+
+        The default is `None`, which disables caching.
+        """
+        return None
+
+    def get_input_env_vars(self) -> list[str]:  # noqa: PLR6301
+        """
+        This returns the names of environment variables that influence the changes made by [update](#update)
+        and is only relevant if [input files](#get_input_files) are declared.
+        """
+        return []
+
     def get_known_classifiers(self) -> list[str]:  # noqa: PLR6301
         """
         This returns extra classifiers that should be considered valid in addition to the ones known to PyPI.
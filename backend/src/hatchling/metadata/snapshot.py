@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import json
+import os
+from typing import TYPE_CHECKING, Any
+
+from hatchling.utils.constants import DEFAULT_BUILD_SCRIPT, DEFAULT_CONFIG_FILE
+
+if TYPE_CHECKING:
+    from hatchling.metadata.core import CoreMetadata, ProjectMetadata
+
+# Bump whenever the layout changes so that snapshots written by other versions are ignored
+SNAPSHOT_VERSION = 1
+
+# The resolved value of each of these properties is stored and then restored
+# as the cached attribute of the same name prefixed by an underscore
+CORE_METADATA_FIELDS = (
+    "raw_name",
+    "name",
+    "version",
+    "description",
+    "readme",
+    "readme_content_type",
+    "readme_path",
+    "requires_python",
+    "license",
+    "license_expression",
+    "license_files",
+    "authors",
+    "authors_data",
+    "maintainers",
+    "maintainers_data",
+    "keywords",
+    "classifiers",
+    "urls",
+    "scripts",
+    "gui_scripts",
+    "entry_points",
+    "dependencies",
+    "optional_dependencies",
+    "dynamic",
+    "import_names",
+    "import_namespaces",
+)
+
+
+class MetadataSnapshot:
+    """
+    A serialized form of fully resolved and validated project metadata, including the effects of
+    metadata hooks, that may be loaded by another process without repeating any of that work.
+
+    Snapshots are only honored when every file that influenced the metadata is unchanged.
+    """
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self.data = data
+
+    @classmethod
+    def from_metadata(cls, metadata: ProjectMetadata) -> MetadataSnapshot:
+        from hatchling.__about__ import __version__
+
+        # Resolving the version first ensures it is no longer considered dynamic
+        _ = metadata.version
+        core = metadata.core
+
+        return cls({
+            "format": SNAPSHOT_VERSION,
+            "hatchling": __version__,
+            "root": normalize_root(metadata.root),
+            "sources": get_source_fingerprint(metadata.root, get_source_files(metadata)),
+            "dynamic": metadata.dynamic,
+            "version": metadata.version,
+            "config": core.config,
+            "core": {field: getattr(core, field) for field in CORE_METADATA_FIELDS},
+        })
+
+    @classmethod
+    def load(cls, path: str) -> MetadataSnapshot | None:
+        from hatchling.__about__ import __version__
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or data.get("format") != SNAPSHOT_VERSION or data.get("hatchling") != __version__:
+            return None
+
+        return cls(data)
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(self.data))
+
+    def matches(self, root: str) -> bool:
+        if self.data["root"] != normalize_root(root):
+            return False
+
+        sources: dict[str, list[int] | None] = self.data["sources"]
+        return get_source_fingerprint(root, sources) == sources
+
+    def populate(self, core: CoreMetadata) -> None:
+        from packaging.requirements import Requirement
+        from packaging.specifiers import SpecifierSet
+
+        for field, value in self.data["core"].items():
+            setattr(core, f"_{field}", value)
+
+        # Versions from a source are never cached by the core metadata itself
+        core._version_set = True  # noqa: SLF001
+
+        # The complex forms were already validated and normalized before being stored
+        core._python_constraint = SpecifierSet(core._requires_python)  # noqa: SLF001
+        core._dependencies_complex = {dependency: Requirement(dependency) for dependency in core._dependencies}  # noqa: SLF001
+        core._optional_dependencies_complex = {  # noqa: SLF001
+            option: {dependency: Requirement(dependency) for dependency in dependencies}
+            for option, dependencies in core._optional_dependencies.items()  # noqa: SLF001
+        }
+
+
+def get_source_files(metadata: ProjectMetadata) -> list[str]:
+    files = ["pyproject.toml", DEFAULT_CONFIG_FILE, "PKG-INFO"]
+
+    core = metadata.core
+    if core.readme_path:
+        files.append(core.readme_path)
+
+    files.extend(core.license_files)
+
+    if "version" in metadata.dynamic:
+        version_path = metadata.hatch.version.config.get("path")
+        if isinstance(version_path, str):
+            files.append(version_path)
+
+    for metadata_hook in metadata.hatch.metadata.hooks.values():
+        files.extend(metadata_hook.get_input_files() or [])
+
+    for hook_name, hook_config in metadata.hatch.metadata.hook_config.items():
+        if not isinstance(hook_config, dict):
+            continue
+
+        hook_path = hook_config.get("path", DEFAULT_BUILD_SCRIPT if hook_name == "custom" else None)
+        if isinstance(hook_path, str):
+            files.append(hook_path)
+
+    return sorted({os.path.normpath(path).replace("\\", "/") for path in files})
+
+
+def get_source_fingerprint(root: str, files: list[str] | dict[str, Any]) -> dict[str, list[int] | None]:
+    fingerprint: dict[str, list[int] | None] = {}
+    for relative_path in files:
+        try:
+            stat = os.stat(os.path.join(root, relative_path))
+        except OSError:
+            fingerprint[relative_path] = None
+        else:
+            fingerprint[relative_path] = [stat.st_size, stat.st_mtime_ns]
+
+    return fingerprint
+
+
+def normalize_root(root: str) -> str:
+    return os.path.normcase(os.path.realpath(root))
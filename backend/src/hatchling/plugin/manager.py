@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, TypeVar
+import os
+import sys
+from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, TypeVar
 
 import pluggy
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+ENTRY_POINT_GROUP = "hatch"
+
 
 class PluginManager:
     def __init__(self) -> None:
@@ -65,9 +69,13 @@ class ClassRegister:
         self.identifier = identifier
         self.third_party_plugins = third_party_plugins
 
+    @property
+    def hook_name(self) -> str:
+        return getattr(self.registration_method, "name", "")
+
     def collect(self, *, include_third_party: bool = True) -> dict:
         if include_third_party and not self.third_party_plugins.loaded:
-            self.third_party_plugins.load()
+            self.third_party_plugins.load_hook(self.hook_name)
 
         classes: dict[str, type] = {}
 
@@ -93,22 +101,224 @@ class ClassRegister:
         return classes
 
     def get(self, name: str) -> type | None:
-        if not self.third_party_plugins.loaded:
-            classes = self.collect(include_third_party=False)
-            if name in classes:
-                return classes[name]
+        classes = self.collect(include_third_party=False)
+        if name in classes or self.third_party_plugins.loaded:
+            return classes.get(name)
 
-        return self.collect().get(name)
+        self.third_party_plugins.load_hook(self.hook_name, name)
+        return self.collect(include_third_party=False).get(name)
 
 
 class ThirdPartyPlugins:
+    """
+    Third-party plugins are discovered through the `hatch` entry point group. Rather than importing every
+    plugin module up front, modules are imported only when a lookup requires one of the hooks they implement.
+
+    If the `HATCH_PLUGIN_CACHE_DIR` environment variable is set, an index of the discovered entry points and
+    the names of the plugins that each module registers is persisted in that directory, keyed by a fingerprint
+    of `sys.path`. Subsequent processes with the same fingerprint then skip scanning installed distributions
+    and import only the module that provides the requested plugin.
+    """
+
     def __init__(self, manager: pluggy.PluginManager) -> None:
         self.manager = manager
         self.loaded = False
 
+        self._index: EntryPointIndex | None = None
+        self._imported: set[str] = set()
+
+    @property
+    def index(self) -> EntryPointIndex:
+        if self._index is None:
+            self._index = EntryPointIndex.from_environment()
+
+        return self._index
+
     def load(self) -> None:
-        self.manager.load_setuptools_entrypoints("hatch")
+        for entry_point in self.index.entry_points:
+            self.import_entry_point(entry_point)
+
+        self.index.save()
         self.loaded = True
 
+    def load_hook(self, hook_name: str, plugin_name: str | None = None) -> None:
+        if self.loaded:
+            return
+
+        for entry_point in self.index.entry_points:
+            name = entry_point.name
+            if name in self._imported:
+                continue
+
+            registered = self.index.get_registered(name)
+            if registered is not None and (
+                hook_name not in registered or (plugin_name is not None and plugin_name not in registered[hook_name])
+            ):
+                continue
+
+            self.import_entry_point(entry_point)
+            if plugin_name is not None and plugin_name in self.index.get_registered(name, {}).get(hook_name, []):
+                break
+
+        self.index.save()
+
+    def import_entry_point(self, entry_point: EntryPoint) -> None:
+        name = entry_point.name
+        self._imported.add(name)
+        if self.manager.get_plugin(name) or self.manager.is_blocked(name):
+            return
+
+        plugin = entry_point.load()
+        self.manager.register(plugin, name=name)
+        registered = get_registered_plugin_names(plugin)
+        if registered is not None:
+            self.index.set_registered(name, registered)
+
+
+class EntryPoint(NamedTuple):
+    name: str
+    value: str
+
+    def load(self) -> Any:
+        from importlib.metadata import EntryPoint as _EntryPoint
+
+        return _EntryPoint(self.name, self.value, ENTRY_POINT_GROUP).load()
+
+
+class EntryPointIndex:
+    VERSION = 1
+
+    # Processes that share a `sys.path` fingerprint also share the index
+    _memory: ClassVar[dict[str, EntryPointIndex]] = {}
+
+    def __init__(self, fingerprint: str, entry_points: list[EntryPoint], registered: dict[str, dict[str, list[str]]]):
+        self.fingerprint = fingerprint
+        self.entry_points = entry_points
+        self.registered = registered
+
+        self._modified = False
+
+    def get_registered(self, entry_point_name: str, default: Any = None) -> Any:
+        return self.registered.get(entry_point_name, default)
+
+    def set_registered(self, entry_point_name: str, hooks: dict[str, list[str]]) -> None:
+        if self.registered.get(entry_point_name) != hooks:
+            self.registered[entry_point_name] = hooks
+            self._modified = True
+
+    @classmethod
+    def from_environment(cls) -> EntryPointIndex:
+        fingerprint = get_sys_path_fingerprint()
+        if fingerprint in cls._memory:
+            return cls._memory[fingerprint]
+
+        index = cls.from_cache(fingerprint)
+        if index is None:
+            from importlib.metadata import entry_points
+
+            index = cls(
+                fingerprint,
+                [EntryPoint(ep.name, ep.value) for ep in entry_points(group=ENTRY_POINT_GROUP)],
+                {},
+            )
+            index._modified = True
+
+        cls._memory[fingerprint] = index
+        return index
+
+    @classmethod
+    def from_cache(cls, fingerprint: str) -> EntryPointIndex | None:
+        cache_file = get_cache_file(fingerprint)
+        if cache_file is None or not os.path.isfile(cache_file):
+            return None
+
+        import json
+
+        try:
+            with open(cache_file, encoding="utf-8") as f:
+                data = json.load(f)
+
+            if data["version"] != cls.VERSION or data["fingerprint"] != fingerprint:
+                return None
+
+            return cls(
+                fingerprint, [EntryPoint(name, value) for name, value in data["entry_points"]], data["registered"]
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self) -> None:
+        if not self._modified:
+            return
+
+        self._modified = False
+        cache_file = get_cache_file(self.fingerprint)
+        if cache_file is None:
+            return
+
+        import json
+
+        from hatchling.utils.fs import write_file_atomic
+
+        data = {
+            "version": self.VERSION,
+            "fingerprint": self.fingerprint,
+            "entry_points": [list(entry_point) for entry_point in self.entry_points],
+            "registered": self.registered,
+        }
+        write_file_atomic(cache_file, json.dumps(data))
+
+
+def get_registered_plugin_names(plugin: Any, identifier: str = "PLUGIN_NAME") -> dict[str, list[str]] | None:
+    hooks: dict[str, list[str]] = {}
+    for attribute in dir(plugin):
+        if not attribute.startswith("hatch_register_"):
+            continue
+
+        hook = getattr(plugin, attribute)
+        if not callable(hook):  # no cov
+            continue
+
+        # Hooks for plugin types that are unavailable in this environment may fail, in which case the
+        # module is not indexed and will always be imported when needed
+        try:
+            raw_registered_classes = hook()
+        except Exception:  # noqa: BLE001
+            return None
+
+        registered_classes = (
+            raw_registered_classes if isinstance(raw_registered_classes, list) else [raw_registered_classes]
+        )
+        hooks[attribute] = [
+            name for registered_class in registered_classes if (name := getattr(registered_class, identifier, None))
+        ]
+
+    return hooks
+
+
+def get_sys_path_fingerprint() -> str:
+    from hashlib import sha256
+
+    hasher = sha256()
+    for entry in sys.path:
+        hasher.update(entry.encode("utf-8", "surrogateescape"))
+        try:
+            # Installing or removing a distribution modifies the directory containing its metadata
+            hasher.update(str(os.stat(entry or ".").st_mtime_ns).encode("ascii"))
+        except OSError:
+            hasher.update(b"-")
+
+    return hasher.hexdigest()
+
+
+def get_cache_file(fingerprint: str) -> str | None:
+    from hatchling.utils.constants import PluginEnvVars
+
+    cache_dir = os.environ.get(PluginEnvVars.CACHE_DIR)
+    if not cache_dir:
+        return None
+
+    return os.path.join(cache_dir, f"{fingerprint[:32]}.json")
+
 
 PluginManagerBound = TypeVar("PluginManagerBound", bound=PluginManager)
@@ -2,5 +2,15 @@ DEFAULT_BUILD_SCRIPT = "hatch_build.py"
 DEFAULT_CONFIG_FILE = "hatch.toml"
 
 
+class PluginEnvVars:
+    CACHE_DIR = "HATCH_PLUGIN_CACHE_DIR"
+
+
 class VersionEnvVars:
     VALIDATE_BUMP = "HATCH_VERSION_VALIDATE_BUMP"
+    CACHE_DIR = "HATCH_VERSION_CACHE_DIR"
+
+
+class MetadataEnvVars:
+    SNAPSHOT = "HATCH_METADATA_SNAPSHOT"
+    HOOK_CACHE_DIR = "HATCH_METADATA_HOOK_CACHE_DIR"
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from contextlib import suppress
 
 
 def locate_file(root: str, file_name: str, *, boundary: str | None = None) -> str | None:
@@ -24,3 +25,36 @@ def path_to_uri(path: str) -> str:
         return f"file://{os.path.abspath(path).replace(' ', '%20')}"
 
     return f"file:///{os.path.abspath(path).replace(' ', '%20').replace(os.sep, '/')}"
+
+
+def get_file_digest(path: str) -> str:
+    from hashlib import sha256
+
+    with open(path, "rb") as f:
+        return sha256(f.read()).hexdigest()
+
+
+def write_file_atomic(path: str, contents: str) -> bool:
+    """
+    Write the contents such that concurrent processes never observe a partially written file,
+    returning whether the write succeeded.
+    """
+    from tempfile import NamedTemporaryFile
+
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with NamedTemporaryFile("w", encoding="utf-8", dir=directory, suffix=".tmp", delete=False) as f:
+            f.write(contents)
+    except OSError:  # no cov
+        return False
+
+    try:
+        os.replace(f.name, path)
+    except OSError:  # no cov
+        with suppress(OSError):
+            os.remove(f.name)
+
+        return False
+
+    return True
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+from hatchling.utils.constants import VersionEnvVars
+
+if TYPE_CHECKING:
+    from hatchling.version.source.plugin.interface import VersionSourceInterface
+
+
+class VersionCache:
+    """
+    A version resolved by a version source, persisted so that other processes may reuse it for as long as
+    the inputs declared by the source are unchanged.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str, key: str) -> None:
+        self.path = path
+        self.key = key
+
+    @classmethod
+    def from_environment(cls, root: str, source: VersionSourceInterface) -> VersionCache | None:
+        cache_dir = os.environ.get(VersionEnvVars.CACHE_DIR)
+        if not cache_dir:
+            return None
+
+        # Errors are deferred to the actual resolution of the version so that they are reported consistently
+        try:
+            inputs = source.get_version_inputs()
+        except Exception:  # noqa: BLE001
+            return None
+
+        if inputs is None:
+            return None
+
+        import json
+        from hashlib import sha256
+
+        try:
+            key_data = json.dumps([cls.VERSION, source.PLUGIN_NAME, source.config, inputs], sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+
+        key = sha256(key_data.encode("utf-8")).hexdigest()
+        project_id = sha256(os.path.normcase(os.path.realpath(root)).encode("utf-8")).hexdigest()
+        return cls(os.path.join(cache_dir, f"{project_id[:32]}.json"), key)
+
+    def get(self) -> str | None:
+        import json
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or data.get("key") != self.key:
+            return None
+
+        version = data.get("version")
+        return version if isinstance(version, str) else None
+
+    def set(self, version: str) -> None:
+        import json
+
+        from hatchling.utils.fs import write_file_atomic
+
+        write_file_atomic(self.path, json.dumps({"key": self.key, "version": version}))
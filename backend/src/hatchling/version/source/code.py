@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import ast
 import os
+from typing import Any
 
 from hatchling.version.source.plugin.interface import VersionSourceInterface
 
@@ -44,6 +46,16 @@ class CodeSource(VersionSourceInterface):
 
             absolute_search_paths.append(os.path.normpath(os.path.join(self.root, search_path)))
 
+        static = self.config.get("static", False)
+        if not isinstance(static, bool):
+            message = "option `static` must be a boolean"
+            raise TypeError(message)
+
+        if static:
+            version = get_static_version(path, expression)
+            if version is not None:
+                return {"version": version}
+
         spec = spec_from_file_location(os.path.splitext(path)[0], path)
         module = module_from_spec(spec)  # type: ignore[arg-type]
 
@@ -62,3 +74,131 @@ class CodeSource(VersionSourceInterface):
     def set_version(self, version: str, version_data: dict) -> None:
         message = "Cannot rewrite loaded code"
         raise NotImplementedError(message)
+
+
+class StaticEvaluationError(Exception):
+    pass
+
+
+def get_static_version(path: str, expression: str) -> str | None:
+    """
+    Evaluate the expression against the simple assignments at the top level of the file without executing it,
+    returning `None` if that is not possible.
+    """
+    if not path.endswith(".py"):
+        return None
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            module = ast.parse(f.read(), filename=path)
+
+        namespace: dict[str, Any] = {}
+        for statement in module.body:
+            try:
+                evaluate_static_statement(statement, namespace)
+            except StaticEvaluationError:
+                forget_assigned_names(statement, namespace)
+
+        version = evaluate_static_node(ast.parse(expression, mode="eval").body, namespace)
+    except (OSError, SyntaxError, ValueError, StaticEvaluationError):
+        return None
+
+    return version if isinstance(version, str) else None
+
+
+def evaluate_static_statement(statement: ast.stmt, namespace: dict[str, Any]) -> None:
+    if isinstance(statement, ast.Assign):
+        value = evaluate_static_node(statement.value, namespace)
+        for target in statement.targets:
+            assign_static_target(target, value, namespace)
+    elif isinstance(statement, ast.AnnAssign):
+        if statement.value is not None:
+            assign_static_target(statement.target, evaluate_static_node(statement.value, namespace), namespace)
+    elif isinstance(statement, ast.AugAssign) and isinstance(statement.op, ast.Add):
+        value = evaluate_static_node(
+            ast.BinOp(left=statement.target, op=statement.op, right=statement.value), namespace
+        )
+        assign_static_target(statement.target, value, namespace)
+    else:
+        # Names bound by anything else, including conditionally, cannot be known statically
+        raise StaticEvaluationError
+
+
+def evaluate_static_node(node: ast.AST, namespace: dict[str, Any]) -> Any:
+    if isinstance(node, ast.Constant):
+        return node.value
+
+    if isinstance(node, ast.Name):
+        if node.id not in namespace:
+            raise StaticEvaluationError
+
+        return namespace[node.id]
+
+    if isinstance(node, ast.Tuple):
+        return tuple(evaluate_static_node(element, namespace) for element in node.elts)
+
+    if isinstance(node, ast.List):
+        return [evaluate_static_node(element, namespace) for element in node.elts]
+
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        left = evaluate_static_node(node.left, namespace)
+        right = evaluate_static_node(node.right, namespace)
+        if not (isinstance(left, str) and isinstance(right, str)):
+            raise StaticEvaluationError
+
+        return left + right
+
+    if isinstance(node, ast.JoinedStr):
+        parts = []
+        for value in node.values:
+            if isinstance(value, ast.FormattedValue):
+                if value.conversion != -1 or value.format_spec is not None:
+                    raise StaticEvaluationError
+
+                part = evaluate_static_node(value.value, namespace)
+                if not isinstance(part, (str, int)) or isinstance(part, bool):
+                    raise StaticEvaluationError
+
+                parts.append(str(part))
+            else:
+                parts.append(evaluate_static_node(value, namespace))
+
+        return "".join(parts)
+
+    if isinstance(node, ast.Subscript):
+        container = evaluate_static_node(node.value, namespace)
+        index = evaluate_static_node(node.slice, namespace)
+        if not isinstance(container, (tuple, list)) or not isinstance(index, int):
+            raise StaticEvaluationError
+
+        try:
+            return container[index]
+        except IndexError:
+            raise StaticEvaluationError from None
+
+    raise StaticEvaluationError
+
+
+def assign_static_target(target: ast.AST, value: Any, namespace: dict[str, Any]) -> None:
+    if isinstance(target, ast.Name):
+        namespace[target.id] = value
+    else:
+        for node in ast.walk(target):
+            if isinstance(node, ast.Name):
+                namespace.pop(node.id, None)
+
+
+def forget_assigned_names(statement: ast.stmt, namespace: dict[str, Any]) -> None:
+    for node in ast.walk(statement):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, (ast.Store, ast.Del)):
+            namespace.pop(node.id, None)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                # Wildcard imports may rebind any name
+                if alias.name == "*":
+                    namespace.clear()
+                    return
+
+                namespace.pop((alias.asname or alias.name).split(".")[0], None)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            namespace.pop(node.name, None)
@@ -62,6 +62,17 @@ class VersionSourceInterface(ABC):  # no cov
         when updating the version.
         """
 
+    def get_version_inputs(self) -> list[str] | None:  # noqa: PLR6301
+        """
+        This may return a list of strings that, along with the [configuration](#config), fully determine the
+        version, such as the digest of a file or the commit of the repository's `HEAD` and whether the working
+        tree is dirty. When the `HATCH_VERSION_CACHE_DIR` environment variable is set, the resolved version is
+        cached and reused by other processes until the inputs change.
+
+        The default is `None`, which disables caching.
+        """
+        return None
+
     def set_version(self, version: str, version_data: dict) -> None:
         """
         This should update the version to the first argument with the data provided during retrieval.
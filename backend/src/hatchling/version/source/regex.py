@@ -25,5 +25,16 @@ class RegexSource(VersionSourceInterface):
 
         return {"version": version, "version_file": version_file}
 
+    def get_version_inputs(self) -> list[str] | None:
+        import os
+
+        from hatchling.utils.fs import get_file_digest
+
+        relative_path = self.config.get("path", "")
+        if not relative_path or not isinstance(relative_path, str):
+            return None
+
+        return [get_file_digest(os.path.join(self.root, relative_path))]
+
     def set_version(self, version: str, version_data: dict) -> None:  # noqa: PLR6301
         version_data["version_file"].set_version(version)
@@ -0,0 +1,465 @@
+"""
+Offline benchmarks for Hatchling builders and the Hatch environment lifecycle, run against synthetic
+projects so that no network access is required.
+
+Run the benchmarks, optionally against another checkout of the repository:
+
+    python scripts/benchmark.py run --size small --output head.json
+    python scripts/benchmark.py run --size small --source ../base --output base.json
+
+Compare two sets of results:
+
+    python scripts/benchmark.py compare base.json head.json --output benchmark-report.md
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+RESULTS_VERSION = 1
+
+# The number of files in generated projects and the scale of every other synthetic input
+SIZES = {
+    "small": {"files": 1_000, "dependencies": 100, "distributions": 100, "matrix": (3, 5, 5)},
+    "medium": {"files": 50_000, "dependencies": 1_000, "distributions": 1_000, "matrix": (5, 10, 10)},
+    "large": {"files": 200_000, "dependencies": 5_000, "distributions": 5_000, "matrix": (5, 20, 20)},
+}
+
+PROJECT_NAME = "bench-project"
+PACKAGE_NAME = "bench_project"
+FILES_PER_DIRECTORY = 100
+DEEP_TREE_DEPTH = 20
+FORCE_INCLUDES = 200
+INCLUDE_PATTERNS = 50
+EXCLUDE_PATTERNS = 200
+
+
+def write_pyproject(root: Path, tool_config: str = "") -> None:
+    (root / "pyproject.toml").write_text(
+        f"""\
+[build-system]
+requires = ["hatchling"]
+build-backend = "hatchling.build"
+
+[project]
+name = "{PROJECT_NAME}"
+version = "0.0.1"
+{tool_config}""",
+        encoding="utf-8",
+    )
+
+
+def write_files(directory: Path, count: int, suffixes: tuple[str, ...] = (".py",)) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    for i in range(count):
+        (directory / f"module_{i}{suffixes[i % len(suffixes)]}").write_text(f"value = {i}\n", encoding="utf-8")
+
+
+def generate_packages(root: Path, files: int, suffixes: tuple[str, ...] = (".py",)) -> None:
+    package = root / PACKAGE_NAME
+    package.mkdir(parents=True)
+    (package / "__init__.py").touch()
+
+    remaining = files - 1
+    for i in range(0, remaining, FILES_PER_DIRECTORY):
+        subpackage = package / f"sub_{i // FILES_PER_DIRECTORY}"
+        write_files(subpackage, min(FILES_PER_DIRECTORY, remaining - i), suffixes)
+        (subpackage / "__init__.py").touch()
+
+
+def generate_flat_project(root: Path, files: int) -> None:
+    write_pyproject(root)
+    generate_packages(root, files)
+
+
+def generate_deep_project(root: Path, files: int) -> None:
+    write_pyproject(root)
+
+    # Several chains of deeply nested packages with files evenly distributed among their levels
+    package = root / PACKAGE_NAME
+    package.mkdir(parents=True)
+    (package / "__init__.py").touch()
+
+    levels = (files - 1) // FILES_PER_DIRECTORY + 1
+    for chain in range(levels // DEEP_TREE_DEPTH + 1):
+        directory = package / f"chain_{chain}"
+        for _ in range(min(DEEP_TREE_DEPTH, levels - chain * DEEP_TREE_DEPTH)):
+            write_files(directory, FILES_PER_DIRECTORY)
+            (directory / "__init__.py").touch()
+            directory /= "nested"
+
+
+def generate_patterns_project(root: Path, files: int) -> None:
+    include = [f'"{PACKAGE_NAME}/sub_{i}/**/*.py"' for i in range(INCLUDE_PATTERNS)]
+    include.append(f'"{PACKAGE_NAME}/**/*.pyi"')
+    exclude = [f'"{PACKAGE_NAME}/sub_{i}/module_{i}*.py"' for i in range(EXCLUDE_PATTERNS)]
+    exclude.append('"*.txt"')
+    write_pyproject(
+        root,
+        f"""
+[tool.hatch.build]
+include = [{", ".join(include)}]
+exclude = [{", ".join(exclude)}]
+""",
+    )
+    generate_packages(root, files, (".py", ".pyi", ".txt"))
+
+
+def generate_force_include_project(root: Path, files: int) -> None:
+    force_include = [f'"extra/file_{i}.txt" = "{PACKAGE_NAME}/data/file_{i}.txt"' for i in range(FORCE_INCLUDES)]
+    force_include.append(f'"extra/tree" = "{PACKAGE_NAME}/data/tree"')
+    write_pyproject(root, "\n".join(["", "[tool.hatch.build.force-include]", *force_include, ""]))
+    generate_packages(root, files - FORCE_INCLUDES)
+
+    extra = root / "extra"
+    extra.mkdir()
+    for i in range(FORCE_INCLUDES):
+        (extra / f"file_{i}.txt").write_text(str(i), encoding="utf-8")
+
+    write_files(extra / "tree", FILES_PER_DIRECTORY)
+
+
+def generate_metadata_project(root: Path, dependencies: int) -> None:
+    groups = max(dependencies // 10, 1)
+    dependency_list = [f"dependency-{i}>={i % 10}.0; python_version >= '3.8'" for i in range(dependencies)]
+    optional_dependencies = {
+        f"extra-{i}": [f"optional-{i}-{j}[feature]~=1.{j}" for j in range(5)] for i in range(groups)
+    }
+    classifiers = [
+        "Development Status :: 5 - Production/Stable",
+        "Operating System :: OS Independent",
+        *(f"Programming Language :: Python :: 3.{minor}" for minor in range(10, 15)),
+        "Programming Language :: Python :: Implementation :: CPython",
+        "Programming Language :: Python :: Implementation :: PyPy",
+    ]
+
+    # JSON arrays and strings are valid TOML
+    lines = [
+        "[project]",
+        f'name = "{PROJECT_NAME}"',
+        'version = "0.0.1"',
+        'description = "Synthetic project used for benchmarks"',
+        'requires-python = ">=3.10"',
+        f"keywords = {json.dumps([f'keyword-{i}' for i in range(groups)])}",
+        f"classifiers = {json.dumps(classifiers)}",
+        f"dependencies = {json.dumps(dependency_list)}",
+        "",
+        "[project.optional-dependencies]",
+        *(f"{name} = {json.dumps(group)}" for name, group in optional_dependencies.items()),
+        "",
+        "[project.urls]",
+        *(f'"Link {i}" = "https://example.com/{i}"' for i in range(groups)),
+        "",
+        "[project.scripts]",
+        *(f'command-{i} = "{PACKAGE_NAME}.cli:main_{i}"' for i in range(groups)),
+    ]
+    (root / "pyproject.toml").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def generate_site_packages(root: Path, distributions: int) -> list[str]:
+    """
+    Fabricate installed distributions and return requirements that are all satisfied by them.
+    """
+    site_packages = root / "site-packages"
+    requirements = []
+    for i in range(distributions):
+        name = f"distribution_{i}"
+        version = f"{i % 10}.{i % 7}.{i % 3}"
+        dist_info = site_packages / f"{name}-{version}.dist-info"
+        dist_info.mkdir(parents=True)
+
+        metadata = [f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n"]
+        if i % 2:
+            metadata.extend(("Provides-Extra: feature\n", f"Requires-Dist: distribution-{i - 1}; extra == 'feature'\n"))
+        (dist_info / "METADATA").write_text("".join(metadata), encoding="utf-8")
+        (dist_info / "RECORD").touch()
+        (dist_info / "INSTALLER").write_text("uv\n", encoding="utf-8")
+
+        extra = "[feature]" if i % 2 else ""
+        requirements.append(f"Distribution.{i}{extra}>={i % 10}.0")
+
+    return requirements
+
+
+def matrix_config(python_versions: int, variants: int, features: int) -> dict:
+    return {
+        "envs": {
+            "default": {"dependencies": ["pytest"]},
+            "test": {
+                "dependencies": ["pytest", "coverage"],
+                "matrix": [
+                    {
+                        "python": [f"3.{10 + i}" for i in range(python_versions)],
+                        "variant": [f"variant-{i}" for i in range(variants)],
+                        "feature": [f"feature-{i}" for i in range(features)],
+                    }
+                ],
+                "overrides": {
+                    "matrix": {
+                        "variant": {
+                            "dependencies": [
+                                {"value": f"variant-dependency-{i}", "if": [f"variant-{i}"]} for i in range(variants)
+                            ],
+                        },
+                        "feature": {
+                            "env-vars": [
+                                {"key": "FEATURE", "value": f"{i}", "if": [f"feature-{i}"]} for i in range(features)
+                            ],
+                        },
+                    }
+                },
+                "scripts": {"run": "pytest {args}"},
+            },
+        }
+    }
+
+
+class Benchmarks:
+    def __init__(self, work_dir: Path, size: str) -> None:
+        self.work_dir = work_dir
+        self.size = size
+        self.scale = SIZES[size]
+
+    def project(self, name: str, generator, *args) -> Path:
+        root = self.work_dir / name
+        if not root.is_dir():
+            root.mkdir()
+            generator(root, *args)
+
+        return root
+
+    def cases(self):
+        """
+        Yield the name of each benchmark along with a function that prepares a single run and returns
+        the callable to measure.
+        """
+        from hatchling.builders.sdist import SdistBuilder
+        from hatchling.builders.wheel import WheelBuilder
+
+        files = self.scale["files"]
+        layouts = {
+            "flat": self.project("flat", generate_flat_project, files),
+            "deep": self.project("deep", generate_deep_project, files),
+            "patterns": self.project("patterns", generate_patterns_project, files),
+            "force-include": self.project("force-include", generate_force_include_project, files),
+        }
+        for layout, root in layouts.items():
+            yield f"recurse_included_files[{layout}]", self.recurse_included_files(WheelBuilder, root)
+            yield f"recurse_included_files[{layout}, sdist]", self.recurse_included_files(SdistBuilder, root)
+
+        for builder_class in (WheelBuilder, SdistBuilder):
+            yield f"build[{builder_class.PLUGIN_NAME}]", self.build(builder_class, layouts["flat"])
+
+        dependencies = self.scale["dependencies"]
+        yield "metadata", self.metadata(self.project("metadata", generate_metadata_project, dependencies))
+
+        python_versions, variants, features = self.scale["matrix"]
+        yield "envs[matrix]", self.envs(matrix_config(python_versions, variants, features))
+
+        requirements = generate_site_packages(self.work_dir, self.scale["distributions"])
+        yield "installed_distributions", self.installed_distributions(self.work_dir / "site-packages", requirements)
+
+    @staticmethod
+    def recurse_included_files(builder_class, root: Path):
+        def prepare():
+            builder = builder_class(str(root))
+            return lambda: sum(1 for _ in builder.recurse_included_files())
+
+        return prepare
+
+    def build(self, builder_class, root: Path):
+        output_dir = self.work_dir / "dist"
+
+        def prepare():
+            shutil.rmtree(output_dir, ignore_errors=True)
+            builder = builder_class(str(root))
+            return lambda: list(builder.build(directory=str(output_dir), versions=["standard"]))
+
+        return prepare
+
+    @staticmethod
+    def metadata(root: Path):
+        from hatchling.metadata.core import ProjectMetadata
+        from hatchling.plugin.manager import PluginManager
+
+        plugin_manager = PluginManager()
+
+        def prepare():
+            metadata = ProjectMetadata(str(root), plugin_manager)
+
+            def run():
+                metadata.validate_fields()
+                return metadata.core.dependencies_complex, metadata.core.optional_dependencies_complex
+
+            return run
+
+        return prepare
+
+    def envs(self, config: dict):
+        from hatch.plugin.manager import PluginManager
+        from hatch.project.config import ProjectConfig
+
+        plugin_manager = PluginManager()
+
+        def prepare():
+            project_config = ProjectConfig(str(self.work_dir), config, plugin_manager)
+            return lambda: project_config.envs
+
+        return prepare
+
+    @staticmethod
+    def installed_distributions(site_packages: Path, requirements: list[str]):
+        from hatch.dep.core import Dependency
+        from hatch.dep.sync import InstalledDistributions
+
+        dependencies = [Dependency(requirement) for requirement in requirements]
+
+        def prepare():
+            distributions = InstalledDistributions(sys_path=[str(site_packages)])
+
+            def run():
+                if not distributions.dependencies_in_sync(dependencies):
+                    message = "Fabricated distributions are not in sync"
+                    raise RuntimeError(message)
+
+            return run
+
+        return prepare
+
+
+def measure(prepare, repeat: int) -> list[float]:
+    # The first run warms up caches of the file system and imports and is not recorded
+    prepare()()
+
+    timings = []
+    for _ in range(repeat):
+        run = prepare()
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+
+    return timings
+
+
+def run_benchmarks(args: argparse.Namespace) -> None:
+    if args.source:
+        source = Path(args.source).resolve()
+        sys.path[:0] = [str(source / "src"), str(source / "backend" / "src")]
+
+    results = {
+        "version": RESULTS_VERSION,
+        "size": args.size,
+        "repeat": args.repeat,
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+        },
+        "benchmarks": {},
+    }
+    with tempfile.TemporaryDirectory() as d:
+        benchmarks = Benchmarks(Path(d), args.size)
+        for name, prepare in benchmarks.cases():
+            if args.keyword and not any(keyword in name for keyword in args.keyword):
+                continue
+
+            timings = measure(prepare, args.repeat)
+            results["benchmarks"][name] = {
+                "min": min(timings),
+                "median": statistics.median(timings),
+                "runs": timings,
+            }
+            print(f"{name:<45} {statistics.median(timings):10.4f}s", file=sys.stderr)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(output, encoding="utf-8")
+    else:
+        print(output)
+
+
+def compare_results(args: argparse.Namespace) -> None:
+    base = json.loads(Path(args.base).read_text(encoding="utf-8"))
+    head = json.loads(Path(args.head).read_text(encoding="utf-8"))
+
+    lines = [
+        "## Benchmarks\n",
+        "\n",
+        f"Size `{head['size']}`, median of {head['repeat']} runs, "
+        f"threshold {args.threshold:.0%}, Python {head['environment']['python']}\n",
+        "\n",
+        "Benchmark | Base | Head | Change\n",
+        "--- | --- | --- | ---\n",
+    ]
+    regressions = []
+    for name, data in head["benchmarks"].items():
+        if name not in base["benchmarks"]:
+            lines.append(f"{name} | | {data['median']:.4f}s | new\n")
+            continue
+
+        base_median = base["benchmarks"][name]["median"]
+        change = data["median"] / base_median - 1 if base_median else 0
+        status = ""
+        if change > args.threshold:
+            status = " :warning:"
+            regressions.append(name)
+        elif change < -args.threshold:
+            status = " :rocket:"
+
+        lines.append(f"{name} | {base_median:.4f}s | {data['median']:.4f}s | {change:+.1%}{status}\n")
+
+    lines.append("\n")
+    if regressions:
+        plural = "s" if len(regressions) > 1 else ""
+        lines.append(f"**{len(regressions)} regression{plural}**: {', '.join(regressions)}\n")
+    else:
+        lines.append("No regressions\n")
+
+    report = "".join(lines)
+    if args.output:
+        Path(args.output).write_text(report, encoding="utf-8")
+    else:
+        print(report)
+
+    if regressions and args.fail:
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmarks")
+    run_parser.add_argument("--size", choices=list(SIZES), default="small")
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--source", help="The root of a checkout of the repository to benchmark instead")
+    run_parser.add_argument("-k", "--keyword", action="append", help="Only run benchmarks containing this text")
+    run_parser.add_argument("--output", help="The file in which to write results, defaulting to stdout")
+    run_parser.set_defaults(func=run_benchmarks)
+
+    compare_parser = subparsers.add_parser("compare", help="Compare two sets of results")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("head")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+    compare_parser.add_argument("--output", help="The file in which to write a Markdown report, defaulting to stdout")
+    compare_parser.add_argument("--fail", action="store_true", help="Exit with an error if there are regressions")
+    compare_parser.set_defaults(func=compare_results)
+
+    args = parser.parse_args()
+    os.environ.setdefault("SOURCE_DATE_EPOCH", "1580601600")
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
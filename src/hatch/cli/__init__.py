@@ -92,6 +92,27 @@ from hatch.utils.fs import Path
     envvar=ConfigEnvVars.CONFIG,
     help="The path to a custom config file to use [env var: `HATCH_CONFIG`]",
 )
+@click.option(
+    "--timings",
+    is_flag=True,
+    help="Display how long each phase of the command took once it finishes",
+)
+@click.option(
+    "--trace",
+    "trace_file",
+    envvar=AppEnvVars.TRACE,
+    help="The path to a file in which to record the timing of each phase of the command [env var: `HATCH_TRACE`]",
+)
+@click.option(
+    "--trace-format",
+    envvar=AppEnvVars.TRACE_FORMAT,
+    type=click.Choice(["chrome", "json"]),
+    default="chrome",
+    help=(
+        "The format of the trace file, either the Chrome Trace Event Format or a JSON tree of spans "
+        "[env var: `HATCH_TRACE_FORMAT`]"
+    ),
+)
 @click.version_option(version=__version__, prog_name="Hatch")
 @click.pass_context
 def hatch(
@@ -105,6 +126,9 @@ def hatch(
     data_dir,
     cache_dir,
     config_file,
+    timings,
+    trace_file,
+    trace_format,
 ):
     """
     \b
@@ -159,8 +183,17 @@ def hatch(
     # Persist app data for sub-commands
     ctx.obj = app
 
+    if timings or trace_file:
+        app.tracer.enabled = True
+        if trace_file:
+            # Resolve now because the working directory may change while running the command
+            trace_file = str(Path(trace_file).expand().resolve())
+
+        ctx.call_on_close(lambda: app.report_timings(display=timings, trace_file=trace_file, trace_format=trace_format))
+
     try:
-        app.config_file.load()
+        with app.tracer.span("Load configuration"):
+            app.config_file.load()
     except OSError as e:  # no cov
         app.abort(f"Error loading configuration: {e}")
 
@@ -12,6 +12,7 @@ from hatch.project.core import Project
 from hatch.utils.fs import Path
 from hatch.utils.platform import Platform
 from hatch.utils.runner import ExecutionContext
+from hatch.utils.trace import Tracer
 
 if TYPE_CHECKING:
     from collections.abc import Generator
@@ -37,6 +38,9 @@ class Application(Terminal):
         self.env = cast(str, None)
         self.env_active = cast(str, None)
 
+        # Timings are only recorded when requested
+        self.tracer = Tracer()
+
     @property
     def plugins(self):
         return self.project.plugin_manager
@@ -45,6 +49,33 @@ class Application(Terminal):
     def config(self) -> RootConfig:
         return self.config_file.model
 
+    def report_timings(self, *, display: bool, trace_file: str | None, trace_format: str) -> None:
+        if trace_file:
+            import json
+
+            data = self.tracer.to_chrome_trace() if trace_format == "chrome" else self.tracer.to_json()
+            path = Path(trace_file).expand()
+            path.ensure_parent_dir_exists()
+            path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+        if not display:
+            return
+
+        total = self.tracer.elapsed
+        columns: dict[str, dict[int, str]] = {"Span": {}, "Duration": {}, "Total %": {}}
+        for i, span in enumerate(self.tracer.spans):
+            columns["Span"][i] = f"{'  ' * span.depth}{span.name}"
+            columns["Duration"][i] = f"{span.duration:.3f}s"
+            columns["Total %"][i] = f"{span.duration / total:.1%}" if total else ""
+
+        self.display_table(
+            f"Timings ({total:.3f}s)",
+            columns,
+            column_options={"Duration": {"justify": "right"}, "Total %": {"justify": "right"}},
+            num_rows=len(self.tracer.spans),
+            stderr=True,
+        )
+
     def get_environment(self, env_name: str | None = None) -> EnvironmentInterface:
         return self.project.get_environment(env_name)
 
@@ -82,7 +113,8 @@ class Application(Terminal):
                 original_sigint = signal.getsignal(signal.SIGINT)
                 try:
                     signal.signal(signal.SIGINT, lambda *_: None)
-                    process = context.env.run_shell_command(command)
+                    with self.tracer.span(f"Run command: {command}", source=context.source):
+                        process = context.env.run_shell_command(command)
                 finally:
                     # Restore the original handler in finally so the parent stays
                     # responsive to Ctrl-C even if the child raises or is cancelled.
@@ -121,7 +153,8 @@ class Application(Terminal):
                 environment = self.get_environment(env_name)
                 if not environment.exists():
                     try:
-                        environment.check_compatibility()
+                        with self.tracer.span(f"Check compatibility: {environment.name}"):
+                            environment.check_compatibility()
                     except Exception as e:  # noqa: BLE001
                         if ignore_compat:
                             incompatible[environment.name] = str(e)
@@ -213,10 +246,11 @@ class Application(Terminal):
         from hatch.python.core import PythonManager
 
         configured_dir = directory or self.config.dirs.python
+        cache_dir = self.cache_dir / "python"
         if configured_dir == "isolated":
-            return PythonManager(self.data_dir / "pythons")
+            return PythonManager(self.data_dir / "pythons", cache_dir=cache_dir)
 
-        return PythonManager(Path(configured_dir).expand())
+        return PythonManager(Path(configured_dir).expand(), cache_dir=cache_dir)
 
     @cached_property
     def shell_data(self) -> tuple[str, str]:
@@ -58,16 +58,34 @@ if TYPE_CHECKING:
         "[env var: `HATCH_BUILD_CLEAN_HOOKS_AFTER`]"
     ),
 )
+@click.option(
+    "--profile",
+    is_flag=True,
+    help=(
+        "Whether or not to display the time spent in each phase of building every artifact, also recorded next to "
+        "each artifact as JSON. This is only supported by Hatchling [env var: `HATCH_BUILD_PROFILE`]"
+    ),
+)
 @click.option("--clean-only", is_flag=True, hidden=True)
 @click.pass_obj
 def build(
-    app: Application, location, targets, build_all, hooks_only, no_hooks, ext, clean, clean_hooks_after, clean_only
+    app: Application,
+    location,
+    targets,
+    build_all,
+    hooks_only,
+    no_hooks,
+    ext,
+    clean,
+    clean_hooks_after,
+    profile,
+    clean_only,
 ):
     """Build a project."""
     app.ensure_environment_plugin_dependencies()
 
     from hatch.config.constants import AppEnvVars
-    from hatch.project.constants import DEFAULT_BUILD_DIRECTORY
+    from hatch.project.constants import DEFAULT_BUILD_DIRECTORY, BuildEnvVars
     from hatch.utils.fs import Path
 
     if ext:
@@ -82,6 +100,9 @@ def build(
     elif app.quiet:
         env_vars[AppEnvVars.QUIET] = str(abs(app.verbosity))
 
+    if profile:
+        env_vars[BuildEnvVars.PROFILE] = "true"
+
     if not build_all:
         _build_project(
             app,
@@ -145,7 +166,7 @@ def _build_project(
     env_vars,
 ):
     from hatch.project.config import env_var_enabled
-    from hatch.project.constants import BUILD_BACKEND, DEFAULT_BUILD_DIRECTORY, BuildEnvVars
+    from hatch.project.constants import BUILD_BACKEND, DEFAULT_BUILD_DIRECTORY, BuildEnvVars, MetadataEnvVars
     from hatch.utils.fs import Path
     from hatch.utils.runner import ExecutionContext
     from hatch.utils.structures import EnvVars
@@ -156,7 +177,17 @@ def _build_project(
         project.prepare_build_environment(targets=[target.split(":")[0] for target in targets])
 
     build_backend = project.metadata.build.build_backend
-    with project.location.as_cwd(), project.build_env.get_env_vars():
+    with (
+        project.location.as_cwd(),
+        project.build_env.get_env_vars(),
+        project.build_env.fs_context() as fs_context,
+    ):
+        # The backend reuses resolved metadata from a snapshot, which is seeded by the inspection of
+        # build dependencies if possible and otherwise written by the build of the first target
+        metadata_snapshot = project.build_frontend.hatch.write_metadata_snapshot(fs_context) or (
+            fs_context.join("metadata-snapshot.json").env_path
+        )
+
         for target in targets:
             target_name, _, _ = target.partition(":")
             if not clean_only:
@@ -205,4 +236,5 @@ def _build_project(
                 context = ExecutionContext(project.build_env)
                 context.add_shell_command(command)
                 context.env_vars.update(env_vars)
+                context.env_vars[MetadataEnvVars.SNAPSHOT] = metadata_snapshot
                 app.execute_context(context)
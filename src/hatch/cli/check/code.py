@@ -4,6 +4,8 @@ from typing import TYPE_CHECKING
 
 import click
 
+from hatch.cli.fmt.core import changed_files_click_options
+
 if TYPE_CHECKING:
     from hatch.cli.application import Application
 
@@ -12,6 +14,7 @@ if TYPE_CHECKING:
 @click.argument("args", nargs=-1)
 @click.option("--fix", is_flag=True, help="Fix lint errors rather than just reporting them")
 @click.option("--sync", is_flag=True, help="Sync the default config file with the current version of Hatch")
+@changed_files_click_options
 @click.pass_obj
 def code(
     app: Application,
@@ -19,11 +22,13 @@ def code(
     args: tuple[str, ...],
     fix: bool,
     sync: bool,
+    changed: bool,
+    since: str | None,
 ):
     """
     Perform static analysis, using Ruff by default.
     """
-    from hatch.cli.fmt.core import StaticAnalysisEnvironment
+    from hatch.cli.fmt.core import StaticAnalysisEnvironment, get_changed_files_args
 
     app.ensure_environment_plugin_dependencies()
 
@@ -57,6 +62,11 @@ def code(
         if internal_args:
             internal_args = f" {internal_args}"
 
+        if (changed_files_args := get_changed_files_args(app, changed=changed, since=since)) is None:
+            return
+
+        arguments.extend(changed_files_args)
+
         formatted_args = context.env.join_command_args(arguments)
         context.add_shell_command(f"{script} {formatted_args}")
 
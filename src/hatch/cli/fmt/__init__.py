@@ -4,6 +4,8 @@ from typing import TYPE_CHECKING
 
 import click
 
+from hatch.cli.fmt.core import changed_files_click_options
+
 if TYPE_CHECKING:
     from hatch.cli.application import Application
 
@@ -14,6 +16,7 @@ if TYPE_CHECKING:
 @click.option("--linter", "-l", is_flag=True, help="Only run the linter")
 @click.option("--formatter", "-f", is_flag=True, help="Only run the formatter")
 @click.option("--sync", is_flag=True, help="Sync the default config file with the current version of Hatch")
+@changed_files_click_options
 @click.pass_obj
 def fmt(
     app: Application,
@@ -23,6 +26,8 @@ def fmt(
     linter: bool,
     formatter: bool,
     sync: bool,
+    changed: bool,
+    since: str | None,
 ):
     """Format and lint source code."""
     app.display_warning(
@@ -33,7 +38,7 @@ def fmt(
     if linter and formatter:
         app.abort("Cannot specify both --linter and --formatter")
 
-    from hatch.cli.fmt.core import StaticAnalysisEnvironment
+    from hatch.cli.fmt.core import StaticAnalysisEnvironment, get_changed_files_args
 
     app.ensure_environment_plugin_dependencies()
 
@@ -73,6 +78,11 @@ def fmt(
             # Add an extra space if required
             internal_args = f" {internal_args}"
 
+        if (changed_files_args := get_changed_files_args(app, changed=changed, since=since)) is None:
+            return
+
+        arguments.extend(changed_files_args)
+
         formatted_args = context.env.join_command_args(arguments)
         for script in scripts:
             context.add_shell_command(f"{script} {formatted_args}")
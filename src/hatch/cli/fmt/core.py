@@ -3,9 +3,69 @@ from __future__ import annotations
 from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
+import click
+
 if TYPE_CHECKING:
+    from hatch.cli.application import Application
     from hatch.env.plugin.interface import EnvironmentInterface
     from hatch.utils.fs import Path
+    from hatch.utils.platform import Platform
+
+
+def content_changed(path: Path, contents: str) -> bool:
+    try:
+        return path.read_text(encoding="utf-8") != contents
+    except (OSError, UnicodeDecodeError):
+        return True
+
+
+def get_changed_source_files(platform: Platform, base: str) -> list[str]:
+    """
+    Return the existing files that Ruff checks by default which differ from the given Git reference
+    or are untracked.
+    """
+    import os
+
+    from hatch.utils.git import get_changed_files
+
+    return [
+        path
+        for path in get_changed_files(platform, base)
+        if os.path.splitext(path)[1] in SOURCE_FILE_EXTENSIONS and os.path.isfile(path)
+    ]
+
+
+def changed_files_click_options(fn):
+    """Options shared by the static analysis commands to only process changed files."""
+    decorators = [
+        click.option(
+            "--changed",
+            is_flag=True,
+            help="Only process files changed since the last commit, including untracked files",
+        ),
+        click.option(
+            "--since", help="The Git reference to compare with, implicitly enabling --changed (default: HEAD)"
+        ),
+    ]
+    for d in reversed(decorators):
+        fn = d(fn)
+    return fn
+
+
+def get_changed_files_args(app: Application, *, changed: bool, since: str | None) -> list[str] | None:
+    """
+    Return the arguments that restrict Ruff to changed files if requested, or `None` if no files changed.
+    """
+    if not changed and since is None:
+        return []
+
+    changed_files = get_changed_source_files(app.platform, since or "HEAD")
+    if not changed_files:
+        app.display_info("No changed files to process")
+        return None
+
+    # Ruff would otherwise process explicitly passed files even if they are excluded by its configuration
+    return ["--force-exclude", *changed_files]
 
 
 class StaticAnalysisEnvironment:
@@ -31,6 +91,20 @@ class StaticAnalysisEnvironment:
         return self.env.isolated_data_directory / ".config" / self.env.root.id / "ruff_defaults.toml"
 
     def construct_config_file(self, *, preview: bool) -> str:
+        from hatch._version import __version__
+        from hatch.utils.cache import KeyedCache, compute_key, file_digest
+
+        # The rules depend on the version of Hatch while everything else comes from project and user config
+        cache = KeyedCache(self.env.app.cache_dir / "static-analysis" / self.env.root.id / "ruff_defaults.json")
+        cache_key = compute_key(
+            __version__,
+            preview,
+            file_digest(self.env.root / "pyproject.toml"),
+            file_digest(self.user_config_file),
+        )
+        return cache.get_or_create(cache_key, lambda: self._generate_config_file(preview=preview))
+
+    def _generate_config_file(self, *, preview: bool) -> str:
         lines = [
             "line-length = 120",
             "",
@@ -80,11 +154,17 @@ class StaticAnalysisEnvironment:
     def write_config_file(self, *, preview: bool) -> None:
         config_contents = self.construct_config_file(preview=preview)
         if self.config_path:
-            (self.env.root / self.config_path).write_atomic(config_contents, "w", encoding="utf-8")
+            config_file = self.env.root / self.config_path
+            if not content_changed(config_file, config_contents):
+                return
+
+            config_file.write_atomic(config_contents, "w", encoding="utf-8")
             return
 
-        self.internal_config_file.parent.ensure_dir_exists()
-        self.internal_config_file.write_text(config_contents)
+        # Leave unchanged files untouched so that their modification times remain stable across runs
+        if content_changed(self.internal_config_file, config_contents):
+            self.internal_config_file.parent.ensure_dir_exists()
+            self.internal_config_file.write_text(config_contents)
 
         # TODO: remove everything below once this is fixed https://github.com/astral-sh/ruff/issues/8737
         if self.internal_user_config_file is None:
@@ -121,7 +201,8 @@ class StaticAnalysisEnvironment:
         else:
             contents = old_contents
 
-        self.internal_user_config_file.write_text(contents)
+        if content_changed(self.internal_user_config_file, contents):
+            self.internal_user_config_file.write_text(contents)
 
     @cached_property
     def internal_user_config_file(self) -> Path | None:
@@ -166,6 +247,9 @@ class StaticAnalysisEnvironment:
         return self.user_config.get(section, {})
 
 
+# https://docs.astral.sh/ruff/configuration/#default-inclusions
+SOURCE_FILE_EXTENSIONS: tuple[str, ...] = (".py", ".pyi", ".ipynb")
+
 STABLE_RULES: tuple[str, ...] = (
     "A001",
     "A002",
@@ -7,6 +7,8 @@ import click
 if TYPE_CHECKING:
     from hatch.cli.application import Application
 
+MAX_CONCURRENT_INSTALLATIONS = 4
+
 
 def ensure_path_public(path: str, shells: list[str]) -> bool:
     import userpath
@@ -40,6 +42,10 @@ def install(app: Application, *, names: tuple[str, ...], private: bool, update:
     You can set custom sources for distributions by setting the `HATCH_PYTHON_SOURCE_<NAME>` environment variable
     where `<NAME>` is the uppercased version of the distribution name with periods replaced by underscores e.g.
     `HATCH_PYTHON_SOURCE_PYPY3_10`.
+
+    Archives are kept in the cache directory, allowing interrupted downloads to be resumed and distributions to be
+    reinstalled without network access. Only the archive of the most recently downloaded release of each
+    distribution is kept.
     """
     from hatch.errors import PythonDistributionResolutionError, PythonDistributionUnknownError
     from hatch.python.distributions import ORDERED_DISTRIBUTIONS
@@ -75,7 +81,7 @@ def install(app: Application, *, names: tuple[str, ...], private: bool, update:
     elif incompatible and (not compatible or "all" not in names):
         app.abort(f"Incompatible distributions: {', '.join(incompatible)}")
 
-    directories_made_public = []
+    pending = []
     for name in compatible:
         needs_update = False
         if name in installed:
@@ -88,14 +94,26 @@ def install(app: Application, *, names: tuple[str, ...], private: bool, update:
             if not (update or app.confirm(f"Update {name}?")):
                 app.abort(f"Distribution is already installed: {name}")
 
-        with app.status(f"{'Updating' if needs_update else 'Installing'} {name}"):
-            dist = manager.install(name)
-            if not private:
-                python_directory = str(dist.python_path.parent)
-                if not ensure_path_public(python_directory, shells=shells):
-                    directories_made_public.append(python_directory)
+        pending.append((name, needs_update))
 
-        app.display_success(f"{'Updated' if needs_update else 'Installed'} {name} @ {dist.path}")
+    if not pending:
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    directories_made_public = []
+    # Distributions are downloaded and unpacked concurrently but reported in the order they were selected
+    with ThreadPoolExecutor(max_workers=min(len(pending), MAX_CONCURRENT_INSTALLATIONS)) as executor:
+        futures = {name: executor.submit(manager.install, name) for name, _ in pending}
+        for name, needs_update in pending:
+            with app.status(f"{'Updating' if needs_update else 'Installing'} {name}"):
+                dist = futures[name].result()
+                if not private:
+                    python_directory = str(dist.python_path.parent)
+                    if not ensure_path_public(python_directory, shells=shells):
+                        directories_made_public.append(python_directory)
+
+            app.display_success(f"{'Updated' if needs_update else 'Installed'} {name} @ {dist.path}")
 
     if directories_made_public:
         multiple = len(directories_made_public) > 1
@@ -294,7 +294,9 @@ class Terminal:
     def display_pair(self, key, value):
         self.output(self.style_success(key), self.kv_separator, value)
 
-    def display_table(self, title, columns, *, show_lines=False, column_options=None, force_ascii=False, num_rows=0):
+    def display_table(
+        self, title, columns, *, show_lines=False, column_options=None, force_ascii=False, num_rows=0, stderr=False
+    ):
         from rich.table import Table
 
         if column_options is None:
@@ -324,7 +326,7 @@ class Terminal:
             if any(row):
                 table.add_row(*row)
 
-        self.output(table)
+        self.output(table, stderr=stderr)
 
     @cached_property
     def status(self) -> BorrowedStatus:
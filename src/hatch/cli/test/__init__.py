@@ -7,6 +7,10 @@ import click
 if TYPE_CHECKING:
     from hatch.cli.application import Application
     from hatch.env.plugin.interface import EnvironmentInterface
+    from hatch.utils.runner import ExecutionContext
+
+# The variables used to load the plugin that records test durations
+PLUGIN_ENV_VARS = frozenset({"PYTEST_PLUGINS", "PYTHONPATH"})
 
 
 @click.command(short_help="Run tests", context_settings={"ignore_unknown_options": True})
@@ -27,11 +31,33 @@ if TYPE_CHECKING:
     type=click.Path(),
     help="Path for the XML coverage report file",
 )
+@click.option(
+    "--cover-json",
+    is_flag=True,
+    help="Generate JSON coverage report after tests, implicitly enabling --cover",
+)
+@click.option(
+    "--cover-json-output",
+    type=click.Path(),
+    help="Path for the JSON coverage report file",
+)
 @click.option("--all", "-a", "test_all", is_flag=True, help="Test all environments in the matrix")
 @click.option("--python", "-py", help="The Python versions to test, equivalent to: -i py=...")
 @click.option("--include", "-i", "included_variable_specs", multiple=True, help="The matrix variables to include")
 @click.option("--exclude", "-x", "excluded_variable_specs", multiple=True, help="The matrix variables to exclude")
 @click.option("--show", "-s", is_flag=True, help="Show information about environments in the matrix")
+@click.option(
+    "--shards",
+    type=click.IntRange(min=1),
+    help="Split test files of the selected environments into this many shards, see --shard-index",
+)
+@click.option("--shard-index", type=click.IntRange(min=0), help="The zero-based index of the shard to run")
+@click.option(
+    "--changed",
+    is_flag=True,
+    help="Only run tests that executed files changed since the last commit, based on previous coverage data",
+)
+@click.option("--since", help="The Git reference to compare with, implicitly enabling --changed (default: HEAD)")
 @click.pass_context
 def test(
     ctx: click.Context,
@@ -45,11 +71,17 @@ def test(
     cover_quiet: bool,
     cover_xml: bool,
     cover_xml_output: str | None,
+    cover_json: bool,
+    cover_json_output: str | None,
     test_all: bool,
     python: str | None,
     included_variable_specs: tuple[str, ...],
     excluded_variable_specs: tuple[str, ...],
     show: bool,
+    shards: int | None,
+    shard_index: int | None,
+    changed: bool,
+    since: str | None,
 ):
     """Run tests using the `hatch-test` environment matrix.
 
@@ -84,6 +116,28 @@ def test(
         union i.e. an environment must match all of the included variables to be selected while matching
         any of the excluded variables will prevent selection.
 
+    The `--shards` and `--shard-index` options split the test files of every selected environment
+    into balanced groups and only run one of them, such that parallel CI jobs may each run a part of
+    the matrix. For example, four jobs could each run one of:
+
+    \b
+    ```
+    hatch test --all --shards 4 --shard-index 0
+    hatch test --all --shards 4 --shard-index 1
+    hatch test --all --shards 4 --shard-index 2
+    hatch test --all --shards 4 --shard-index 3
+    ```
+
+    Test durations are recorded for every run and are used to balance shards, so every job must have
+    access to the same recorded durations in the data directory to compute the same assignment.
+    Unless tests are randomized, recorded durations are also used to run the slowest test modules
+    first, which reduces the time spent waiting on the last worker when using `-p`/`--parallel`.
+
+    The `--changed` option only runs tests that executed files which changed since the reference set
+    by the `--since` option, or since the last commit by default. Changed test files are always run.
+    Which tests executed which files is recorded every time tests are run with the `-c`/`--cover`
+    option, so a project must be tested with coverage at least once before using this option.
+
     The test environment comes with default dependencies (pytest, coverage, etc.). Use the
     `-s`/`--show` option to see the full resolved configuration for each environment.
     To customize dependencies or other settings, see the testing configuration docs:
@@ -108,12 +162,19 @@ def test(
     if cover_quiet:
         cover = True
 
-    if cover_xml:
+    if cover_xml or cover_json:
         cover = True
 
+    import os
     import sys
 
-    from hatch.cli.test.core import PatchedCoverageConfig
+    from hatch.cli.test.core import (
+        CoverageContextIndex,
+        PatchedCoverageConfig,
+        RecordedDurations,
+        split_test_arguments,
+        uses_default_combine,
+    )
     from hatch.utils.runner import parse_matrix_variables, select_environments
 
     if python is not None:
@@ -135,6 +196,18 @@ def test(
     if retries is None and retry_delay is not None:
         app.abort("The --retry-delay option requires the --retries option to be set as well.")
 
+    if (shards is None) != (shard_index is None):
+        app.abort("The --shards and --shard-index options must be used together.")
+
+    if shards is not None and shard_index is not None and shard_index >= shards:
+        app.abort(f"The --shard-index option must be less than --shards: {shard_index} >= {shards}")
+
+    if since is not None:
+        changed = True
+
+    if changed and shards is not None:
+        app.abort("The --changed option cannot be used with the --shards option.")
+
     app.ensure_environment_plugin_dependencies()
 
     test_envs = app.project.config.internal_matrices["hatch-test"]["envs"]
@@ -174,61 +247,177 @@ def test(
             else:
                 app.abort(f"No compatible environments found: {candidate_envs}")
 
+    recorded_durations = RecordedDurations(app.project.location, app.data_dir / "test")
+    shard_assignment: dict[str, list[str]] | None = None
+    if shards is not None and shard_index is not None:
+        from hatch.cli.test.core import collect_test_files, partition_test_files
+
+        env_test_files: dict[str, list[str]] = {}
+        with app.project.ensure_cwd():
+            for env_name in selected_envs:
+                default_args = app.project.get_environment(env_name).config.get("default-args", ["tests"])
+                _, test_paths = split_test_arguments(list(args) if args else default_args)
+                if test_files := collect_test_files(test_paths):
+                    env_test_files[env_name] = test_files
+
+        if not env_test_files:
+            app.abort("No test files found to split into shards.")
+
+        env_durations = {env_name: recorded_durations.get(env_name) for env_name in env_test_files}
+        shard_assignment = partition_test_files(env_test_files, env_durations, shards)[shard_index]
+        if not shard_assignment:
+            app.display_info(f"No tests assigned to shard {shard_index} of {shards}")
+            return
+
+        selected_envs = list(shard_assignment)
+
+    coverage_contexts = CoverageContextIndex(app.project.location, app.data_dir / "test")
+    changed_selection: dict[str, list[str]] | None = None
+    if changed:
+        from hatch.cli.test.core import collect_test_files
+        from hatch.utils.git import get_changed_files
+
+        if not coverage_contexts.exists():
+            app.display_warning("No coverage data has been recorded yet, running all tests")
+        else:
+            changed_selection = {}
+            with app.project.ensure_cwd():
+                changed_files = get_changed_files(app.platform, since or "HEAD")
+                affected_tests = coverage_contexts.select_tests(changed_files)
+                for env_name in selected_envs:
+                    default_args = app.project.get_environment(env_name).config.get("default-args", ["tests"])
+                    _, test_paths = split_test_arguments(list(args) if args else default_args)
+                    test_files = collect_test_files(test_paths)
+
+                    # Changed test files run entirely while other tests are selected individually
+                    changed_test_files = set(test_files).intersection(changed_files)
+                    selected_tests = [test_file for test_file in test_files if test_file in changed_test_files]
+                    for test in affected_tests:
+                        test_file = test.split("::", 1)[0]
+                        if test_file in test_files and test_file not in changed_test_files:
+                            selected_tests.append(test)
+
+                    if selected_tests:
+                        changed_selection[env_name] = selected_tests
+
+            if not changed_selection:
+                app.display_info("No tests are affected by the changed files")
+                return
+
+            selected_envs = [env_name for env_name in selected_envs if env_name in changed_selection]
+
     test_script = "run-cov" if cover else "run"
     patched_coverage = PatchedCoverageConfig(app.project.location, app.data_dir / ".config")
     coverage_config_file = str(patched_coverage.internal_config_path)
     if cover:
         patched_coverage.write_config_file()
+        patched_coverage.erase_data()
 
-        for context in app.runner_context([selected_envs[0]]):
-            context.add_shell_command("coverage erase")
-            context.env_vars["COVERAGE_RCFILE"] = coverage_config_file
-
-    for context in app.runner_context(selected_envs, ignore_compat=multiple_possible, display_header=multiple_possible):
-        internal_arguments: list[str] = list(context.env.config.get("extra-args", []))
+    recorded_durations.write_plugin()
+    plugin_name = recorded_durations.PLUGIN_NAME
+    plugin_dir = str(recorded_durations.plugin_dir)
+    ran_envs: list[str] = []
+    deferred_combine = False
+    try:
+        for context in app.runner_context(
+            selected_envs, ignore_compat=multiple_possible, display_header=multiple_possible
+        ):
+            ran_envs.append(context.env.name)
+            internal_arguments: list[str] = list(context.env.config.get("extra-args", []))
 
-        if not context.env.config.get("randomize", randomize):
-            internal_arguments.extend(["-p", "no:randomly"])
+            randomized = context.env.config.get("randomize", randomize)
+            if not randomized:
+                internal_arguments.extend(["-p", "no:randomly"])
 
-        if context.env.config.get("parallel", parallel):
-            internal_arguments.extend(["-n", "logical"])
+            if context.env.config.get("parallel", parallel):
+                internal_arguments.extend(["-n", "logical"])
 
-        if (num_retries := context.env.config.get("retries", retries)) is not None:
-            if "-r" not in args:
-                internal_arguments.extend(["-r", "aR"])
+            if (num_retries := context.env.config.get("retries", retries)) is not None:
+                if "-r" not in args:
+                    internal_arguments.extend(["-r", "aR"])
 
-            internal_arguments.extend(["--reruns", str(num_retries)])
+                internal_arguments.extend(["--reruns", str(num_retries)])
 
-        if (seconds_delay := context.env.config.get("retry-delay", retry_delay)) is not None:
-            internal_arguments.extend(["--reruns-delay", str(seconds_delay)])
+            if (seconds_delay := context.env.config.get("retry-delay", retry_delay)) is not None:
+                internal_arguments.extend(["--reruns-delay", str(seconds_delay)])
 
-        internal_args = context.env.join_command_args(internal_arguments)
-        if internal_args:
-            # Add an extra space if required
-            internal_args = f" {internal_args}"
+            internal_args = context.env.join_command_args(internal_arguments)
+            if internal_args:
+                # Add an extra space if required
+                internal_args = f" {internal_args}"
 
-        arguments: list[str] = []
-        if args:
-            arguments.extend(args)
-        else:
-            arguments.extend(context.env.config.get("default-args", ["tests"]))
-
-        context.add_shell_command([test_script, *arguments])
-        context.env_vars["HATCH_TEST_ARGS"] = internal_args
-        if cover:
-            context.env_vars["COVERAGE_RCFILE"] = coverage_config_file
-            context.env_vars["COVERAGE_PROCESS_START"] = coverage_config_file
+            arguments: list[str] = []
+            if args:
+                arguments.extend(args)
+            else:
+                arguments.extend(context.env.config.get("default-args", ["tests"]))
+
+            if shard_assignment is not None:
+                arguments, _ = split_test_arguments(arguments)
+                arguments.extend(shard_assignment[context.env.name])
+            elif changed_selection is not None:
+                arguments, _ = split_test_arguments(arguments)
+                arguments.extend(changed_selection[context.env.name])
+
+            context.add_shell_command([test_script, *arguments])
+            context.env_vars["HATCH_TEST_ARGS"] = internal_args
+
+            # Combine the data of each environment as soon as it finishes, unless combining was customized
+            if cover:
+                if uses_default_combine(context.env):
+                    context.add_shell_command("coverage combine --append")
+                else:
+                    deferred_combine = True
+
+            # Variables that the environment defines take precedence over those of the execution context so the
+            # plugin cannot be loaded, and durations are not recorded, if the environment sets them itself
+            if PLUGIN_ENV_VARS.isdisjoint(context.env.env_vars):
+                report_path = recorded_durations.report_path(context.env.name)
+                report_path.unlink(missing_ok=True)
+                context.env_vars["HATCH_TEST_DURATIONS_REPORT"] = str(report_path)
+                if not randomized:
+                    context.env_vars["HATCH_TEST_DURATIONS"] = str(recorded_durations.durations_file(context.env.name))
+
+                load_plugin(context, plugin_dir, plugin_name)
+
+            if cover:
+                context.env_vars["COVERAGE_RCFILE"] = coverage_config_file
+                context.env_vars["COVERAGE_PROCESS_START"] = coverage_config_file
+                context.env_vars["HATCH_TEST_COVERAGE_CONTEXT"] = "true"
+    finally:
+        for env_name in ran_envs:
+            recorded_durations.record(env_name)
 
     if cover:
-        for context in app.runner_context([selected_envs[0]]):
-            context.add_shell_command("cov-combine")
+        # Run every remaining coverage command in a single preparation of the environment
+        coverage_commands: list[str] = []
+        if deferred_combine:
+            coverage_commands.append("cov-combine")
 
         if not cover_quiet:
-            for context in app.runner_context([selected_envs[0]]):
-                context.add_shell_command("cov-report")
+            coverage_commands.append("cov-report")
 
         if cover_xml:
-            xml_command = f"coverage xml -o {cover_xml_output}" if cover_xml_output else "coverage xml"
+            coverage_commands.append(f"coverage xml -o {cover_xml_output}" if cover_xml_output else "coverage xml")
+
+        if cover_json:
+            coverage_commands.append(f"coverage json -o {cover_json_output}" if cover_json_output else "coverage json")
 
+        if coverage_commands:
             for context in app.runner_context([selected_envs[0]]):
-                context.add_shell_command(xml_command)
+                for command in coverage_commands:
+                    context.add_shell_command(command)
+
+        coverage_contexts.update(patched_coverage.data_file)
+
+
+def load_plugin(context: ExecutionContext, plugin_dir: str, plugin_name: str) -> None:
+    """
+    Make pytest load the plugin from the directory in addition to any plugins that are already configured.
+    """
+    import os
+
+    python_path = os.environ.get("PYTHONPATH")
+    context.env_vars["PYTHONPATH"] = os.pathsep.join(filter(None, (plugin_dir, python_path)))
+    pytest_plugins = os.environ.get("PYTEST_PLUGINS")
+    context.env_vars["PYTEST_PLUGINS"] = ",".join(filter(None, (pytest_plugins, plugin_name)))
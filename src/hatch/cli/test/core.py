@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import os
 from functools import cached_property
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from configparser import ConfigParser
 
+    from hatch.env.plugin.interface import EnvironmentInterface
     from hatch.utils.fs import Path
 
 
@@ -27,6 +29,32 @@ class PatchedCoverageConfig:
     def internal_config_path(self) -> Path:
         return self.data_dir / "coverage" / self.project_root.id / self.user_config_path.name
 
+    @cached_property
+    def data_file(self) -> Path:
+        data_file = ".coverage"
+        if self.user_config_path.is_file():
+            if self.user_config_path.name == ".coveragerc":
+                from configparser import ConfigParser
+
+                cfg = ConfigParser()
+                cfg.read(str(self.user_config_path))
+                data_file = cfg.get("run", "data_file", fallback=data_file)
+            else:
+                from hatch.utils.toml import load_toml_data
+
+                project_data = load_toml_data(self.user_config_path.read_text())
+                data_file = project_data.get("tool", {}).get("coverage", {}).get("run", {}).get("data_file", data_file)
+
+        return self.project_root / data_file
+
+    def erase_data(self) -> None:
+        # Equivalent to `coverage erase` without having to prepare an environment
+        self.data_file.unlink(missing_ok=True)
+        if self.data_file.parent.is_dir():
+            for parallel_data_file in self.data_file.parent.glob(f"{self.data_file.name}.*"):
+                if parallel_data_file.is_file():
+                    parallel_data_file.unlink()
+
     def write_config_file(self) -> None:
         self.internal_config_path.parent.ensure_dir_exists()
         if self.internal_config_path.name == ".coveragerc":
@@ -54,3 +82,331 @@ class PatchedCoverageConfig:
     def _write_ini(self, cfg: ConfigParser) -> None:
         with self.internal_config_path.open("w", encoding="utf-8") as f:
             cfg.write(f)
+
+
+class RecordedDurations:
+    """
+    Per-test durations of previous runs, keyed by environment name. A pytest plugin loaded in the
+    test environments writes the durations of each run which are then merged into the stored ones.
+    """
+
+    PLUGIN_NAME = "hatch_test_durations"
+
+    def __init__(self, project_root: Path, data_dir: Path) -> None:
+        self.project_root = project_root
+        self.data_dir = data_dir
+
+    @cached_property
+    def storage_dir(self) -> Path:
+        return self.data_dir / self.project_root.id
+
+    @cached_property
+    def plugin_dir(self) -> Path:
+        return self.data_dir / ".plugins"
+
+    def durations_file(self, env_name: str) -> Path:
+        return self.storage_dir / "durations" / f"{env_name}.json"
+
+    def report_path(self, env_name: str) -> Path:
+        return self.storage_dir / "reports" / f"{env_name}.json"
+
+    def get(self, env_name: str) -> dict[str, float]:
+        return self._load(self.durations_file(env_name))
+
+    def write_plugin(self) -> None:
+        from importlib.resources import files
+
+        plugin_file = self.plugin_dir / f"{self.PLUGIN_NAME}.py"
+        plugin = (files("hatch.cli.test.scripts") / plugin_file.name).read_text(encoding="utf-8")
+        if plugin_file.is_file() and plugin_file.read_text(encoding="utf-8") == plugin:
+            return
+
+        self.plugin_dir.ensure_dir_exists()
+        plugin_file.write_text(plugin, encoding="utf-8")
+
+    def record(self, env_name: str) -> None:
+        report_path = self.report_path(env_name)
+        new_durations = self._load(report_path)
+        report_path.unlink(missing_ok=True)
+        if not new_durations:
+            return
+
+        durations = self.get(env_name)
+        durations.update(new_durations)
+
+        # Forget about tests in modules that no longer exist
+        existing_files: dict[str, bool] = {}
+        for node_id in list(durations):
+            file_path = node_id.split("::", 1)[0]
+            if file_path not in existing_files:
+                existing_files[file_path] = self.project_root.joinpath(file_path).is_file()
+
+            if not existing_files[file_path]:
+                del durations[node_id]
+
+        import json
+
+        durations_file = self.durations_file(env_name)
+        durations_file.parent.ensure_dir_exists()
+        durations_file.write_text(json.dumps(durations, indent=2, sort_keys=True))
+
+    @staticmethod
+    def _load(path: Path) -> dict[str, float]:
+        if not path.is_file():
+            return {}
+
+        import json
+
+        try:
+            return json.loads(path.read_text())
+        except ValueError:
+            return {}
+
+
+class CoverageContextIndex:
+    """
+    A mapping of project files to the tests that executed them, derived from coverage data that
+    was measured with a dynamic context per test. Only tests that are part of new coverage data
+    are updated so that partial runs refine rather than replace the index.
+    """
+
+    def __init__(self, project_root: Path, data_dir: Path) -> None:
+        self.project_root = project_root
+        self.data_dir = data_dir
+
+    @cached_property
+    def index_file(self) -> Path:
+        return self.data_dir / self.project_root.id / "coverage-contexts.json"
+
+    def exists(self) -> bool:
+        return self.index_file.is_file()
+
+    def get(self) -> dict[str, list[str]]:
+        if not self.index_file.is_file():
+            return {}
+
+        import json
+
+        try:
+            return json.loads(self.index_file.read_text())
+        except ValueError:
+            return {}
+
+    def update(self, coverage_data_file: Path) -> None:
+        if not coverage_data_file.is_file():
+            return
+
+        file_contexts = read_coverage_contexts(coverage_data_file)
+        measured_tests = {context for contexts in file_contexts.values() for context in contexts}
+        if not measured_tests:
+            return
+
+        index: dict[str, set[str]] = {}
+        for file_path, tests in self.get().items():
+            if remaining_tests := set(tests).difference(measured_tests):
+                index[file_path] = remaining_tests
+
+        for measured_path, contexts in file_contexts.items():
+            # Relative paths are relative to the project root while absolute paths are kept as is
+            absolute_path = os.path.join(self.project_root, measured_path)
+            relative_path = os.path.relpath(absolute_path, self.project_root)
+            if relative_path.startswith(os.pardir):
+                continue
+
+            index.setdefault(relative_path.replace("\\", "/"), set()).update(contexts)
+
+        import json
+
+        self.index_file.parent.ensure_dir_exists()
+        self.index_file.write_text(
+            json.dumps({file_path: sorted(tests) for file_path, tests in sorted(index.items())}, indent=2)
+        )
+
+    def select_tests(self, changed_files: list[str]) -> list[str]:
+        index = self.get()
+        tests: dict[str, None] = {}
+        for changed_file in changed_files:
+            for test in index.get(changed_file, []):
+                tests[test] = None
+
+        return sorted(tests)
+
+
+def read_coverage_contexts(coverage_data_file: Path) -> dict[str, set[str]]:
+    """
+    Read the non-empty contexts that measured each file directly from the SQLite database that
+    coverage.py uses as its data file, avoiding a dependency on coverage itself.
+    """
+    import sqlite3
+
+    query = """
+    SELECT file.path, context.context FROM line_bits
+    JOIN file ON file.id = line_bits.file_id JOIN context ON context.id = line_bits.context_id
+    UNION
+    SELECT file.path, context.context FROM arc
+    JOIN file ON file.id = arc.file_id JOIN context ON context.id = arc.context_id
+    """
+
+    file_contexts: dict[str, set[str]] = {}
+    connection = sqlite3.connect(f"{coverage_data_file.as_uri()}?mode=ro", uri=True)
+    try:
+        for file_path, context in connection.execute(query):
+            if context:
+                file_contexts.setdefault(file_path, set()).add(context)
+    except sqlite3.DatabaseError:
+        return {}
+    finally:
+        connection.close()
+
+    return file_contexts
+
+
+def uses_default_combine(environment: EnvironmentInterface) -> bool:
+    from hatch.env.internal.test import get_default_config
+
+    return environment.scripts.get("cov-combine") == [get_default_config()["scripts"]["cov-combine"]]
+
+
+# Options of pytest and commonly used plugins that take a value as the next argument
+PYTEST_OPTIONS_WITH_VALUES = frozenset({
+    "-c",
+    "-k",
+    "-m",
+    "-n",
+    "-o",
+    "-p",
+    "-r",
+    "-W",
+    "--basetemp",
+    "--capture",
+    "--config-file",
+    "--confcutdir",
+    "--cov",
+    "--cov-config",
+    "--cov-fail-under",
+    "--cov-report",
+    "--deselect",
+    "--dist",
+    "--doctest-glob",
+    "--durations",
+    "--durations-min",
+    "--ignore",
+    "--ignore-glob",
+    "--import-mode",
+    "--junit-prefix",
+    "--junit-xml",
+    "--junitxml",
+    "--log-cli-level",
+    "--log-file",
+    "--log-file-level",
+    "--log-level",
+    "--maxfail",
+    "--numprocesses",
+    "--override-ini",
+    "--pythonwarnings",
+    "--randomly-seed",
+    "--reruns",
+    "--rootdir",
+    "--tb",
+    "--timeout",
+})
+
+
+def split_test_arguments(arguments: list[str]) -> tuple[list[str], list[str]]:
+    """
+    Separate the arguments that select test files or directories from all other arguments. Values of
+    options, like `--rootdir tests`, are kept with their option even if they refer to existing paths.
+    """
+    from hatch.utils.fs import Path
+
+    options: list[str] = []
+    test_paths: list[str] = []
+    expecting_value = False
+    for argument in arguments:
+        if expecting_value or argument.startswith("-"):
+            options.append(argument)
+            expecting_value = not expecting_value and argument in PYTEST_OPTIONS_WITH_VALUES
+            continue
+
+        path = Path(argument.split("::", 1)[0])
+        if path.is_dir() or (path.suffix == ".py" and path.is_file()):
+            test_paths.append(argument)
+        else:
+            options.append(argument)
+
+    return options, test_paths
+
+
+def collect_test_files(test_paths: list[str]) -> list[str]:
+    """
+    Expand directories into the test modules that pytest discovers by default.
+    """
+    from hatch.utils.fs import Path
+
+    test_files: dict[str, None] = {}
+    for test_path in test_paths:
+        path = Path(test_path.split("::", 1)[0])
+        if not path.is_dir():
+            test_files[test_path.replace("\\", "/")] = None
+            continue
+
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if not d.startswith(".") and d != "__pycache__")
+            for file_name in sorted(files):
+                if file_name.endswith(".py") and (file_name.startswith("test_") or file_name.endswith("_test.py")):
+                    test_files[os.path.join(root, file_name).replace("\\", "/")] = None
+
+    return list(test_files)
+
+
+def partition_test_files(
+    env_test_files: dict[str, list[str]],
+    env_durations: dict[str, dict[str, float]],
+    shards: int,
+) -> list[dict[str, list[str]]]:
+    """
+    Distribute every test file of every environment across the given number of shards such that
+    the expected duration of each shard is balanced.
+
+    The expected duration of a test file is the sum of the recorded durations of its tests. Files
+    without any recorded durations are assumed to take as long as the average file with durations,
+    or an equal amount of time if nothing has been recorded yet. Files are assigned longest first to
+    the shard with the least expected duration, which is deterministic so that independent jobs
+    compute the same assignment.
+    """
+    weighted_units: list[tuple[float, str, str]] = []
+    unknown_units: list[tuple[str, str]] = []
+    for env_name, test_files in env_test_files.items():
+        file_durations: dict[str, float] = {}
+        for node_id, duration in env_durations.get(env_name, {}).items():
+            file_path = node_id.split("::", 1)[0]
+            file_durations[file_path] = file_durations.get(file_path, 0.0) + duration
+
+        for test_file in test_files:
+            file_path = test_file.split("::", 1)[0]
+            if file_path in file_durations:
+                weighted_units.append((file_durations[file_path], env_name, test_file))
+            else:
+                unknown_units.append((env_name, test_file))
+
+    default_duration = sum(unit[0] for unit in weighted_units) / len(weighted_units) if weighted_units else 1.0
+    weighted_units.extend((default_duration, env_name, test_file) for env_name, test_file in unknown_units)
+    weighted_units.sort(key=lambda unit: (-unit[0], unit[1], unit[2]))
+
+    loads = [0.0] * shards
+    assignments: list[dict[str, list[str]]] = [{} for _ in range(shards)]
+    for duration, env_name, test_file in weighted_units:
+        shard = min(range(shards), key=lambda i: (loads[i], i))
+        loads[shard] += duration
+        assignments[shard].setdefault(env_name, []).append(test_file)
+
+    # Preserve the original order of environments and of files within each environment
+    for assignment in assignments:
+        for env_name, test_files in assignment.items():
+            order = {test_file: i for i, test_file in enumerate(env_test_files[env_name])}
+            test_files.sort(key=order.__getitem__)
+
+    return [
+        {env_name: assignment[env_name] for env_name in env_test_files if env_name in assignment}
+        for assignment in assignments
+    ]
@@ -0,0 +1,89 @@
+"""
+A pytest plugin that is loaded in test environments by the `test` command, so it must not import
+anything other than the standard library and pytest itself.
+
+The duration of every test is written to the path set by `HATCH_TEST_DURATIONS_REPORT` at the end
+of the session. If `HATCH_TEST_DURATIONS` points to durations recorded by previous runs, then test
+modules are reordered such that those expected to take the longest run first, which minimizes the
+time spent waiting on the last worker when tests are distributed with pytest-xdist.
+
+If `HATCH_TEST_COVERAGE_CONTEXT` is set, then coverage measured while running each test is recorded
+in a dynamic context named after the node ID of the test.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+
+DURATIONS: dict[str, float] = {}
+
+
+def pytest_collection_modifyitems(items) -> None:
+    durations_file = os.environ.get("HATCH_TEST_DURATIONS", "")
+    if not durations_file or not os.path.isfile(durations_file):
+        return
+
+    try:
+        with open(durations_file, encoding="utf-8") as f:
+            durations = json.load(f)
+    except (OSError, ValueError):
+        return
+
+    file_durations: dict[str, float] = {}
+    for node_id, duration in durations.items():
+        file_path = node_id.split("::", 1)[0]
+        file_durations[file_path] = file_durations.get(file_path, 0.0) + duration
+
+    if not file_durations:
+        return
+
+    default_duration = sum(file_durations.values()) / len(file_durations)
+    file_order: dict[str, int] = {}
+    for item in items:
+        file_order.setdefault(item.nodeid.split("::", 1)[0], len(file_order))
+
+    # Tests within a module keep their relative order because sorting is stable
+    def sort_key(item) -> tuple[float, int]:
+        file_path = item.nodeid.split("::", 1)[0]
+        return -file_durations.get(file_path, default_duration), file_order[file_path]
+
+    items.sort(key=sort_key)
+
+
+def pytest_runtest_logreport(report) -> None:
+    DURATIONS[report.nodeid] = DURATIONS.get(report.nodeid, 0.0) + report.duration
+
+
+def pytest_sessionfinish(session) -> None:
+    report_file = os.environ.get("HATCH_TEST_DURATIONS_REPORT", "")
+    # Workers of pytest-xdist forward their reports to the controller which writes the durations
+    if not report_file or not DURATIONS or hasattr(session.config, "workerinput"):
+        return
+
+    os.makedirs(os.path.dirname(report_file), exist_ok=True)
+    with open(report_file, "w", encoding="utf-8") as f:
+        json.dump(DURATIONS, f)
+
+
+def pytest_runtest_logstart(nodeid) -> None:
+    switch_coverage_context(nodeid)
+
+
+def pytest_runtest_logfinish(nodeid) -> None:  # noqa: ARG001
+    switch_coverage_context("")
+
+
+def switch_coverage_context(context: str) -> None:
+    # Each test is measured in its own context so that changed files may be mapped to tests
+    if not os.environ.get("HATCH_TEST_COVERAGE_CONTEXT"):
+        return
+
+    try:
+        from coverage import Coverage
+    except ImportError:
+        return
+
+    coverage = Coverage.current()
+    if coverage is not None:
+        coverage.switch_context(context)
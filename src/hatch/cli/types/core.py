@@ -46,6 +46,73 @@ class TypeCheckEnvironment:
         return None
 
     def construct_config_file(self) -> str:
+        """Return the generated config, reusing the result of a previous run if its inputs are unchanged."""
+        from hatch.utils.cache import KeyedCache
+
+        cache = KeyedCache(self.env.app.cache_dir / "type-check" / self.env.root.id / "pyrefly.json")
+        return cache.get_or_create(self._config_cache_key(), self._generate_config_file)
+
+    def _config_cache_key(self) -> str:
+        """Compute a key for everything that the generated config depends on.
+
+        The `pyproject.toml` files of the project and its workspace members determine dependencies,
+        while the modification times of source directories and their immediate subdirectories change
+        whenever packages are added or removed. Members are located without loading their projects.
+        """
+        import sys
+
+        from hatch._version import __version__
+        from hatch.utils.cache import compute_key, file_digest
+        from hatch.utils.fs import Path
+
+        root = str(self.env.root)
+        member_paths = self._find_workspace_member_paths()
+        source_dirs = [os.path.join(path, "src") for path in (root, *member_paths)]
+
+        layout: list[tuple[str, int]] = []
+        for directory in (os.path.join(root, "tests"), *source_dirs):
+            try:
+                layout.append((directory, os.stat(directory).st_mtime_ns))
+            except OSError:
+                continue
+
+        for source_dir in source_dirs:
+            try:
+                entries = list(os.scandir(source_dir))
+            except OSError:
+                continue
+
+            layout.extend((entry.path, entry.stat().st_mtime_ns) for entry in entries if entry.is_dir())
+
+        return compute_key(
+            __version__,
+            sys.platform,
+            [(path, file_digest(Path(path, "pyproject.toml"))) for path in (root, *member_paths)],
+            sorted(layout),
+        )
+
+    def _find_workspace_member_paths(self) -> list[str]:
+        """Find the directories matching the configured workspace members."""
+        from glob import glob
+
+        try:
+            members = self.env.config.get("workspace", {}).get("members", [])
+            patterns = [
+                self.env.metadata.context.format(member if isinstance(member, str) else member["path"])
+                for member in members
+            ]
+        except Exception:  # noqa: BLE001
+            return []
+
+        root = str(self.env.root)
+        return sorted({
+            os.path.normpath(path)
+            for pattern in patterns
+            for path in glob(os.path.join(root, pattern))
+            if os.path.isfile(os.path.join(path, "pyproject.toml"))
+        })
+
+    def _generate_config_file(self) -> str:
         """Generate a minimal pyrefly.toml based on the project layout.
 
         The generated config tells pyrefly:
@@ -11,6 +11,8 @@ class AppEnvVars:
     FORCE_COLOR = "FORCE_COLOR"
     KEEP_ENV = "HATCH_KEEP_ENV"
     NO_SOURCES = "HATCH_NO_SOURCES"
+    TRACE = "HATCH_TRACE"
+    TRACE_FORMAT = "HATCH_TRACE_FORMAT"
 
 
 class ConfigEnvVars:
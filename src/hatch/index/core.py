@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from functools import cached_property
 from typing import TYPE_CHECKING
 
@@ -12,6 +13,8 @@ if TYPE_CHECKING:
 
     from hatch.utils.fs import Path
 
+DIGEST_CHUNK_SIZE = 1048576
+
 
 class IndexURLs:
     def __init__(self, repo: str):
@@ -61,41 +64,35 @@ class PackageIndex:
             timeout=DEFAULT_TIMEOUT,
         )
 
-    def upload_artifact(self, artifact: Path, data: dict):
-        import hashlib
-        import io
+    def upload_artifact(self, artifact: Path, data: dict, *, digests: dict[str, str] | None = None, attempts: int = 3):
+        import httpx2
+
+        from hatch.utils.network import MAXIMUM_SLEEP, MINIMUM_SLEEP
 
         data[":action"] = "file_upload"
         data["protocol_version"] = "1"
-
-        with artifact.open("rb") as f:
-            # https://github.com/pypa/warehouse/blob/7fc3ce5bd7ecc93ef54c1652787fb5e7757fe6f2/tests/unit/packaging/test_tasks.py#L189-L191
-            md5_hash = hashlib.md5()  # noqa: S324
-            sha256_hash = hashlib.sha256()
-            blake2_256_hash = hashlib.blake2b(digest_size=32)
-
-            while True:
-                chunk = f.read(io.DEFAULT_BUFFER_SIZE)
-                if not chunk:
-                    break
-
-                md5_hash.update(chunk)
-                sha256_hash.update(chunk)
-                blake2_256_hash.update(chunk)
-
-            data["md5_digest"] = md5_hash.hexdigest()
-            data["sha256_digest"] = sha256_hash.hexdigest()
-            data["blake2_256_digest"] = blake2_256_hash.hexdigest()
-
-            f.seek(0)
-
-            response = self.client.post(
-                self.repo,
-                data=data,
-                files={"content": (artifact.name, f, "application/octet-stream")},
-                auth=(self.user, self.auth),
-            )
-            response.raise_for_status()
+        data.update(digests or get_artifact_digests(artifact))
+
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                with artifact.open("rb") as f:
+                    response = self.client.post(
+                        self.repo,
+                        data=data,
+                        files={"content": (artifact.name, f, "application/octet-stream")},
+                        auth=(self.user, self.auth),
+                    )
+                    response.raise_for_status()
+            except (httpx2.TransportError, httpx2.HTTPStatusError) as e:
+                # Only retry errors that are likely to be transient
+                if attempt >= attempts or (isinstance(e, httpx2.HTTPStatusError) and not e.response.is_server_error):
+                    raise
+
+                time.sleep(min(MAXIMUM_SLEEP, MINIMUM_SLEEP * 2 ** (attempt - 1)))
+            else:
+                break
 
     def get_simple_api(self, project: str) -> httpx2.Response:
         return self.client.get(
@@ -103,3 +100,24 @@ class PackageIndex:
             headers={"Cache-Control": "no-cache"},
             auth=(self.user, self.auth),
         )
+
+
+def get_artifact_digests(artifact: Path) -> dict[str, str]:
+    import hashlib
+
+    # https://github.com/pypa/warehouse/blob/7fc3ce5bd7ecc93ef54c1652787fb5e7757fe6f2/tests/unit/packaging/test_tasks.py#L189-L191
+    md5_hash = hashlib.md5()  # noqa: S324
+    sha256_hash = hashlib.sha256()
+    blake2_256_hash = hashlib.blake2b(digest_size=32)
+
+    with artifact.open("rb") as f:
+        while chunk := f.read(DIGEST_CHUNK_SIZE):
+            md5_hash.update(chunk)
+            sha256_hash.update(chunk)
+            blake2_256_hash.update(chunk)
+
+    return {
+        "md5_digest": md5_hash.hexdigest(),
+        "sha256_digest": sha256_hash.hexdigest(),
+        "blake2_256_digest": blake2_256_hash.hexdigest(),
+    }
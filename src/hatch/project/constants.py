@@ -13,3 +13,8 @@ class BuildEnvVars:
     HOOK_ENABLE_PREFIX = "HATCH_BUILD_HOOK_ENABLE_"
     CLEAN = "HATCH_BUILD_CLEAN"
     CLEAN_HOOKS_AFTER = "HATCH_BUILD_CLEAN_HOOKS_AFTER"
+    PROFILE = "HATCH_BUILD_PROFILE"
+
+
+class MetadataEnvVars:
+    SNAPSHOT = "HATCH_METADATA_SNAPSHOT"
@@ -142,6 +142,10 @@ class Project:
         if env_name is None:
             env_name = self.app.env
 
+        with self.app.tracer.span(f"Load environment: {env_name}"):
+            return self._get_environment(env_name)
+
+    def _get_environment(self, env_name: str) -> EnvironmentInterface:
         if env_name in self.config.internal_envs:
             config = self.config.internal_envs[env_name]
         elif env_name in self.config.envs:
@@ -195,16 +199,24 @@ class Project:
     # Ensure that this method is clearly written since it is
     # used for documenting the life cycle of environments.
     def prepare_environment(self, environment: EnvironmentInterface, *, keep_env: bool):
-        if not environment.exists():
+        with self.app.tracer.span(f"Prepare environment: {environment.name}"):
+            self._prepare_environment(environment, keep_env=keep_env)
+
+    def _prepare_environment(self, environment: EnvironmentInterface, *, keep_env: bool):
+        span = self.app.tracer.span
+        if environment.exists():
+            if environment.dev_mode and not environment.skip_install:
+                self.sync_editable_install(environment)
+        else:
             with self.managed_environment(environment, keep_env=keep_env):
                 self.env_metadata.reset(environment)
 
-                with environment.app_status_creation():
+                with span("Creation"), environment.app_status_creation():
                     environment.create()
 
                 if not environment.skip_install:
                     if environment.pre_install_commands:
-                        with environment.app_status_pre_installation():
+                        with span("Pre-installation commands"), environment.app_status_pre_installation():
                             self.app.run_shell_commands(
                                 ExecutionContext(
                                     environment,
@@ -214,14 +226,15 @@ class Project:
                                 )
                             )
 
-                    with environment.app_status_project_installation():
+                    with span("Project installation"), environment.app_status_project_installation():
                         if environment.dev_mode:
                             environment.install_project_dev_mode()
+                            self.env_metadata.update_editable_hash(environment, self.editable_hash(environment))
                         else:
                             environment.install_project()
 
                     if environment.post_install_commands:
-                        with environment.app_status_post_installation():
+                        with span("Post-installation commands"), environment.app_status_post_installation():
                             self.app.run_shell_commands(
                                 ExecutionContext(
                                     environment,
@@ -231,7 +244,7 @@ class Project:
                                 )
                             )
 
-        with environment.app_status_dependency_state_check():
+        with span("Dependency state check"), environment.app_status_dependency_state_check():
             new_dep_hash = environment.dependency_hash()
 
         current_dep_hash = self.env_metadata.dependency_hash(environment)
@@ -241,20 +254,73 @@ class Project:
         if environment.locked and environment_has_lock_inputs(environment):
             lockfile_path = resolve_lockfile_path(environment)
             if not lockfile_path.is_file() or new_dep_hash != current_dep_hash:
-                with self.app.status(f"Locking environment: {environment.name}"):
+                with span("Lock generation"), self.app.status(f"Locking environment: {environment.name}"):
                     generate_lockfile(environment, lockfile_path)
 
         if new_dep_hash != current_dep_hash:
-            with environment.app_status_dependency_installation_check():
+            with span("Dependency installation check"), environment.app_status_dependency_installation_check():
                 dependencies_in_sync = environment.dependencies_in_sync()
 
             if not dependencies_in_sync:
-                with environment.app_status_dependency_synchronization():
+                with span("Dependency synchronization"), environment.app_status_dependency_synchronization():
                     environment.sync_dependencies()
                     new_dep_hash = environment.dependency_hash()
 
             self.env_metadata.update_dependency_hash(environment, new_dep_hash)
 
+    def sync_editable_install(self, environment: EnvironmentInterface) -> None:
+        new_editable_hash = self.editable_hash(environment)
+        current_editable_hash = self.env_metadata.editable_hash(environment)
+        if new_editable_hash == current_editable_hash:
+            return
+
+        # Environments created before editable installs were tracked are assumed to be up to date
+        if current_editable_hash:
+            with self.app.tracer.span("Project installation"), environment.app_status_project_installation():
+                environment.install_project_dev_mode()
+
+        self.env_metadata.update_editable_hash(environment, new_editable_hash)
+
+    @staticmethod
+    def editable_hash(environment: EnvironmentInterface) -> str:
+        """
+        The editable wheel only changes along with the exposed packages, entry points and dependencies,
+        all other changes to the project being visible immediately.
+
+        Only the raw configuration is considered because metadata hooks must not run in Hatch's own process.
+        Fields that hooks populate are therefore tracked by way of the hook configuration.
+        """
+        import json
+        from hashlib import sha256
+
+        metadata = environment.metadata
+        core = metadata.core_raw_metadata
+        hatch = metadata.hatch
+        data = json.dumps(
+            {
+                "features": environment.features,
+                "core": {
+                    field: core.get(field)
+                    for field in (
+                        "name",
+                        "dynamic",
+                        "dependencies",
+                        "optional-dependencies",
+                        "scripts",
+                        "gui-scripts",
+                        "entry-points",
+                    )
+                },
+                "metadata-hooks": hatch.metadata.hook_config,
+                "build": {key: value for key, value in hatch.build_config.items() if key != "targets"},
+                "wheel": hatch.build_targets.get("wheel", {}),
+            },
+            default=str,
+            sort_keys=True,
+        )
+
+        return sha256(data.encode("utf-8")).hexdigest()
+
     def prepare_build_environment(self, *, targets: list[str] | None = None, keep_env: bool = False) -> None:
         from hatch.project.constants import BUILD_BACKEND, BuildEnvVars
         from hatch.utils.structures import EnvVars
@@ -423,6 +423,14 @@ class EnvironmentMetadata:
         metadata["dependency_hash"] = dependency_hash
         self._write(environment, metadata)
 
+    def editable_hash(self, environment: EnvironmentInterface) -> str:
+        return self._read(environment).get("editable_hash", "")
+
+    def update_editable_hash(self, environment: EnvironmentInterface, editable_hash: str) -> None:
+        metadata = self._read(environment)
+        metadata["editable_hash"] = editable_hash
+        self._write(environment, metadata)
+
     def reset(self, environment: EnvironmentInterface) -> None:
         self._metadata_file(environment).unlink(missing_ok=True)
 
@@ -8,7 +8,7 @@ from hatch.utils.fs import Path
 from hatch.utils.runner import ExecutionContext
 
 if TYPE_CHECKING:
-    from hatch.env.plugin.interface import EnvironmentInterface
+    from hatch.env.plugin.interface import EnvironmentInterface, FileSystemContext
     from hatch.project.core import Project
 
 
@@ -130,17 +130,38 @@ class HatchBuildFrontend:
         self.__project = project
         self.__env = env
         self.__scripts = HatchBuildFrontendScripts(self.__project, self.__env)
+        self.__metadata_snapshot: str | None = None
 
     @property
     def scripts(self) -> HatchBuildFrontendScripts:
         return self.__scripts
 
+    @property
+    def metadata_snapshot(self) -> str | None:
+        """
+        The most recent snapshot of fully resolved metadata produced by the backend, if any.
+        """
+        return self.__metadata_snapshot
+
+    def write_metadata_snapshot(self, fs_context: FileSystemContext) -> str | None:
+        if self.__metadata_snapshot is None:
+            return None
+
+        snapshot_context = fs_context.join("metadata-snapshot.json")
+        snapshot_context.local_path.parent.ensure_dir_exists()
+        snapshot_context.local_path.write_text(self.__metadata_snapshot)
+        snapshot_context.sync_env()
+        return snapshot_context.env_path
+
     def get_build_deps(self, targets: list[str]) -> list[str]:
         with self.__env.fs_context() as fs_context:
             output_context = fs_context.join("output")
             output_context.local_path.ensure_dir_exists()
             script = self.scripts.get_build_deps(
-                project_root=self.__env.project_root, output_dir=output_context.env_path, targets=targets
+                project_root=self.__env.project_root,
+                output_dir=output_context.env_path,
+                targets=targets,
+                metadata_snapshot=self.write_metadata_snapshot(fs_context),
             )
 
             script_context = fs_context.join(f"get_build_deps_{'_'.join(targets)}.py")
@@ -162,7 +183,9 @@ class HatchBuildFrontend:
             output_context = fs_context.join("output")
             output_context.local_path.ensure_dir_exists()
             script = self.scripts.get_core_metadata(
-                project_root=self.__env.project_root, output_dir=output_context.env_path
+                project_root=self.__env.project_root,
+                output_dir=output_context.env_path,
+                metadata_snapshot=self.write_metadata_snapshot(fs_context),
             )
 
             script_context = fs_context.join("get_core_metadata.py")
@@ -175,6 +198,11 @@ class HatchBuildFrontend:
             self.__env.app.execute_context(context)
             output_context.sync_local()
 
+            # Backends that predate snapshots will not produce one
+            snapshot_path = output_context.local_path / "snapshot.json"
+            if snapshot_path.is_file():
+                self.__metadata_snapshot = snapshot_path.read_text()
+
             output_path = output_context.local_path / "output.json"
             output: dict[str, Any] = json.loads(output_path.read_text())
             return output
@@ -274,22 +302,26 @@ class StandardBuildFrontendScripts(BuildFrontendScripts):
 
 
 class HatchBuildFrontendScripts(BuildFrontendScripts):
-    def get_build_deps(self, *, output_dir: str, project_root: str, targets: list[str]) -> str:
+    def get_build_deps(
+        self, *, output_dir: str, project_root: str, targets: list[str], metadata_snapshot: str | None = None
+    ) -> str:
         return self.inject_data(
             hatch_build_deps_script(),
             {
                 "project_root": project_root,
                 "output_dir": output_dir,
                 "targets": targets,
+                "metadata_snapshot": metadata_snapshot,
             },
         )
 
-    def get_core_metadata(self, *, output_dir: str, project_root: str) -> str:
+    def get_core_metadata(self, *, output_dir: str, project_root: str, metadata_snapshot: str | None = None) -> str:
         return self.inject_data(
             hatch_core_metadata_script(),
             {
                 "project_root": project_root,
                 "output_dir": output_dir,
+                "metadata_snapshot": metadata_snapshot,
             },
         )
 
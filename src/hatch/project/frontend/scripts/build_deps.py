@@ -14,11 +14,16 @@ def main() -> None:
     project_root: str = RUNNER["project_root"]
     output_dir: str = RUNNER["output_dir"]
     targets: list[str] = RUNNER["targets"]
+    metadata_snapshot: str | None = RUNNER.get("metadata_snapshot")
 
     app = Application()
     plugin_manager = PluginManager()
     metadata = ProjectMetadata(project_root, plugin_manager)
 
+    # Older versions of the backend do not support snapshots
+    if metadata_snapshot and hasattr(metadata, "load_snapshot"):
+        metadata.load_snapshot(metadata_snapshot)
+
     dependencies: dict[str, None] = {}
     for target_name in targets:
         builder_class = plugin_manager.builder.get(target_name)
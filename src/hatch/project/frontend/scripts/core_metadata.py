@@ -13,8 +13,15 @@ RUNNER: dict = {}
 def main() -> None:
     project_root: str = RUNNER["project_root"]
     output_dir: str = RUNNER["output_dir"]
+    metadata_snapshot: str | None = RUNNER.get("metadata_snapshot")
 
     project_metadata = ProjectMetadata(project_root, PluginManager())
+
+    # Older versions of the backend do not support snapshots
+    supports_snapshots = hasattr(project_metadata, "load_snapshot")
+    if supports_snapshots and metadata_snapshot:
+        project_metadata.load_snapshot(metadata_snapshot)
+
     core_metadata = resolve_metadata_fields(project_metadata)
     for key, value in list(core_metadata.items()):
         if not value:
@@ -24,6 +31,9 @@ def main() -> None:
     with open(os.path.join(output_dir, "output.json"), "w", encoding="utf-8") as f:
         f.write(output)
 
+    if supports_snapshots:
+        project_metadata.create_snapshot(os.path.join(output_dir, "snapshot.json"))
+
 
 if __name__ == "__main__":
     main()
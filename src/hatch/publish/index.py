@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import os
 import re
-from typing import TYPE_CHECKING
+import threading
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any
 
 from hatch.publish.plugin.interface import PublisherInterface
 from hatch.utils.fs import Path
@@ -10,6 +13,8 @@ from hatchling.metadata.utils import normalize_project_name
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
+DEFAULT_MAX_CONCURRENT_UPLOADS = 4
+
 
 class IndexPublisher(PublisherInterface):
     PLUGIN_NAME = "index"
@@ -50,6 +55,7 @@ class IndexPublisher(PublisherInterface):
         https://warehouse.readthedocs.io/api-reference/legacy.html#upload-api
         """
         from collections import defaultdict
+        from concurrent.futures import ThreadPoolExecutor, wait
 
         from hatch.index.core import PackageIndex
         from hatch.index.publish import get_sdist_form_data, get_wheel_form_data
@@ -85,6 +91,8 @@ class IndexPublisher(PublisherInterface):
         # Use as an ordered set
         project_versions: dict[str, dict[str, None]] = defaultdict(dict)
 
+        # Metadata is gathered and existing artifacts are detected before any uploads begin
+        uploads: list[tuple[Path, str, dict | None]] = []
         artifacts_found = False
         for artifact in recurse_artifacts(artifacts, self.root):
             if artifact.name.endswith(".whl"):
@@ -105,8 +113,6 @@ class IndexPublisher(PublisherInterface):
             except ValueError:
                 displayed_path = str(artifact)
 
-            self.app.display_info(f"{displayed_path} ...", end=" ")
-
             project_name = normalize_project_name(data["name"])
             if project_name not in existing_artifacts:
                 try:
@@ -118,19 +124,52 @@ class IndexPublisher(PublisherInterface):
                     existing_artifacts[project_name] = set(parse_artifacts(response.text))
 
             if artifact.name in existing_artifacts[project_name]:
-                self.app.display_warning("already exists")
+                uploads.append((artifact, displayed_path, None))
                 continue
 
-            try:
-                index.upload_artifact(artifact, data)
-            except Exception as e:  # noqa: BLE001
-                self.app.display_error("failed")
-                self.app.abort(f"Error uploading to repository: {index.repo} - {e}".replace(index.auth, "*****"))
-            else:
-                self.app.display_success("success")
+            existing_artifacts[project_name].add(artifact.name)
+            uploads.append((artifact, displayed_path, data))
+
+        digest_cache = ArtifactDigestCache(self.cache_dir / "digests.json")
+
+        def upload(artifact: Path, data: dict) -> None:
+            index.upload_artifact(artifact, data, digests=digest_cache.get(artifact))
+
+        max_workers = int(repo_config.get("max-concurrent-uploads", DEFAULT_MAX_CONCURRENT_UPLOADS))
+        executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+        try:
+            # Uploads run concurrently over the pooled client but are reported in order
+            futures = {
+                artifact: executor.submit(upload, artifact, data) for artifact, _, data in uploads if data is not None
+            }
+            for artifact, displayed_path, data in uploads:
+                if data is None:
+                    self.app.display_info(f"{displayed_path} ...", end=" ")
+                    self.app.display_warning("already exists")
+                    continue
+
+                future = futures[artifact]
+                if not future.done():
+                    finished = sum(f.done() for f in futures.values())
+                    with self.app.status_if(
+                        f"Uploading {displayed_path} ({finished}/{len(futures)} uploads finished)",
+                        condition=self.app.console.is_interactive,
+                    ):
+                        wait([future])
+
+                self.app.display_info(f"{displayed_path} ...", end=" ")
+                try:
+                    future.result()
+                except Exception as e:  # noqa: BLE001
+                    self.app.display_error("failed")
+                    self.app.abort(f"Error uploading to repository: {index.repo} - {e}".replace(index.auth, "*****"))
+                else:
+                    self.app.display_success("success")
 
-                existing_artifacts[project_name].add(artifact.name)
-                project_versions[project_name][data["version"]] = None
+                    project_versions[normalize_project_name(data["name"])][data["version"]] = None
+        finally:
+            executor.shutdown(cancel_futures=True)
+            digest_cache.save()
 
         if not options["initialize_auth"]:
             if not artifacts_found:
@@ -162,3 +201,64 @@ def recurse_artifacts(artifacts: list, root) -> Iterable[Path]:
 def parse_artifacts(artifact_payload):
     for match in re.finditer(r"<a [^>]+>([^<]+)</a>", artifact_payload):
         yield match.group(1)
+
+
+class ArtifactDigestCache:
+    """
+    Persists the digests of artifacts keyed by their path, size and modification time so that artifacts
+    are only hashed once, even across multiple publishing attempts.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.__data: dict[str, dict[str, Any]] | None = None
+        self.__modified = False
+
+        # Artifacts are hashed by concurrent uploads
+        self.__lock = threading.Lock()
+
+    @property
+    def data(self) -> dict[str, dict[str, Any]]:
+        if self.__data is None:
+            import json
+
+            try:
+                self.__data = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                self.__data = {}
+
+        return self.__data
+
+    def get(self, artifact: Path) -> dict[str, str]:
+        from hatch.index.core import get_artifact_digests
+
+        stat = artifact.stat()
+        key = str(artifact.resolve())
+        with self.__lock:
+            entry = self.data.get(key)
+
+        if entry is not None and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+            return entry["digests"]
+
+        # Hashing happens outside of the lock so that artifacts are processed in parallel
+        digests = get_artifact_digests(artifact)
+        with self.__lock:
+            self.data[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "digests": digests}
+            self.__modified = True
+
+        return digests
+
+    def save(self) -> None:
+        import json
+
+        with self.__lock:
+            if not self.__modified:
+                return
+
+            # Entries for artifacts that no longer exist are pruned
+            data = {key: entry for key, entry in self.data.items() if os.path.isfile(key)}
+            self.__modified = False
+
+        with suppress(OSError):
+            self.path.ensure_parent_dir_exists()
+            self.path.write_atomic(json.dumps(data), "w", encoding="utf-8")
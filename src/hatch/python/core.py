@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import os
+from contextlib import suppress
+from threading import Lock
 from typing import TYPE_CHECKING, Any
 
 from hatch.python.resolve import ORDERED_DISTRIBUTION_NAMES, get_distribution, is_valid_distribution_name
@@ -9,6 +12,9 @@ if TYPE_CHECKING:
     from hatch.python.resolve import Distribution
     from hatch.utils.fs import Path
 
+MANIFEST_VERSION = 1
+STREAM_CHUNK_SIZE = 65536
+
 
 class InstalledDistribution:
     def __init__(self, path: Path, distribution: Distribution, metadata: dict[str, Any]) -> None:
@@ -46,20 +52,51 @@ class InstalledDistribution:
 
 
 class PythonManager:
-    def __init__(self, directory: Path) -> None:
+    def __init__(self, directory: Path, cache_dir: Path | None = None) -> None:
         self.__directory = directory
+        self.__cache_dir = cache_dir
+        self.__installed: dict[str, InstalledDistribution] | None = None
+        self.__lock = Lock()
 
     @property
     def directory(self) -> Path:
         return self.__directory
 
+    @property
+    def cache_dir(self) -> Path | None:
+        return self.__cache_dir
+
     def get_installed(self) -> dict[str, InstalledDistribution]:
+        if self.__installed is None:
+            self.__installed = self.__load_installed()
+
+        return dict(self.__installed)
+
+    def __load_installed(self) -> dict[str, InstalledDistribution]:
         if not self.directory.is_dir():
             return {}
 
         import json
 
-        installed_distributions: list[InstalledDistribution] = []
+        entries = self.__list_entries()
+        manifest_file = self.directory / self.manifest_filename()
+        try:
+            manifest = json.loads(manifest_file.read_text())
+            if manifest["version"] == MANIFEST_VERSION and manifest["entries"] == entries:
+                return self.__build_installed(manifest["distributions"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        # The manifest is missing, invalid or the directory was modified without Hatch
+        return self.__refresh_manifest()
+
+    def __list_entries(self) -> list[str]:
+        return sorted(name for name in os.listdir(self.directory) if is_valid_distribution_name(name))
+
+    def __scan_installed(self) -> dict[str, dict[str, Any]]:
+        import json
+
+        distributions: dict[str, dict[str, Any]] = {}
         for path in self.directory.iterdir():
             if not (is_valid_distribution_name(path.name) and path.is_dir()):
                 continue
@@ -73,11 +110,42 @@ class PythonManager:
             if not (path / distribution.python_path).is_file():
                 continue
 
-            installed_distributions.append(InstalledDistribution(path, distribution, metadata))
+            distributions[path.name] = metadata
+
+        return distributions
 
+    def __build_installed(self, distributions: dict[str, dict[str, Any]]) -> dict[str, InstalledDistribution]:
+        installed_distributions = [
+            InstalledDistribution(
+                self.directory / name, get_distribution(name, source=metadata.get("source", "")), metadata
+            )
+            for name, metadata in distributions.items()
+        ]
         installed_distributions.sort(key=lambda d: ORDERED_DISTRIBUTION_NAMES.index(d.name))
         return {dist.name: dist for dist in installed_distributions}
 
+    def __refresh_manifest(self) -> dict[str, InstalledDistribution]:
+        import json
+
+        # Distributions may be installed concurrently
+        with self.__lock:
+            entries = self.__list_entries()
+            distributions = self.__scan_installed()
+            manifest_file = self.directory / self.manifest_filename()
+            with suppress(OSError):
+                if entries:
+                    manifest = {"version": MANIFEST_VERSION, "entries": entries, "distributions": distributions}
+                    manifest_file.write_atomic(json.dumps(manifest, indent=2), "w", encoding="utf-8")
+                else:
+                    manifest_file.unlink(missing_ok=True)
+
+            self.__installed = self.__build_installed(distributions)
+            return self.__installed
+
+    @classmethod
+    def manifest_filename(cls) -> str:
+        return "hatch-manifest.json"
+
     def install(self, identifier: str) -> InstalledDistribution:
         import json
 
@@ -88,10 +156,17 @@ class PythonManager:
         self.directory.ensure_dir_exists()
 
         with temp_directory() as temp_dir:
-            archive_path = temp_dir / dist.archive_name
             unpack_path = temp_dir / identifier
-            download_file(archive_path, dist.source, follow_redirects=True)
-            dist.unpack(archive_path, unpack_path)
+            if (archive_path := self.get_cached_archive(dist)) is not None:
+                dist.unpack(archive_path, unpack_path)
+            elif dist.streamable and not self.has_partial_archive(dist):
+                self.stream_archive(dist, unpack_path)
+            elif self.cache_dir is not None:
+                dist.unpack(self.get_archive(dist), unpack_path)
+            else:
+                archive_path = temp_dir / dist.archive_name
+                download_file(archive_path, dist.source, follow_redirects=True)
+                dist.unpack(archive_path, unpack_path)
 
             backup_path = path.with_suffix(".bak")
             if backup_path.is_dir():
@@ -117,9 +192,126 @@ class PythonManager:
         metadata = {"source": dist.source, "python_path": dist.python_path}
         metadata_file = path / InstalledDistribution.metadata_filename()
         metadata_file.write_text(json.dumps(metadata, indent=2))
+        self.__refresh_manifest()
 
         return InstalledDistribution(path, dist, metadata)
 
-    @staticmethod
-    def remove(dist: InstalledDistribution) -> None:
+    def get_archive(self, dist: Distribution) -> Path:
+        """
+        Return the path to the cached archive of the distribution, downloading it if necessary. Interrupted
+        downloads are resumed and archives are only reused when they match the checksum recorded after the
+        download completed.
+        """
+        from hatch.utils.network import download_file
+
+        if (archive_path := self.get_cached_archive(dist)) is not None:
+            return archive_path
+
+        archive_path, checksum_file, partial_path = self.__get_cache_paths(dist)
+        archive_path.parent.ensure_dir_exists()
+        download_file(partial_path, dist.source, follow_redirects=True, resume=True)
+
+        checksum = compute_file_checksum(partial_path)
+        partial_path.replace(archive_path)
+        checksum_file.write_text(checksum)
+        self.__prune_archives(dist)
+
+        return archive_path
+
+    def get_cached_archive(self, dist: Distribution) -> Path | None:
+        if self.cache_dir is None:
+            return None
+
+        archive_path, checksum_file, _ = self.__get_cache_paths(dist)
+        if not (archive_path.is_file() and checksum_file.is_file()):
+            return None
+
+        if compute_file_checksum(archive_path) != checksum_file.read_text().strip():
+            archive_path.unlink()
+            return None
+
+        return archive_path
+
+    def has_partial_archive(self, dist: Distribution) -> bool:
+        return self.cache_dir is not None and self.__get_cache_paths(dist)[2].is_file()
+
+    def stream_archive(self, dist: Distribution, directory: Path) -> None:
+        """
+        Extract the distribution while its archive is being downloaded, avoiding a round trip through the
+        file system. If a cache directory is configured, the downloaded bytes are also written to the cache.
+        """
+        from contextlib import nullcontext
+        from hashlib import sha256
+
+        from hatch.utils.network import DEFAULT_TIMEOUT, ResponseStream, streaming_response
+
+        hasher = sha256()
+        if self.cache_dir is None:
+            archive_path = checksum_file = partial_path = None
+        else:
+            archive_path, checksum_file, partial_path = self.__get_cache_paths(dist)
+            archive_path.parent.ensure_dir_exists()
+
+        with (
+            streaming_response("GET", dist.source, follow_redirects=True, timeout=DEFAULT_TIMEOUT) as response,
+            partial_path.open("wb") if partial_path is not None else nullcontext() as cache_file,
+        ):
+
+            def consume(chunk: bytes) -> None:
+                hasher.update(chunk)
+                if cache_file is not None:
+                    cache_file.write(chunk)
+
+            stream = ResponseStream(response.iter_bytes(STREAM_CHUNK_SIZE), consume)
+            dist.unpack_stream(stream, directory)
+
+            # Archives may have trailing padding that extraction does not need to read
+            stream.exhaust()
+
+        if archive_path is not None and checksum_file is not None and partial_path is not None:
+            partial_path.replace(archive_path)
+            checksum_file.write_text(hasher.hexdigest())
+            self.__prune_archives(dist)
+
+    def __get_cache_paths(self, dist: Distribution) -> tuple[Path, Path, Path]:
+        from hashlib import sha256
+
+        if self.cache_dir is None:  # no cov
+            message = "No cache directory configured"
+            raise ValueError(message)
+
+        # Archives from custom sources are not guaranteed to have unique names
+        archive_dir = self.cache_dir / dist.name / sha256(dist.source.encode("utf-8")).hexdigest()[:16]
+        return (
+            archive_dir / dist.archive_name,
+            archive_dir / f"{dist.archive_name}.sha256",
+            archive_dir / f"{dist.archive_name}.part",
+        )
+
+    def __prune_archives(self, dist: Distribution) -> None:
+        """
+        Remove archives of previous releases of the distribution so that the cache never holds more than one
+        archive per distribution, bounding its size to that of the installed distributions' archives.
+        """
+        import shutil
+
+        archive_dir = self.__get_cache_paths(dist)[0].parent
+        for entry in archive_dir.parent.iterdir():
+            if entry != archive_dir:
+                shutil.rmtree(entry, ignore_errors=True)
+
+    def remove(self, dist: InstalledDistribution) -> None:
         dist.path.wait_for_dir_removed()
+        if self.directory.is_dir():
+            self.__refresh_manifest()
+
+
+def compute_file_checksum(path: Path) -> str:
+    from hashlib import sha256
+
+    hasher = sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(1048576):
+            hasher.update(chunk)
+
+    return hasher.hexdigest()
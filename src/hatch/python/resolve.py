@@ -5,7 +5,7 @@ import platform
 import sys
 from abc import ABC, abstractmethod
 from functools import cached_property
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, BinaryIO, Literal
 
 from hatch.config.constants import PythonEnvVars
 from hatch.errors import PythonDistributionResolutionError, PythonDistributionUnknownError
@@ -82,24 +82,45 @@ class Distribution(ABC):
     def archive_name(self) -> str:
         return self.source.rsplit("/", 1)[-1]
 
+    @cached_property
+    def streamable(self) -> bool:
+        """Whether the archive can be extracted as it is being downloaded."""
+        return self.__get_tarfile_mode() is not None
+
     def unpack(self, archive: Path, directory: Path) -> None:
         if self.source.endswith(".zip"):
             import zipfile
 
             with zipfile.ZipFile(archive, "r") as zf:
                 zf.extractall(directory)
-        elif self.source.endswith((".tar.gz", ".tgz")):
-            self.__unpack_tarfile(archive, directory, "r:gz")
-        elif self.source.endswith((".tar.bz2", ".bz2")):
-            self.__unpack_tarfile(archive, directory, "r:bz2")
-        elif self.source.endswith((".tar.zst", ".tar.zstd")):
-            self.__unpack_tarfile(archive, directory, "r:zst")
+        elif (mode := self.__get_tarfile_mode()) is not None:
+            with self.__open_tarfile(mode, name=archive) as tf:
+                tf.extractall(directory, filter="data")
         else:
             message = f"Unknown archive type: {archive}"
             raise ValueError(message)
 
+    def unpack_stream(self, stream: BinaryIO, directory: Path) -> None:
+        if (mode := self.__get_tarfile_mode()) is None:
+            message = f"Archive type does not support streaming: {self.archive_name}"
+            raise ValueError(message)
+
+        # The pipe variant of each mode reads sequentially without seeking
+        with self.__open_tarfile(mode.replace(":", "|"), fileobj=stream) as tf:
+            tf.extractall(directory, filter="data")
+
+    def __get_tarfile_mode(self) -> Literal["r:gz", "r:bz2", "r:zst"] | None:
+        if self.source.endswith((".tar.gz", ".tgz")):
+            return "r:gz"
+        if self.source.endswith((".tar.bz2", ".bz2")):
+            return "r:bz2"
+        if self.source.endswith((".tar.zst", ".tar.zstd")):
+            return "r:zst"
+
+        return None
+
     @staticmethod
-    def __unpack_tarfile(archive: Path, directory: Path, mode: Literal["r:gz", "r:bz2", "r:zst"]) -> None:
+    def __open_tarfile(mode: str, **kwargs: Any) -> Any:
         if sys.version_info >= (3, 14):
             import tarfile
         else:
@@ -107,8 +128,7 @@ class Distribution(ABC):
             # and filter kwarg (introduced in Python 3.12)
             from backports.zstd import tarfile
 
-        with tarfile.open(archive, mode) as tf:
-            tf.extractall(directory, filter="data")
+        return tarfile.open(mode=mode, **kwargs)
 
     @property
     @abstractmethod
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from hatch.utils.fs import Path
+
+
+class KeyedCache:
+    """
+    A single JSON-serializable value persisted to a file along with the key that it was computed for.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def get(self, key: str) -> Any:
+        if not self.path.is_file():
+            return None
+
+        import json
+
+        try:
+            data = json.loads(self.path.read_text())
+        except ValueError:
+            return None
+
+        if not isinstance(data, dict) or data.get("key") != key:
+            return None
+
+        return data.get("value")
+
+    def set(self, key: str, value: Any) -> None:
+        import json
+
+        self.path.parent.ensure_dir_exists()
+        self.path.write_text(json.dumps({"key": key, "value": value}))
+
+    def get_or_create(self, key: str, create: Callable[[], Any]) -> Any:
+        """
+        Return the value stored for the key, otherwise create and store a new value.
+        """
+        value = self.get(key)
+        if value is None:
+            value = create()
+            self.set(key, value)
+
+        return value
+
+
+def compute_key(*parts: Any) -> str:
+    import json
+    from hashlib import sha256
+
+    return sha256(json.dumps(parts, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def file_digest(path: Path | None) -> str:
+    from hashlib import sha256
+
+    if path is None:
+        return ""
+
+    try:
+        return sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return ""
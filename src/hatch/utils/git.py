@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from hatch.utils.platform import Platform
+
+
+def get_changed_files(platform: Platform, base: str) -> list[str]:
+    """
+    Return the files that differ from the given Git reference or are untracked, relative to the
+    current directory. Deleted files are included.
+    """
+    import subprocess
+
+    changed_files: dict[str, None] = {}
+    for command in (
+        ["git", "diff", "--name-only", "--relative", base],
+        ["git", "ls-files", "--others", "--exclude-standard"],
+    ):
+        for line in platform.check_command_output(command, stderr=subprocess.PIPE).splitlines():
+            if line := line.strip():
+                changed_files[line] = None
+
+    return list(changed_files)
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import io
 import time
 from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator, Iterator
 
     import httpx2
 
@@ -17,10 +18,14 @@ MAXIMUM_SLEEP = 20
 # which is the default TCP packet retransmission window. See:
 # https://tools.ietf.org/html/rfc2988
 DEFAULT_TIMEOUT = 10
+PARTIAL_CONTENT = 206
+RANGE_NOT_SATISFIABLE = 416
 
 
 @contextmanager
-def streaming_response(*args: Any, **kwargs: Any) -> Generator[httpx2.Response, None, None]:
+def streaming_response(
+    *args: Any, allowed_statuses: tuple[int, ...] = (), **kwargs: Any
+) -> Generator[httpx2.Response, None, None]:
     from secrets import choice
 
     import httpx2
@@ -30,7 +35,9 @@ def streaming_response(*args: Any, **kwargs: Any) -> Generator[httpx2.Response,
         attempts += 1
         try:
             with httpx2.stream(*args, **kwargs) as response:
-                response.raise_for_status()
+                if response.status_code not in allowed_statuses:
+                    response.raise_for_status()
+
                 yield response
 
             break
@@ -42,9 +49,85 @@ def streaming_response(*args: Any, **kwargs: Any) -> Generator[httpx2.Response,
             time.sleep(choice(range(sleep + 1)))
 
 
-def download_file(path: Path, *args: Any, **kwargs: Any) -> None:
+def download_file(path: Path, *args: Any, resume: bool = False, **kwargs: Any) -> None:
     kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
 
-    with path.open(mode="wb", buffering=0) as f, streaming_response("GET", *args, **kwargs) as response:
+    offset = path.stat().st_size if resume and path.is_file() else 0
+    if offset:
+        range_kwargs = {**kwargs, "headers": {**kwargs.get("headers", {}), "Range": f"bytes={offset}-"}}
+        with streaming_response("GET", *args, allowed_statuses=(RANGE_NOT_SATISFIABLE,), **range_kwargs) as response:
+            if response.status_code == RANGE_NOT_SATISFIABLE:
+                # The previous attempt may have downloaded everything but failed before completion was recorded
+                _, total = parse_content_range(response.headers.get("Content-Range", ""))
+                if total == offset:
+                    return
+            # Servers that do not support range requests respond with the entire file
+            elif response.status_code != PARTIAL_CONTENT:
+                write_response(path, response, "wb")
+                return
+            # Only append if the server is continuing exactly where the existing content ends
+            elif parse_content_range(response.headers.get("Content-Range", ""))[0] == offset:
+                write_response(path, response, "ab")
+                return
+
+    # The existing content cannot be resumed so start over
+    with streaming_response("GET", *args, **kwargs) as response:
+        write_response(path, response, "wb")
+
+
+def write_response(path: Path, response: httpx2.Response, mode: str) -> None:
+    with path.open(mode=mode, buffering=0) as f:
         for chunk in response.iter_bytes(16384):
             f.write(chunk)
+
+
+def parse_content_range(value: str) -> tuple[int | None, int | None]:
+    """
+    Return the start of the range and the complete length from a `Content-Range` header, either of which
+    is `None` if unknown, e.g. `bytes 200-999/1000` or `bytes */1000`.
+    """
+    unit, _, byte_range = value.strip().partition(" ")
+    if unit != "bytes":
+        return None, None
+
+    byte_range, _, total = byte_range.partition("/")
+    start = byte_range.partition("-")[0]
+    return int(start) if start.isdigit() else None, int(total) if total.isdigit() else None
+
+
+class ResponseStream(io.RawIOBase):
+    """
+    A read-only file-like view of response content that allows consumers like `tarfile` to process data as it
+    arrives. Every chunk is passed to the optional callback exactly once, in order.
+    """
+
+    def __init__(self, chunks: Iterator[bytes], callback: Callable[[bytes], None] | None = None) -> None:
+        super().__init__()
+        self.__chunks = chunks
+        self.__callback = callback
+        self.__buffer = memoryview(b"")
+
+    def readable(self) -> bool:  # noqa: PLR6301
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self.__buffer:
+            chunk = next(self.__chunks, b"")
+            if not chunk:
+                return 0
+
+            if self.__callback is not None:
+                self.__callback(chunk)
+
+            self.__buffer = memoryview(chunk)
+
+        size = min(len(buffer), len(self.__buffer))
+        buffer[:size] = self.__buffer[:size]
+        self.__buffer = self.__buffer[size:]
+        return size
+
+    def exhaust(self) -> None:
+        self.__buffer = memoryview(b"")
+        for chunk in self.__chunks:
+            if self.__callback is not None:
+                self.__callback(chunk)
@@ -186,9 +186,17 @@ class Platform:
 
     @staticmethod
     def stream_process_output(process: Popen) -> Iterable[str]:
-        # To avoid blocking never use a pipe's file descriptor iterator. See https://bugs.python.org/issue3907
-        for line in iter(process.stdout.readline, b""):  # type: ignore[union-attr]
-            yield line.decode("utf-8")
+        """
+        Yield the output of a process as soon as it is available, in batches of complete lines. The
+        final batch may not end with a newline.
+        """
+        reader = ProcessOutputReader(process)
+        while not reader.eof:
+            if output := reader.read():
+                yield output
+
+        if output := reader.flush():
+            yield output
 
     @property
     def default_shell(self) -> str:
@@ -299,6 +307,46 @@ class Platform:
         return self.__home
 
 
+class ProcessOutputReader:
+    """
+    Reads the raw output of a process in large chunks, decoding UTF-8 incrementally so that
+    multibyte characters may be split across chunks.
+    """
+
+    CHUNK_SIZE = 65536
+
+    def __init__(self, process: Popen) -> None:
+        import codecs
+
+        self.process = process
+        self.fd = process.stdout.fileno()  # type: ignore[union-attr]
+        self.eof = False
+        self.__decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self.__pending = ""
+
+    def read(self) -> str:
+        """
+        Read a single chunk, blocking until some output is available, and return every line that
+        has been completed.
+        """
+        # Reading the file descriptor directly rather than the buffered stream returns whatever
+        # is available rather than waiting for the buffer to fill
+        data = os.read(self.fd, self.CHUNK_SIZE)
+        if not data:
+            self.eof = True
+            return ""
+
+        text = self.__pending + self.__decoder.decode(data)
+        index = text.rfind("\n") + 1
+        self.__pending = text[index:]
+        return text[:index]
+
+    def flush(self) -> str:
+        text = self.__pending + self.__decoder.decode(b"", final=True)
+        self.__pending = ""
+        return text
+
+
 class LazilyLoadedModules:
     def __getattr__(self, name: str) -> ModuleType:
         module = import_module(name)
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+class Span:
+    __slots__ = ("attributes", "depth", "duration", "name", "start")
+
+    def __init__(self, name: str, depth: int, start: float, attributes: dict[str, Any]) -> None:
+        self.name = name
+        self.depth = depth
+        self.start = start
+        self.duration = 0.0
+        self.attributes = attributes
+
+
+class Tracer:
+    """
+    Records nested spans of time. Recording is disabled by default so that instrumented code paths
+    incur no overhead unless timings have been requested.
+    """
+
+    def __init__(self, *, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.spans: list[Span] = []
+        self.__depth = 0
+        self.__origin = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.__origin
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Generator[None, None, None]:
+        if not self.enabled:
+            yield
+            return
+
+        span = Span(name, self.__depth, self.elapsed, attributes)
+        self.spans.append(span)
+        self.__depth += 1
+        try:
+            yield
+        finally:
+            self.__depth -= 1
+            span.duration = self.elapsed - span.start
+
+    def to_json(self) -> list[dict[str, Any]]:
+        """
+        Return the spans as a tree, with times in seconds relative to the creation of the tracer.
+        """
+        roots: list[dict[str, Any]] = []
+        stack: list[dict[str, Any]] = []
+        for span in self.spans:
+            node = {
+                "name": span.name,
+                "start": span.start,
+                "duration": span.duration,
+                "attributes": span.attributes,
+                "children": [],
+            }
+            del stack[span.depth :]
+            (stack[-1]["children"] if stack else roots).append(node)
+            stack.append(node)
+
+        return roots
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """
+        Return the spans in the Trace Event Format understood by `chrome://tracing` and Perfetto.
+        """
+        pid = os.getpid()
+        tid = threading.get_ident()
+        return {
+            "traceEvents": [
+                {
+                    "name": span.name,
+                    "ph": "X",
+                    "ts": span.start * 1_000_000,
+                    "dur": span.duration * 1_000_000,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": span.attributes,
+                }
+                for span in self.spans
+            ],
+            "displayTimeUnit": "ms",
+        }
@@ -0,0 +1,144 @@
+import zipfile
+
+import pytest
+
+from hatchling.builders.constants import BuildEnvVars
+from hatchling.builders.wheel import WheelBuilder
+from hatchling.utils.constants import DEFAULT_BUILD_SCRIPT
+
+
+@pytest.fixture
+def project(temp_dir, helpers):
+    (temp_dir / "pyproject.toml").write_text(
+        helpers.dedent(
+            """
+            [project]
+            name = "foo"
+            version = "0.0.1"
+
+            [tool.hatch.build.targets.wheel.hooks.custom]
+            """
+        )
+    )
+
+    package_dir = temp_dir / "foo"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").touch()
+
+    source_dir = temp_dir / "src"
+    source_dir.mkdir()
+    (source_dir / "ext.c").write_text("1")
+
+    (temp_dir / DEFAULT_BUILD_SCRIPT).write_text(
+        helpers.dedent(
+            """
+            import os
+
+            from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+            class CustomHook(BuildHookInterface):
+                def initialize(self, version, build_data):
+                    with open(os.path.join(self.root, 'calls.txt'), 'a', encoding='utf-8') as f:
+                        f.write('x')
+
+                    with open(os.path.join(self.root, 'src', 'ext.c'), encoding='utf-8') as f:
+                        source = f.read()
+
+                    with open(os.path.join(self.root, 'foo', 'ext.txt'), 'w', encoding='utf-8') as f:
+                        f.write(source)
+
+                    build_data['artifacts'].append('foo/ext.txt')
+                    build_data['tag'] = 'py3-none-any'
+
+                def finalize(self, version, build_data, artifact_path):
+                    with open(os.path.join(self.root, 'finalize.txt'), 'a', encoding='utf-8') as f:
+                        f.write('x')
+
+                def get_input_globs(self):
+                    return ['src/**/*.c']
+
+                def get_output_paths(self):
+                    return ['foo/ext.txt']
+            """
+        )
+    )
+    (temp_dir / ".gitignore").write_text("foo/ext.txt\ncache/\ndist/\n")
+
+    return temp_dir
+
+
+def build(project):
+    builder = WheelBuilder(str(project))
+    artifacts = list(builder.build(directory=str(project / "dist"), versions=["standard"]))
+
+    with zipfile.ZipFile(artifacts[0], "r") as zip_archive:
+        return zip_archive.read("foo/ext.txt").decode("utf-8")
+
+
+def hook_calls(project, name="calls.txt"):
+    return len((project / name).read_text())
+
+
+class TestBuildHookCache:
+    def test_disabled(self, project):
+        with project.as_cwd():
+            build(project)
+            build(project)
+
+        assert hook_calls(project) == 2
+
+    def test_skip_unchanged(self, project):
+        with project.as_cwd(env_vars={BuildEnvVars.HOOK_CACHE_DIR: str(project / "cache")}):
+            assert build(project) == "1"
+            assert build(project) == "1"
+
+        assert hook_calls(project) == 1
+        assert hook_calls(project, "finalize.txt") == 1
+
+    def test_input_changed(self, project):
+        with project.as_cwd(env_vars={BuildEnvVars.HOOK_CACHE_DIR: str(project / "cache")}):
+            assert build(project) == "1"
+
+            (project / "src" / "ext.c").write_text("2")
+            assert build(project) == "2"
+
+        assert hook_calls(project) == 2
+
+    def test_input_added(self, project):
+        with project.as_cwd(env_vars={BuildEnvVars.HOOK_CACHE_DIR: str(project / "cache")}):
+            build(project)
+
+            (project / "src" / "nested").mkdir()
+            (project / "src" / "nested" / "other.c").touch()
+            build(project)
+
+        assert hook_calls(project) == 2
+
+    def test_unrelated_change(self, project):
+        with project.as_cwd(env_vars={BuildEnvVars.HOOK_CACHE_DIR: str(project / "cache")}):
+            build(project)
+
+            (project / "foo" / "__init__.py").write_text("x = 1")
+            build(project)
+
+        assert hook_calls(project) == 1
+
+    def test_output_removed(self, project):
+        with project.as_cwd(env_vars={BuildEnvVars.HOOK_CACHE_DIR: str(project / "cache")}):
+            build(project)
+
+            (project / "foo" / "ext.txt").unlink()
+            assert build(project) == "1"
+
+        assert hook_calls(project) == 2
+
+    def test_hook_script_changed(self, project):
+        with project.as_cwd(env_vars={BuildEnvVars.HOOK_CACHE_DIR: str(project / "cache")}):
+            build(project)
+
+            with open(project / DEFAULT_BUILD_SCRIPT, "a", encoding="utf-8") as f:
+                f.write("\n")
+
+            build(project)
+
+        assert hook_calls(project) == 2
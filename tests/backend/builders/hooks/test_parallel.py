@@ -0,0 +1,172 @@
+import threading
+
+import pytest
+
+from hatchling.builders.hooks.parallel import (
+    get_build_hook_batches,
+    initialize_build_hooks_concurrently,
+    merge_build_data,
+)
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+class RecordingHook(BuildHookInterface):
+    def initialize(self, version, build_data):
+        build_data["artifacts"].append(self.PLUGIN_NAME)
+        build_data["force_include"][self.PLUGIN_NAME] = version
+        build_data[self.PLUGIN_NAME] = threading.get_ident()
+
+
+def create_hooks(root, **configs):
+    hooks = {}
+    for hook_name, config in configs.items():
+        hook_class = type(hook_name, (RecordingHook,), {"PLUGIN_NAME": hook_name})
+        hooks[hook_name] = hook_class(str(root), config, None, None, "", "wheel")
+
+    return hooks
+
+
+class TestOptions:
+    def test_default(self, isolation):
+        build_hook = BuildHookInterface(str(isolation), {}, None, None, "", "wheel")
+
+        assert build_hook.is_parallel_safe() is False
+        assert build_hook.get_hook_dependencies() == []
+
+    def test_parallel_safe_not_boolean(self, isolation):
+        build_hook = BuildHookInterface(str(isolation), {"parallel-safe": 9000}, None, None, "", "wheel")
+
+        with pytest.raises(TypeError, match="Option `parallel-safe` of build hook `` must be a boolean"):
+            build_hook.is_parallel_safe()
+
+    def test_depends_on_not_array(self, isolation):
+        build_hook = BuildHookInterface(str(isolation), {"depends-on": "foo"}, None, None, "", "wheel")
+
+        with pytest.raises(TypeError, match="Option `depends-on` of build hook `` must be an array"):
+            build_hook.get_hook_dependencies()
+
+    def test_depends_on_dependency_not_string(self, isolation):
+        build_hook = BuildHookInterface(str(isolation), {"depends-on": [9000]}, None, None, "", "wheel")
+
+        with pytest.raises(TypeError, match="Dependency #1 of option `depends-on` of build hook `` must be a string"):
+            build_hook.get_hook_dependencies()
+
+
+class TestBatches:
+    def test_sequential_by_default(self, isolation):
+        build_hooks = create_hooks(isolation, foo={}, bar={}, baz={})
+
+        assert get_build_hook_batches(build_hooks) == [["foo"], ["bar"], ["baz"]]
+
+    def test_parallel_safe(self, isolation):
+        build_hooks = create_hooks(
+            isolation,
+            foo={"parallel-safe": True},
+            bar={"parallel-safe": True},
+            baz={},
+            qux={"parallel-safe": True},
+        )
+
+        assert get_build_hook_batches(build_hooks) == [["foo", "bar"], ["baz"], ["qux"]]
+
+    def test_dependency_in_batch(self, isolation):
+        build_hooks = create_hooks(
+            isolation,
+            foo={"parallel-safe": True},
+            bar={"parallel-safe": True},
+            baz={"parallel-safe": True, "depends-on": ["foo"]},
+        )
+
+        assert get_build_hook_batches(build_hooks) == [["foo", "bar"], ["baz"]]
+
+    def test_dependency_defined_later(self, isolation):
+        build_hooks = create_hooks(isolation, foo={"depends-on": ["baz"]}, bar={}, baz={})
+
+        assert get_build_hook_batches(build_hooks) == [["bar"], ["baz"], ["foo"]]
+
+    def test_dependency_not_enabled(self, isolation):
+        build_hooks = create_hooks(
+            isolation, foo={"parallel-safe": True}, bar={"parallel-safe": True, "depends-on": ["baz"]}
+        )
+
+        assert get_build_hook_batches(build_hooks) == [["foo", "bar"]]
+
+    def test_circular(self, isolation):
+        build_hooks = create_hooks(isolation, foo={"depends-on": ["bar"]}, bar={"depends-on": ["foo"]}, baz={})
+
+        with pytest.raises(ValueError, match="Build hooks have circular dependencies: foo, bar"):
+            get_build_hook_batches(build_hooks)
+
+
+class TestMerge:
+    def test_combined(self):
+        original = {"artifacts": ["a"], "force_include": {"x": "y", "z": "z"}, "tag": "", "removed": 1}
+        build_data = {"artifacts": ["a", "b"], "force_include": {"x": "y", "z": "z", "b": "b"}, "tag": "", "removed": 1}
+
+        merge_build_data(
+            build_data,
+            original,
+            {"artifacts": ["a", "c"], "force_include": {"x": "c", "c": "c"}, "tag": "py3-none-any", "new": 2},
+        )
+
+        assert build_data == {
+            "artifacts": ["a", "b", "c"],
+            "force_include": {"x": "c", "b": "b", "c": "c"},
+            "tag": "py3-none-any",
+            "new": 2,
+        }
+
+    def test_replaced_array(self):
+        build_data = {"artifacts": ["a", "b"]}
+
+        merge_build_data(build_data, {"artifacts": ["a"]}, {"artifacts": ["c"]})
+
+        assert build_data == {"artifacts": ["c"]}
+
+
+class TestInitialize:
+    def test_deterministic(self, isolation):
+        build_hooks = create_hooks(isolation, foo={}, bar={}, baz={})
+        build_data = {"artifacts": [], "force_include": {}}
+
+        results = initialize_build_hooks_concurrently(list(build_hooks.values()), "standard", build_data)
+
+        assert results == [(True, None), (True, None), (True, None)]
+        assert build_data["artifacts"] == ["foo", "bar", "baz"]
+        assert list(build_data["force_include"]) == ["foo", "bar", "baz"]
+
+    def test_concurrent(self, isolation):
+        barrier = threading.Barrier(2, timeout=5)
+
+        class WaitingHook(RecordingHook):
+            def initialize(self, version, build_data):
+                barrier.wait()
+                super().initialize(version, build_data)
+
+        build_hooks = [
+            type(name, (WaitingHook,), {"PLUGIN_NAME": name})(str(isolation), {}, None, None, "", "wheel")
+            for name in ("foo", "bar")
+        ]
+        build_data = {"artifacts": [], "force_include": {}}
+
+        initialize_build_hooks_concurrently(build_hooks, "standard", build_data)
+
+        assert build_data["foo"] != build_data["bar"]
+
+    def test_error(self, isolation):
+        class FailingHook(RecordingHook):
+            PLUGIN_NAME = "fail"
+
+            def initialize(self, version, build_data):  # noqa: ARG002
+                raise RuntimeError(self.PLUGIN_NAME)
+
+        build_hooks = [
+            *create_hooks(isolation, foo={}).values(),
+            FailingHook(str(isolation), {}, None, None, "", "wheel"),
+        ]
+        build_data = {"artifacts": [], "force_include": {}}
+
+        with pytest.raises(RuntimeError, match="fail"):
+            initialize_build_hooks_concurrently(build_hooks, "standard", build_data)
+
+        assert build_data["artifacts"] == []
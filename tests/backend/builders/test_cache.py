@@ -0,0 +1,138 @@
+import hashlib
+import json
+import os
+import zipfile
+
+import pytest
+
+from hatchling.builders.cache import FileHashCache
+from hatchling.builders.constants import BuildEnvVars
+from hatchling.builders.utils import format_file_hash
+from hatchling.builders.wheel import WheelBuilder
+
+
+def get_record_entry(contents):
+    return f"sha256={format_file_hash(hashlib.sha256(contents).digest())},{len(contents)}"
+
+
+def make_old(path):
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+
+@pytest.fixture
+def cache(temp_dir):
+    with temp_dir.as_cwd(env_vars={BuildEnvVars.HASH_CACHE_DIR: str(temp_dir / "cache")}):
+        yield FileHashCache.from_environment(str(temp_dir))
+
+
+class TestFileHashCache:
+    def test_disabled(self, temp_dir):
+        with temp_dir.as_cwd():
+            assert FileHashCache.from_environment(str(temp_dir)) is None
+
+    def test_roundtrip(self, temp_dir, cache):
+        path = temp_dir / "foo.txt"
+        path.write_text("foo")
+        make_old(path)
+
+        file_stat = os.stat(path)
+        assert cache.get(str(path), file_stat) is None
+
+        cache.set(str(path), file_stat, "digest")
+        cache.save()
+
+        assert FileHashCache(cache.path).get(str(path), file_stat) == "digest"
+
+    @pytest.mark.parametrize("attribute", ["st_size", "st_mtime_ns", "st_ino"])
+    def test_stale(self, temp_dir, cache, attribute):
+        path = temp_dir / "foo.txt"
+        path.write_text("foo")
+        make_old(path)
+
+        file_stat = os.stat(path)
+        cache.set(str(path), file_stat, "digest")
+
+        values = list(file_stat)
+        fields = {"st_size": 6, "st_mtime_ns": None, "st_ino": 1}
+        if attribute == "st_mtime_ns":
+            changed_stat = os.stat_result(values, {"st_mtime_ns": file_stat.st_mtime_ns + 1})
+        else:
+            values[fields[attribute]] += 1
+            changed_stat = os.stat_result(values, {"st_mtime_ns": file_stat.st_mtime_ns})
+
+        assert cache.get(str(path), changed_stat) is None
+
+    def test_recently_modified(self, temp_dir, cache):
+        path = temp_dir / "foo.txt"
+        path.write_text("foo")
+
+        file_stat = os.stat(path)
+        cache.set(str(path), file_stat, "digest")
+
+        assert cache.get(str(path), file_stat) is None
+        assert not cache.modified
+
+    def test_invalid(self, temp_dir, cache):
+        os.makedirs(os.path.dirname(cache.path))
+        with open(cache.path, "w", encoding="utf-8") as f:
+            f.write("{")
+
+        assert cache.get(str(temp_dir / "foo.txt"), os.stat(temp_dir)) is None
+
+    def test_incompatible_version(self, temp_dir, cache):
+        path = temp_dir / "foo.txt"
+        path.write_text("foo")
+        make_old(path)
+
+        file_stat = os.stat(path)
+        cache.set(str(path), file_stat, "digest")
+        cache.save()
+
+        with open(cache.path, encoding="utf-8") as f:
+            data = json.load(f)
+        data["version"] = FileHashCache.VERSION + 1
+        with open(cache.path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+        assert FileHashCache(cache.path).get(str(path), file_stat) is None
+
+
+class TestWheel:
+    @staticmethod
+    def build(project_path):
+        config = {
+            "project": {"name": "my-app", "version": "0.0.1"},
+            "tool": {"hatch": {"build": {"targets": {"wheel": {"versions": ["standard"], "packages": ["my_app"]}}}}},
+        }
+        builder = WheelBuilder(str(project_path), config=config)
+        artifact = next(builder.build(directory=str(project_path / "dist")))
+
+        with zipfile.ZipFile(artifact, "r") as zip_archive:
+            record = zip_archive.read("my_app-0.0.1.dist-info/RECORD").decode("utf-8")
+
+        return dict(line.split(",", 1) for line in record.splitlines())
+
+    def test_reuse(self, temp_dir):
+        project_path = temp_dir / "my-app"
+        package_path = project_path / "my_app"
+        package_path.mkdir(parents=True)
+        data_path = package_path / "data.bin"
+        data_path.write_bytes(b"foo")
+        make_old(data_path)
+
+        with project_path.as_cwd(env_vars={BuildEnvVars.HASH_CACHE_DIR: str(temp_dir / "cache")}):
+            record = self.build(project_path)
+            assert record["my_app/data.bin"] == get_record_entry(b"foo")
+
+            # Prove that the cached hash is used as long as the file appears unchanged
+            cache = FileHashCache.from_environment(str(project_path))
+            cache.load()[str(data_path)][3] = "cached"
+            cache.modified = True
+            cache.save()
+
+            assert self.build(project_path)["my_app/data.bin"] == "sha256=cached,3"
+
+            data_path.write_bytes(b"bar")
+            os.utime(data_path, ns=(2_000_000_000, 2_000_000_000))
+
+            assert self.build(project_path)["my_app/data.bin"] == get_record_entry(b"bar")
@@ -0,0 +1,123 @@
+import json
+import os
+
+import pytest
+
+from hatchling.builders.constants import BuildEnvVars
+from hatchling.builders.plugin.interface import IncludedFile
+from hatchling.builders.profile import BuildProfile
+from hatchling.builders.sdist import SdistBuilder
+from hatchling.builders.wheel import WheelBuilder
+from hatchling.utils.constants import DEFAULT_BUILD_SCRIPT
+
+
+@pytest.fixture
+def project(temp_dir, helpers):
+    (temp_dir / "pyproject.toml").write_text(
+        helpers.dedent(
+            """
+            [project]
+            name = "foo"
+            version = "0.0.1"
+
+            [tool.hatch.build.hooks.custom]
+            """
+        )
+    )
+
+    package_dir = temp_dir / "foo"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").touch()
+    (package_dir / "bar.py").touch()
+
+    (temp_dir / DEFAULT_BUILD_SCRIPT).write_text(
+        helpers.dedent(
+            """
+            from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+            class CustomHook(BuildHookInterface):
+                pass
+            """
+        )
+    )
+    (temp_dir / ".gitignore").write_text("dist/\n")
+
+    return temp_dir
+
+
+class TestBuildProfile:
+    def test_select_files(self):
+        profile = BuildProfile("wheel", "standard")
+        files = [IncludedFile(f"/{name}", name, name) for name in ("foo", "bar")]
+
+        assert list(profile.select_files(files)) == files
+        assert profile.file_count == 2
+        assert set(profile.phases) == {"file selection"}
+
+    def test_archive_excludes_file_selection(self):
+        profile = BuildProfile("wheel", "standard")
+        with profile.archive():
+            profile.add_phase("file selection", 5, 3)
+
+        assert profile.phases["archive writing"]["wall"] < 0
+        assert profile.phases["archive writing"]["cpu"] < 0
+
+    def test_phase_order(self):
+        profile = BuildProfile("wheel", "standard")
+        profile.add_phase("finalize hooks", 1, 1)
+        profile.add_phase("metadata", 2, 1)
+
+        data = profile.to_dict()
+        assert list(data["phases"]) == ["metadata", "finalize hooks"]
+        assert data["wall"] == 3
+        assert data["cpu"] == 2
+
+    def test_hooks(self):
+        profile = BuildProfile("wheel", "standard")
+        with profile.phase("initialize hooks"), profile.hook("custom", "initialize"):
+            pass
+
+        assert [(hook["name"], hook["stage"]) for hook in profile.hooks] == [("custom", "initialize")]
+
+        lines = profile.format().splitlines()
+        assert lines[0].startswith("initialize hooks ")
+        assert lines[1].startswith("  custom ")
+        assert lines[2].startswith("total ")
+        assert lines[3] == "0 files selected, 0 bytes written"
+
+    def test_record_artifact(self, temp_dir):
+        artifact = temp_dir / "foo.whl"
+        artifact.write_bytes(b"12345")
+
+        profile = BuildProfile("wheel", "standard")
+        profile.record_artifact(str(artifact))
+
+        assert profile.bytes_written == 5
+
+
+class TestBuild:
+    def test_disabled(self, project):
+        builder = WheelBuilder(str(project))
+        with project.as_cwd():
+            artifact = next(builder.build(directory=str(project / "dist"), versions=["standard"]))
+
+        assert not os.path.exists(f"{artifact}.profile.json")
+
+    @pytest.mark.parametrize("builder_class", [WheelBuilder, SdistBuilder])
+    def test_enabled(self, project, builder_class):
+        builder = builder_class(str(project))
+        with project.as_cwd(env_vars={BuildEnvVars.PROFILE: "true"}):
+            artifact = next(builder.build(directory=str(project / "dist"), versions=["standard"]))
+
+        with open(f"{artifact}.profile.json", encoding="utf-8") as f:
+            profile = json.load(f)
+
+        assert profile["target"] == builder_class.PLUGIN_NAME
+        assert profile["version"] == "standard"
+        assert list(profile["phases"]) == list(BuildProfile.PHASES)
+        assert [(hook["name"], hook["stage"]) for hook in profile["hooks"]] == [
+            ("custom", "initialize"),
+            ("custom", "finalize"),
+        ]
+        assert profile["files"] >= 2
+        assert profile["bytes_written"] == os.path.getsize(artifact)
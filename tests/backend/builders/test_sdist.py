@@ -1,10 +1,13 @@
+import gzip
 import os
 import tarfile
+import zlib
+from io import BytesIO
 
 import pytest
 
 from hatchling.builders.plugin.interface import BuilderInterface
-from hatchling.builders.sdist import SdistBuilder
+from hatchling.builders.sdist import ParallelGzipFile, SdistBuilder
 from hatchling.builders.utils import get_reproducible_timestamp
 from hatchling.metadata.spec import DEFAULT_METADATA_VERSION, get_core_metadata_constructors
 from hatchling.utils.constants import DEFAULT_BUILD_SCRIPT, DEFAULT_CONFIG_FILE
@@ -33,6 +36,89 @@ class TestSupportLegacy:
         assert builder.config.support_legacy is builder.config.support_legacy is True
 
 
+class TestParallelCompression:
+    def test_default(self, isolation):
+        builder = SdistBuilder(str(isolation))
+
+        assert builder.config.parallel_compression is builder.config.parallel_compression is False
+
+    def test_target(self, isolation):
+        config = {"tool": {"hatch": {"build": {"targets": {"sdist": {"parallel-compression": True}}}}}}
+        builder = SdistBuilder(str(isolation), config=config)
+
+        assert builder.config.parallel_compression is True
+
+    def test_target_not_boolean(self, isolation):
+        config = {"tool": {"hatch": {"build": {"targets": {"sdist": {"parallel-compression": 9000}}}}}}
+        builder = SdistBuilder(str(isolation), config=config)
+
+        with pytest.raises(
+            TypeError, match="Field `tool.hatch.build.targets.sdist.parallel-compression` must be a boolean"
+        ):
+            _ = builder.config.parallel_compression
+
+
+class TestFastMembers:
+    def test_default(self, isolation):
+        builder = SdistBuilder(str(isolation))
+
+        assert builder.config.fast_members is builder.config.fast_members is False
+
+    def test_target(self, isolation):
+        config = {"tool": {"hatch": {"build": {"targets": {"sdist": {"fast-members": True}}}}}}
+        builder = SdistBuilder(str(isolation), config=config)
+
+        assert builder.config.fast_members is True
+
+    def test_target_not_boolean(self, isolation):
+        config = {"tool": {"hatch": {"build": {"targets": {"sdist": {"fast-members": 9000}}}}}}
+        builder = SdistBuilder(str(isolation), config=config)
+
+        with pytest.raises(TypeError, match="Field `tool.hatch.build.targets.sdist.fast-members` must be a boolean"):
+            _ = builder.config.fast_members
+
+
+class TestParallelGzipFile:
+    @staticmethod
+    def compress(data, *, workers, chunk_size=10000):
+        buffer = BytesIO()
+        gz = ParallelGzipFile(buffer, mtime=0, workers=workers)
+        for i in range(0, len(data), chunk_size):
+            gz.write(data[i : i + chunk_size])
+        gz.close()
+
+        return buffer.getvalue()
+
+    def test_single_stream(self):
+        data = os.urandom(ParallelGzipFile.BLOCK_SIZE) + b"foo" * ParallelGzipFile.BLOCK_SIZE
+
+        compressed = self.compress(data, workers=4)
+
+        assert gzip.decompress(compressed) == data
+        assert len(compressed) < len(data) // 2
+
+        # A single member, rather than concatenated ones
+        decompressor = zlib.decompressobj(31)
+        assert decompressor.decompress(compressed) == data
+        assert decompressor.eof
+        assert not decompressor.unused_data
+
+    def test_header(self):
+        buffer = BytesIO()
+        with gzip.GzipFile(fileobj=buffer, mode="wb", mtime=0) as gz:
+            gz.write(b"foo")
+
+        assert self.compress(b"foo", workers=1)[:10] == buffer.getvalue()[:10]
+
+    def test_independent_of_workers(self):
+        data = b"".join(str(i).encode() for i in range(200000))
+
+        assert self.compress(data, workers=1) == self.compress(data, workers=8)
+
+    def test_empty(self):
+        assert not gzip.decompress(self.compress(b"", workers=2))
+
+
 class TestCoreMetadataConstructor:
     def test_default(self, isolation):
         builder = SdistBuilder(str(isolation))
@@ -1542,3 +1628,45 @@ class TestBuildStandard:
         # we assert that at minimum 644 is set, based on the platform (e.g.)
         # windows it may be higher
         assert file_stat.st_mode & 0o644
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            pytest.param({"parallel-compression": True}, id="parallel-compression"),
+            pytest.param({"fast-members": True}, id="fast-members"),
+            pytest.param({"parallel-compression": True, "fast-members": True}, id="all"),
+        ],
+    )
+    def test_options_equivalent(self, hatch, temp_dir, config_file, options):
+        config_file.model.template.plugins["default"]["src-layout"] = False
+        config_file.save()
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        (project_path / "my_app" / "data.bin").write_bytes(os.urandom(1024) * 512)
+
+        def build(sdist_config):
+            config = {
+                "project": {"name": project_name, "dynamic": ["version"]},
+                "tool": {
+                    "hatch": {
+                        "version": {"path": "my_app/__about__.py"},
+                        "build": {"targets": {"sdist": {"versions": ["standard"], **sdist_config}}},
+                    },
+                },
+            }
+            builder = SdistBuilder(str(project_path), config=config)
+
+            with project_path.as_cwd():
+                artifact = next(builder.build(directory=str(temp_dir / "dist" / str(len(sdist_config)))))
+
+            with open(artifact, "rb") as f:
+                return gzip.decompress(f.read())
+
+        assert build(options) == build({})
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import errno
+import hashlib
 import os
 import platform
 import sys
@@ -10,7 +12,7 @@ import packaging.tags
 import pytest
 
 from hatchling.builders.plugin.interface import BuilderInterface
-from hatchling.builders.utils import get_known_python_major_versions
+from hatchling.builders.utils import format_file_hash, get_known_python_major_versions
 from hatchling.builders.wheel import WheelBuilder
 from hatchling.metadata.spec import DEFAULT_METADATA_VERSION, get_core_metadata_constructors
 from hatchling.utils.constants import DEFAULT_BUILD_SCRIPT
@@ -680,6 +682,110 @@ class TestBypassSelection:
             _ = builder.config.bypass_selection
 
 
+class TestStoredFiles:
+    def test_default(self, isolation):
+        builder = WheelBuilder(str(isolation))
+
+        assert builder.config.stored_spec is None
+
+    def test_correct(self, isolation):
+        config = {"tool": {"hatch": {"build": {"targets": {"wheel": {"stored-files": ["*.bin"]}}}}}}
+        builder = WheelBuilder(str(isolation), config=config)
+
+        assert builder.config.stored_spec.match_file("foo/bar.bin")
+        assert not builder.config.stored_spec.match_file("foo/bar.py")
+
+    def test_not_array(self, isolation):
+        config = {"tool": {"hatch": {"build": {"targets": {"wheel": {"stored-files": "*.bin"}}}}}}
+        builder = WheelBuilder(str(isolation), config=config)
+
+        with pytest.raises(
+            TypeError, match="Field `tool.hatch.build.targets.wheel.stored-files` must be an array of strings"
+        ):
+            _ = builder.config.stored_spec
+
+    def test_pattern_not_string(self, isolation):
+        config = {"tool": {"hatch": {"build": {"targets": {"wheel": {"stored-files": [0]}}}}}}
+        builder = WheelBuilder(str(isolation), config=config)
+
+        with pytest.raises(
+            TypeError, match="Pattern #1 in field `tool.hatch.build.targets.wheel.stored-files` must be a string"
+        ):
+            _ = builder.config.stored_spec
+
+    def test_pattern_empty_string(self, isolation):
+        config = {"tool": {"hatch": {"build": {"targets": {"wheel": {"stored-files": [""]}}}}}}
+        builder = WheelBuilder(str(isolation), config=config)
+
+        with pytest.raises(
+            ValueError,
+            match="Pattern #1 in field `tool.hatch.build.targets.wheel.stored-files` cannot be an empty string",
+        ):
+            _ = builder.config.stored_spec
+
+    @staticmethod
+    def build(project_path):
+        config = {
+            "project": {"name": "my-app", "version": "0.0.1"},
+            "tool": {
+                "hatch": {
+                    "build": {
+                        "targets": {
+                            "wheel": {"versions": ["standard"], "packages": ["my_app"], "stored-files": ["*.bin"]}
+                        }
+                    }
+                }
+            },
+        }
+        builder = WheelBuilder(str(project_path), config=config)
+        return next(builder.build(directory=str(project_path / "dist")))
+
+    @pytest.mark.parametrize("memory_mapped", [pytest.param(True, id="mmap"), pytest.param(False, id="read")])
+    @pytest.mark.parametrize("kernel_copy", [pytest.param(True, id="kernel"), pytest.param(False, id="buffered")])
+    def test_build(self, temp_dir, mocker, memory_mapped, kernel_copy):
+        if not memory_mapped:
+            mocker.patch("mmap.mmap", side_effect=OSError)
+
+        copy_function = next((name for name in ("copy_file_range", "sendfile") if hasattr(os, name)), None)
+        if kernel_copy:
+            if copy_function is None:
+                pytest.skip("Kernel copying is not supported on this platform")
+
+            copy = mocker.spy(os, copy_function)
+        else:
+            copy = mocker.patch(
+                "os.copy_file_range", side_effect=OSError(errno.EXDEV, "Cross-device link"), create=True
+            )
+
+        project_path = temp_dir / "my-app"
+        package_path = project_path / "my_app"
+        package_path.mkdir(parents=True)
+        (package_path / "__init__.py").write_text("")
+        (package_path / "empty.bin").write_bytes(b"")
+        weights = os.urandom(1024) * 1024 + b"foo"
+        (package_path / "weights.bin").write_bytes(weights)
+
+        artifact = self.build(project_path)
+
+        with zipfile.ZipFile(artifact, "r") as zip_archive:
+            assert zip_archive.testzip() is None
+
+            weights_info = zip_archive.getinfo("my_app/weights.bin")
+            assert weights_info.compress_type == zipfile.ZIP_STORED
+            assert weights_info.compress_size == len(weights)
+            assert zip_archive.read("my_app/weights.bin") == weights
+
+            assert zip_archive.getinfo("my_app/empty.bin").compress_type == zipfile.ZIP_STORED
+            assert zip_archive.read("my_app/empty.bin") == b""
+            assert zip_archive.getinfo("my_app/__init__.py").compress_type == zipfile.ZIP_DEFLATED
+
+            record = zip_archive.read("my_app-0.0.1.dist-info/RECORD").decode("utf-8")
+
+        weights_hash = format_file_hash(hashlib.sha256(weights).digest())
+        assert f"my_app/weights.bin,sha256={weights_hash},{len(weights)}" in record.splitlines()
+        assert copy.called
+
+
 class TestConstructEntryPointsFile:
     def test_default(self, isolation):
         config = {"project": {}}
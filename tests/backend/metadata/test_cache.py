@@ -0,0 +1,162 @@
+import json
+
+import pytest
+
+from hatchling.metadata.core import ProjectMetadata
+from hatchling.plugin.manager import PluginManager
+from hatchling.utils.constants import DEFAULT_BUILD_SCRIPT, MetadataEnvVars
+
+
+@pytest.fixture
+def project(temp_dir, helpers):
+    (temp_dir / "pyproject.toml").write_text(
+        helpers.dedent(
+            """
+            [project]
+            name = "foo"
+            version = "0.0.1"
+            dynamic = ["description", "dependencies"]
+
+            [tool.hatch.metadata.hooks.custom]
+            """
+        )
+    )
+    (temp_dir / "description.txt").write_text("foo")
+    (temp_dir / DEFAULT_BUILD_SCRIPT).write_text(
+        helpers.dedent(
+            """
+            import os
+
+            from hatchling.metadata.plugin.interface import MetadataHookInterface
+
+            class CustomHook(MetadataHookInterface):
+                def update(self, metadata):
+                    with open(os.path.join(self.root, 'calls.txt'), 'a', encoding='utf-8') as f:
+                        f.write('x')
+
+                    with open(os.path.join(self.root, 'description.txt'), encoding='utf-8') as f:
+                        metadata['description'] = f.read()
+
+                    metadata['dependencies'] = [os.environ.get('FOO_DEPENDENCY', 'bar')]
+                    metadata.pop('version')
+
+                def get_input_files(self):
+                    return ['description.txt']
+
+                def get_input_env_vars(self):
+                    return ['FOO_DEPENDENCY']
+            """
+        )
+    )
+
+    return temp_dir
+
+
+def get_core_metadata(project):
+    metadata = ProjectMetadata(str(project), PluginManager())
+    return metadata.core_raw_metadata if metadata.core else None
+
+
+def hook_calls(project):
+    return len((project / "calls.txt").read_text())
+
+
+class TestMetadataHookCache:
+    def test_disabled(self, project):
+        assert get_core_metadata(project)["description"] == "foo"
+        assert get_core_metadata(project)["description"] == "foo"
+        assert hook_calls(project) == 2
+
+    def test_replay(self, project):
+        cache_dir = project / "cache"
+
+        with project.as_cwd(env_vars={MetadataEnvVars.HOOK_CACHE_DIR: str(cache_dir)}):
+            first = get_core_metadata(project)
+            second = get_core_metadata(project)
+
+        assert first == second
+        assert second["description"] == "foo"
+        assert second["dependencies"] == ["bar"]
+        assert "version" not in second
+        assert hook_calls(project) == 1
+
+        cache_files = list(cache_dir.iterdir())
+        assert len(cache_files) == 1
+        assert json.loads(cache_files[0].read_text())["changes"] == {
+            "set": {"description": "foo", "dependencies": ["bar"]},
+            "removed": ["version"],
+        }
+
+    def test_input_file_changed(self, project):
+        cache_dir = project / "cache"
+
+        with project.as_cwd(env_vars={MetadataEnvVars.HOOK_CACHE_DIR: str(cache_dir)}):
+            get_core_metadata(project)
+            (project / "description.txt").write_text("bar")
+
+            assert get_core_metadata(project)["description"] == "bar"
+
+        assert hook_calls(project) == 2
+
+    def test_input_env_var_changed(self, project):
+        cache_dir = project / "cache"
+
+        with project.as_cwd(env_vars={MetadataEnvVars.HOOK_CACHE_DIR: str(cache_dir)}):
+            get_core_metadata(project)
+
+            with project.as_cwd(env_vars={"FOO_DEPENDENCY": "baz"}):
+                assert get_core_metadata(project)["dependencies"] == ["baz"]
+
+        assert hook_calls(project) == 2
+
+    def test_hook_script_changed(self, project):
+        cache_dir = project / "cache"
+
+        with project.as_cwd(env_vars={MetadataEnvVars.HOOK_CACHE_DIR: str(cache_dir)}):
+            get_core_metadata(project)
+
+            with open(project / DEFAULT_BUILD_SCRIPT, "a", encoding="utf-8") as f:
+                f.write("\n")
+
+            get_core_metadata(project)
+
+        assert hook_calls(project) == 2
+
+    def test_metadata_changed(self, project):
+        cache_dir = project / "cache"
+
+        with project.as_cwd(env_vars={MetadataEnvVars.HOOK_CACHE_DIR: str(cache_dir)}):
+            get_core_metadata(project)
+
+            project_file = project / "pyproject.toml"
+            project_file.write_text(project_file.read_text().replace("0.0.1", "0.0.2"))
+
+            get_core_metadata(project)
+
+        assert hook_calls(project) == 2
+
+    def test_inputs_not_declared(self, project, helpers):
+        cache_dir = project / "cache"
+        (project / DEFAULT_BUILD_SCRIPT).write_text(
+            helpers.dedent(
+                """
+                import os
+
+                from hatchling.metadata.plugin.interface import MetadataHookInterface
+
+                class CustomHook(MetadataHookInterface):
+                    def update(self, metadata):
+                        with open(os.path.join(self.root, 'calls.txt'), 'a', encoding='utf-8') as f:
+                            f.write('x')
+
+                        metadata['description'] = 'foo'
+                """
+            )
+        )
+
+        with project.as_cwd(env_vars={MetadataEnvVars.HOOK_CACHE_DIR: str(cache_dir)}):
+            get_core_metadata(project)
+            get_core_metadata(project)
+
+        assert hook_calls(project) == 2
+        assert not cache_dir.exists()
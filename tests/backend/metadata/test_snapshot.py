@@ -0,0 +1,184 @@
+import json
+
+import pytest
+
+from hatchling.metadata.core import ProjectMetadata
+from hatchling.metadata.snapshot import SNAPSHOT_VERSION, MetadataSnapshot
+from hatchling.plugin.manager import PluginManager
+from hatchling.utils.constants import DEFAULT_BUILD_SCRIPT, MetadataEnvVars
+
+
+@pytest.fixture
+def project(temp_dir, helpers):
+    (temp_dir / "pyproject.toml").write_text(
+        helpers.dedent(
+            """
+            [project]
+            name = "Foo"
+            readme = "README.md"
+            dynamic = ["version", "dependencies", "optional-dependencies"]
+            classifiers = ["Private :: Do Not Upload", "Framework :: Foo"]
+
+            [tool.hatch.version]
+            path = "foo/__about__.py"
+
+            [tool.hatch.metadata.hooks.custom]
+            """
+        )
+    )
+    (temp_dir / "README.md").write_text("foo")
+    (temp_dir / "LICENSE.txt").write_text("bar")
+
+    version_file = temp_dir / "foo" / "__about__.py"
+    version_file.ensure_parent_dir_exists()
+    version_file.write_text('__version__ = "1.2.3"')
+
+    (temp_dir / DEFAULT_BUILD_SCRIPT).write_text(
+        helpers.dedent(
+            """
+            import os
+
+            from hatchling.metadata.plugin.interface import MetadataHookInterface
+
+            class CustomHook(MetadataHookInterface):
+                def update(self, metadata):
+                    with open(os.path.join(self.root, 'calls.txt'), 'a', encoding='utf-8') as f:
+                        f.write('x')
+
+                    metadata['dependencies'] = ['Bar>=1']
+                    metadata['optional-dependencies'] = {'baz': ['Baz[Extra]']}
+
+                def get_known_classifiers(self):
+                    return ['Framework :: Foo']
+            """
+        )
+    )
+
+    return temp_dir
+
+
+def hook_calls(project):
+    return len((project / "calls.txt").read_text())
+
+
+class TestSnapshot:
+    def test_restore(self, project):
+        snapshot_path = str(project / "snapshot.json")
+        metadata = ProjectMetadata(str(project), PluginManager())
+        metadata.create_snapshot(snapshot_path)
+        assert hook_calls(project) == 1
+
+        restored = ProjectMetadata(str(project), PluginManager())
+        assert restored.load_snapshot(snapshot_path)
+
+        assert restored.name == "foo"
+        assert restored.version == "1.2.3"
+        assert restored.dynamic == ["version", "dependencies", "optional-dependencies"]
+        assert restored.core.name == "foo"
+        assert restored.core.raw_name == "Foo"
+        assert restored.core.version == "1.2.3"
+        assert restored.core.readme == "foo"
+        assert restored.core.requires_python == ""
+        assert not restored.core.python_constraint
+        assert restored.core.license_files == ["LICENSE.txt"]
+        assert restored.core.classifiers == ["Private :: Do Not Upload", "Framework :: Foo"]
+        assert restored.core.dependencies == ["bar>=1"]
+        assert list(restored.core.dependencies_complex) == ["bar>=1"]
+        assert str(restored.core.dependencies_complex["bar>=1"]) == "bar>=1"
+        assert restored.core.optional_dependencies == {"baz": ["baz[extra]"]}
+        assert list(restored.core.optional_dependencies_complex["baz"]) == ["baz[extra]"]
+        assert restored.core.dynamic == []
+        assert restored.core.config == metadata.core.config
+        assert hook_calls(project) == 1
+
+    def test_dynamic_version_without_hooks(self, project, helpers):
+        (project / "pyproject.toml").write_text(
+            helpers.dedent(
+                """
+                [project]
+                name = "foo"
+                dynamic = ["version"]
+
+                [tool.hatch.version]
+                path = "foo/__about__.py"
+                """
+            )
+        )
+
+        snapshot_path = str(project / "snapshot.json")
+        ProjectMetadata(str(project), PluginManager()).create_snapshot(snapshot_path)
+
+        restored = ProjectMetadata(str(project), PluginManager())
+        assert restored.load_snapshot(snapshot_path)
+        assert restored.version == "1.2.3"
+        assert restored.core.dynamic == []
+
+        restored.validate_fields()
+
+    def test_environment_variable(self, project):
+        snapshot_path = str(project / "snapshot.json")
+        ProjectMetadata(str(project), PluginManager()).create_snapshot(snapshot_path)
+
+        with project.as_cwd(env_vars={MetadataEnvVars.SNAPSHOT: snapshot_path}):
+            metadata = ProjectMetadata(str(project), PluginManager())
+
+            assert metadata.core.dependencies == ["bar>=1"]
+
+        assert hook_calls(project) == 1
+
+    @pytest.mark.parametrize("path", ["pyproject.toml", "README.md", "LICENSE.txt", "foo/__about__.py"])
+    def test_stale_source(self, project, path):
+        snapshot_path = str(project / "snapshot.json")
+        ProjectMetadata(str(project), PluginManager()).create_snapshot(snapshot_path)
+
+        with open(project / path, "a", encoding="utf-8") as f:
+            f.write("\n")
+
+        metadata = ProjectMetadata(str(project), PluginManager())
+        assert not metadata.load_snapshot(snapshot_path)
+        assert metadata.core.dependencies == ["bar>=1"]
+        assert hook_calls(project) == 2
+
+    def test_removed_source(self, project):
+        snapshot_path = str(project / "snapshot.json")
+        ProjectMetadata(str(project), PluginManager()).create_snapshot(snapshot_path)
+
+        (project / "LICENSE.txt").unlink()
+
+        assert not ProjectMetadata(str(project), PluginManager()).load_snapshot(snapshot_path)
+
+    def test_other_root(self, project):
+        snapshot_path = str(project / "snapshot.json")
+        ProjectMetadata(str(project), PluginManager()).create_snapshot(snapshot_path)
+
+        other_root = project / "other"
+        other_root.mkdir()
+
+        assert not ProjectMetadata(str(other_root), PluginManager()).load_snapshot(snapshot_path)
+
+    @pytest.mark.parametrize(
+        ("key", "value"),
+        [
+            pytest.param("format", SNAPSHOT_VERSION + 1, id="format"),
+            pytest.param("hatchling", "0.0.0", id="hatchling"),
+        ],
+    )
+    def test_incompatible(self, project, key, value):
+        snapshot_path = project / "snapshot.json"
+        ProjectMetadata(str(project), PluginManager()).create_snapshot(str(snapshot_path))
+
+        data = json.loads(snapshot_path.read_text())
+        data[key] = value
+        snapshot_path.write_text(json.dumps(data))
+
+        assert MetadataSnapshot.load(str(snapshot_path)) is None
+        assert not ProjectMetadata(str(project), PluginManager()).load_snapshot(str(snapshot_path))
+
+    def test_invalid(self, project):
+        snapshot_path = project / "snapshot.json"
+        snapshot_path.write_text("{")
+
+        assert MetadataSnapshot.load(str(snapshot_path)) is None
+
+    def test_missing(self, project):
+        assert MetadataSnapshot.load(str(project / "snapshot.json")) is None
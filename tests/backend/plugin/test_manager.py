@@ -0,0 +1,179 @@
+import sys
+
+import pytest
+
+from hatchling.plugin.manager import EntryPointIndex, PluginManager
+
+BUILDER_MODULE = """\
+from hatchling.builders.plugin.interface import BuilderInterface
+from hatchling.plugin import hookimpl
+
+
+class FooBuilder(BuilderInterface):
+    PLUGIN_NAME = "foo"
+
+
+@hookimpl
+def hatch_register_builder():
+    return FooBuilder
+"""
+
+BUILD_HOOK_MODULE = """\
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+from hatchling.plugin import hookimpl
+
+
+class BarBuildHook(BuildHookInterface):
+    PLUGIN_NAME = "bar"
+
+
+class BazBuildHook(BuildHookInterface):
+    PLUGIN_NAME = "baz"
+
+
+@hookimpl
+def hatch_register_build_hook():
+    return [BarBuildHook, BazBuildHook]
+"""
+
+
+@pytest.fixture
+def plugins(temp_dir, monkeypatch):
+    site_packages = temp_dir / "site-packages"
+    site_packages.mkdir()
+    modules = {"hatch_foo_plugin": BUILDER_MODULE, "hatch_bar_plugin": BUILD_HOOK_MODULE}
+    for module_name, contents in modules.items():
+        site_packages.joinpath(f"{module_name}.py").write_text(contents)
+
+        dist_name = module_name.removesuffix("_plugin").replace("_", "-")
+        dist_info = site_packages / f"{dist_name.replace('-', '_')}-1.0.dist-info"
+        dist_info.mkdir()
+        dist_info.joinpath("METADATA").write_text(f"Metadata-Version: 2.1\nName: {dist_name}\nVersion: 1.0\n")
+        dist_info.joinpath("entry_points.txt").write_text(f"[hatch]\n{dist_name}={module_name}\n")
+
+    monkeypatch.syspath_prepend(str(site_packages))
+    monkeypatch.setattr(EntryPointIndex, "_memory", {})
+    yield modules
+
+    for module_name in modules:
+        sys.modules.pop(module_name, None)
+
+
+def unload(modules):
+    for module_name in modules:
+        sys.modules.pop(module_name, None)
+
+
+class TestThirdPartyPlugins:
+    @pytest.mark.usefixtures("plugins")
+    def test_get(self):
+        plugin_manager = PluginManager()
+
+        builder = plugin_manager.builder.get("foo")
+
+        assert builder is not None
+        assert builder.__name__ == "FooBuilder"
+        assert not plugin_manager.third_party_plugins.loaded
+
+    def test_get_builtin_does_not_import(self, plugins):
+        plugin_manager = PluginManager()
+
+        assert plugin_manager.builder.get("wheel") is not None
+        assert not any(module_name in sys.modules for module_name in plugins)
+
+    @pytest.mark.usefixtures("plugins")
+    def test_collect(self):
+        plugin_manager = PluginManager()
+
+        classes = plugin_manager.build_hook.collect()
+
+        assert {"bar", "baz", "custom", "version"} <= set(classes)
+
+    @pytest.mark.usefixtures("plugins")
+    def test_unknown(self):
+        plugin_manager = PluginManager()
+
+        assert plugin_manager.build_hook.get("unknown") is None
+
+    def test_load(self, plugins):
+        plugin_manager = PluginManager()
+        plugin_manager.third_party_plugins.load()
+
+        assert plugin_manager.third_party_plugins.loaded
+        assert all(module_name in sys.modules for module_name in plugins)
+        assert plugin_manager.builder.get("foo") is not None
+
+
+class TestEntryPointIndex:
+    @pytest.mark.usefixtures("plugins")
+    def test_no_cache_by_default(self, temp_dir, monkeypatch):
+        monkeypatch.delenv("HATCH_PLUGIN_CACHE_DIR", raising=False)
+        PluginManager().builder.get("foo")
+
+        assert not list(temp_dir.glob("**/*.json"))
+
+    def test_cached(self, plugins, temp_dir, monkeypatch):
+        cache_dir = temp_dir / "cache"
+        monkeypatch.setenv("HATCH_PLUGIN_CACHE_DIR", str(cache_dir))
+
+        plugin_manager = PluginManager()
+        plugin_manager.third_party_plugins.load()
+
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+        # Simulate a new process
+        unload(plugins)
+        monkeypatch.setattr(EntryPointIndex, "_memory", {})
+
+        def fail(**kwargs):
+            raise AssertionError(kwargs)
+
+        monkeypatch.setattr("importlib.metadata.entry_points", fail)
+
+        plugin_manager = PluginManager()
+        build_hook = plugin_manager.build_hook.get("baz")
+
+        assert build_hook is not None
+        assert build_hook.__name__ == "BazBuildHook"
+        assert "hatch_bar_plugin" in sys.modules
+        assert "hatch_foo_plugin" not in sys.modules
+
+    def test_cache_unknown_plugin(self, plugins, temp_dir, monkeypatch):
+        cache_dir = temp_dir / "cache"
+        monkeypatch.setenv("HATCH_PLUGIN_CACHE_DIR", str(cache_dir))
+
+        PluginManager().third_party_plugins.load()
+
+        unload(plugins)
+        monkeypatch.setattr(EntryPointIndex, "_memory", {})
+
+        plugin_manager = PluginManager()
+
+        assert plugin_manager.build_hook.get("unknown") is None
+        assert not any(module_name in sys.modules for module_name in plugins)
+
+    @pytest.mark.usefixtures("plugins")
+    def test_fingerprint_changes(self, temp_dir, monkeypatch):
+        cache_dir = temp_dir / "cache"
+        monkeypatch.setenv("HATCH_PLUGIN_CACHE_DIR", str(cache_dir))
+
+        PluginManager().third_party_plugins.load()
+
+        monkeypatch.setattr(EntryPointIndex, "_memory", {})
+        monkeypatch.syspath_prepend(str(temp_dir / "other"))
+        PluginManager().third_party_plugins.load()
+
+        assert len(list(cache_dir.glob("*.json"))) == 2
+
+    def test_corrupt_cache(self, plugins, temp_dir, monkeypatch):
+        cache_dir = temp_dir / "cache"
+        monkeypatch.setenv("HATCH_PLUGIN_CACHE_DIR", str(cache_dir))
+
+        PluginManager().third_party_plugins.load()
+        (cache_file,) = cache_dir.glob("*.json")
+        cache_file.write_text("{")
+
+        unload(plugins)
+        monkeypatch.setattr(EntryPointIndex, "_memory", {})
+
+        assert PluginManager().builder.get("foo") is not None
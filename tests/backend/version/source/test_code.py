@@ -125,3 +125,144 @@ def test_search_paths(temp_dir, helpers):
 
     with temp_dir.as_cwd():
         assert source.get_version_data()["version"] == "1.0.0.1.dev0"
+
+
+class TestVersionInputs:
+    def test_not_cached(self, temp_dir):
+        source = CodeSource(str(temp_dir), {"path": "a/b.py", "static": True})
+
+        file_path = temp_dir / "a" / "b.py"
+        file_path.ensure_parent_dir_exists()
+        file_path.write_text('__version__ = "0.0.1"')
+
+        assert source.get_version_inputs() is None
+
+
+class TestStatic:
+    def test_not_boolean(self, temp_dir):
+        source = CodeSource(str(temp_dir), {"path": "a/b.py", "static": "true"})
+
+        file_path = temp_dir / "a" / "b.py"
+        file_path.ensure_parent_dir_exists()
+        file_path.touch()
+
+        with pytest.raises(TypeError, match="option `static` must be a boolean"):
+            source.get_version_data()
+
+    def test_not_executed(self, temp_dir, helpers):
+        source = CodeSource(str(temp_dir), {"path": "a/b.py", "static": True})
+
+        file_path = temp_dir / "a" / "b.py"
+        file_path.ensure_parent_dir_exists()
+        file_path.write_text(
+            helpers.dedent(
+                """
+                import nonexistent_module
+
+                __version__ = "0.0.1"
+
+                raise RuntimeError
+                """
+            )
+        )
+
+        assert source.get_version_data()["version"] == "0.0.1"
+
+    def test_simple_expressions(self, temp_dir, helpers):
+        source = CodeSource(str(temp_dir), {"path": "a/b.py", "static": True})
+
+        file_path = temp_dir / "a" / "b.py"
+        file_path.ensure_parent_dir_exists()
+        file_path.write_text(
+            helpers.dedent(
+                """
+                MAJOR = 1
+                MINOR: int = 2
+                __version_info__ = (MAJOR, MINOR, 3)
+                SUFFIX = "rc" + "1"
+                __version__ = f"{MAJOR}.{MINOR}.{__version_info__[2]}"
+                __version__ += SUFFIX
+                """
+            )
+        )
+
+        assert source.get_version_data()["version"] == "1.2.3rc1"
+
+    def test_custom_expression(self, temp_dir):
+        source = CodeSource(str(temp_dir), {"path": "a/b.py", "expression": "VERSIONS[-1]", "static": True})
+
+        file_path = temp_dir / "a" / "b.py"
+        file_path.ensure_parent_dir_exists()
+        file_path.write_text('import os\nVERSIONS = ["0.0.1", "0.0.2"]')
+
+        assert source.get_version_data()["version"] == "0.0.2"
+
+    def test_fallback_call(self, temp_dir, helpers):
+        source = CodeSource(str(temp_dir), {"path": "a/b.py", "static": True})
+
+        file_path = temp_dir / "a" / "b.py"
+        file_path.ensure_parent_dir_exists()
+        file_path.write_text(
+            helpers.dedent(
+                """
+                __version_info__ = (1, 0, 0)
+                __version__ = '.'.join(str(part) for part in __version_info__)
+                """
+            )
+        )
+
+        assert source.get_version_data()["version"] == "1.0.0"
+
+    def test_fallback_conditional(self, temp_dir, helpers):
+        source = CodeSource(str(temp_dir), {"path": "a/b.py", "static": True})
+
+        file_path = temp_dir / "a" / "b.py"
+        file_path.ensure_parent_dir_exists()
+        file_path.write_text(
+            helpers.dedent(
+                """
+                __version__ = "0.0.1"
+
+                if True:
+                    __version__ = "0.0.2"
+                """
+            )
+        )
+
+        assert source.get_version_data()["version"] == "0.0.2"
+
+    def test_fallback_import(self, temp_dir):
+        source = CodeSource(str(temp_dir), {"path": "static_pkg/b.py", "static": True, "search-paths": ["."]})
+
+        parent_dir = temp_dir / "static_pkg"
+        parent_dir.mkdir()
+        (parent_dir / "__init__.py").touch()
+        (parent_dir / "c.py").write_text('__version__ = "0.0.2"')
+        (parent_dir / "b.py").write_text('__version__ = "0.0.1"\nfrom static_pkg.c import __version__')
+
+        with temp_dir.as_cwd():
+            assert source.get_version_data()["version"] == "0.0.2"
+
+    def test_fallback_wildcard_import(self, temp_dir):
+        source = CodeSource(
+            str(temp_dir),
+            {"path": "static_wildcard_pkg/b.py", "expression": "VERSION", "static": True, "search-paths": ["."]},
+        )
+
+        parent_dir = temp_dir / "static_wildcard_pkg"
+        parent_dir.mkdir()
+        (parent_dir / "__init__.py").touch()
+        (parent_dir / "c.py").write_text('VERSION = "0.0.2"')
+        (parent_dir / "b.py").write_text('VERSION = "0.0.1"\nfrom static_wildcard_pkg.c import *')
+
+        with temp_dir.as_cwd():
+            assert source.get_version_data()["version"] == "0.0.2"
+
+    def test_fallback_not_string(self, temp_dir):
+        source = CodeSource(str(temp_dir), {"path": "a/b.py", "expression": "VERSION", "static": True})
+
+        file_path = temp_dir / "a" / "b.py"
+        file_path.ensure_parent_dir_exists()
+        file_path.write_text("VERSION = 1\nVERSION = str(VERSION)")
+
+        assert source.get_version_data()["version"] == "1"
@@ -117,3 +117,19 @@ def test_set_default_pattern(temp_dir, helpers, variable, quote, prefix):
     with temp_dir.as_cwd():
         source.set_version("foo", source.get_version_data())
         assert source.get_version_data()["version"] == "foo"
+
+
+class TestVersionInputs:
+    def test_no_path(self, temp_dir):
+        assert RegexSource(str(temp_dir), {}).get_version_inputs() is None
+
+    def test_file_digest(self, temp_dir):
+        source = RegexSource(str(temp_dir), {"path": "a/b"})
+
+        file_path = temp_dir / "a" / "b"
+        file_path.ensure_parent_dir_exists()
+        file_path.write_text('__version__ = "0.0.1"')
+        inputs = source.get_version_inputs()
+
+        file_path.write_text('__version__ = "0.0.2"')
+        assert source.get_version_inputs() != inputs
@@ -0,0 +1,84 @@
+import json
+
+from hatchling.metadata.core import HatchVersionConfig
+from hatchling.plugin.manager import PluginManager
+from hatchling.utils.constants import VersionEnvVars
+from hatchling.version.cache import VersionCache
+from hatchling.version.source.env import EnvSource
+from hatchling.version.source.regex import RegexSource
+
+
+def get_version(root, config):
+    return HatchVersionConfig(str(root), config, PluginManager()).cached
+
+
+class TestVersionCache:
+    def test_disabled(self, temp_dir):
+        assert VersionCache.from_environment(str(temp_dir), RegexSource(str(temp_dir), {"path": "a.py"})) is None
+
+    def test_source_not_cacheable(self, temp_dir):
+        cache_dir = temp_dir / "cache"
+        source = EnvSource(str(temp_dir), {"variable": "FOO"})
+
+        with temp_dir.as_cwd(env_vars={VersionEnvVars.CACHE_DIR: str(cache_dir)}):
+            assert VersionCache.from_environment(str(temp_dir), source) is None
+
+    def test_inputs_error(self, temp_dir):
+        cache_dir = temp_dir / "cache"
+        source = RegexSource(str(temp_dir), {"path": "a.py"})
+
+        with temp_dir.as_cwd(env_vars={VersionEnvVars.CACHE_DIR: str(cache_dir)}):
+            assert VersionCache.from_environment(str(temp_dir), source) is None
+
+    def test_reuse(self, temp_dir):
+        cache_dir = temp_dir / "cache"
+        version_file = temp_dir / "a.py"
+        version_file.write_text('__version__ = "1.2.3"')
+
+        with temp_dir.as_cwd(env_vars={VersionEnvVars.CACHE_DIR: str(cache_dir)}):
+            assert get_version(temp_dir, {"path": "a.py"}) == "1.2.3"
+
+            cache_files = list(cache_dir.iterdir())
+            assert len(cache_files) == 1
+
+            # Prove that the version source is bypassed
+            data = json.loads(cache_files[0].read_text())
+            data["version"] = "9000"
+            cache_files[0].write_text(json.dumps(data))
+
+            assert get_version(temp_dir, {"path": "a.py"}) == "9000"
+
+    def test_input_changed(self, temp_dir):
+        cache_dir = temp_dir / "cache"
+        version_file = temp_dir / "a.py"
+        version_file.write_text('__version__ = "1.2.3"')
+
+        with temp_dir.as_cwd(env_vars={VersionEnvVars.CACHE_DIR: str(cache_dir)}):
+            assert get_version(temp_dir, {"path": "a.py"}) == "1.2.3"
+
+            version_file.write_text('__version__ = "1.2.4"')
+            assert get_version(temp_dir, {"path": "a.py"}) == "1.2.4"
+
+    def test_config_changed(self, temp_dir):
+        cache_dir = temp_dir / "cache"
+        version_file = temp_dir / "a.py"
+        version_file.write_text('__version__ = "1.2.3"\nVERSION = "4.5.6"')
+
+        with temp_dir.as_cwd(env_vars={VersionEnvVars.CACHE_DIR: str(cache_dir)}):
+            assert get_version(temp_dir, {"path": "a.py"}) == "1.2.3"
+            assert get_version(temp_dir, {"path": "a.py", "pattern": r"VERSION = \"(?P<version>[^\"]+)\""}) == "4.5.6"
+
+    def test_corrupt(self, temp_dir):
+        cache_dir = temp_dir / "cache"
+        version_file = temp_dir / "a.py"
+        version_file.write_text('__version__ = "1.2.3"')
+
+        with temp_dir.as_cwd(env_vars={VersionEnvVars.CACHE_DIR: str(cache_dir)}):
+            cache = VersionCache.from_environment(str(temp_dir), RegexSource(str(temp_dir), {"path": "a.py"}))
+            cache_dir.mkdir()
+            with open(cache.path, "w", encoding="utf-8") as f:
+                f.write("{")
+
+            assert cache.get() is None
+            assert get_version(temp_dir, {"path": "a.py"}) == "1.2.3"
+            assert cache.get() == "1.2.3"
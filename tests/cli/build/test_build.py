@@ -324,6 +324,29 @@ def test_default(hatch, temp_dir, helpers):
     )
 
 
+@pytest.mark.requires_internet
+def test_profile(hatch, temp_dir):
+    project_name = "My.App"
+
+    with temp_dir.as_cwd():
+        result = hatch("new", project_name)
+        assert result.exit_code == 0, result.output
+
+    path = temp_dir / "my-app"
+
+    with path.as_cwd():
+        result = hatch("build", "--profile")
+        assert result.exit_code == 0, result.output
+
+    build_directory = path / "dist"
+    profiles = sorted(artifact.name for artifact in build_directory.iterdir() if artifact.name.endswith(".json"))
+    artifacts = sorted(artifact.name for artifact in build_directory.iterdir() if not artifact.name.endswith(".json"))
+    assert profiles == [f"{artifact}.profile.json" for artifact in artifacts]
+
+    assert result.output.count("archive writing") == 2
+    assert result.output.count("files selected") == 2
+
+
 @pytest.mark.requires_internet
 def test_explicit_targets(hatch, temp_dir, helpers):
     project_name = "My.App"
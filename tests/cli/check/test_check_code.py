@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import os
+import subprocess
+
 import pytest
 
 from hatch.config.constants import ConfigEnvVars
@@ -458,3 +461,170 @@ class TestExtendInjection:
         internal_content = user_config.read_text()
         assert internal_content.count("extend") == 1
         assert existing_extend in internal_content
+
+
+class TestChanged:
+    @pytest.mark.parametrize(
+        ("option", "base"),
+        [
+            (["--changed"], "HEAD"),
+            (["--since", "origin/main"], "origin/main"),
+        ],
+    )
+    def test_selection(self, hatch, temp_dir, config_file, env_run, mocker, platform, option, base):
+        config_file.model.template.plugins["default"]["tests"] = False
+        config_file.save()
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        data_path = temp_dir / "data"
+        data_path.mkdir()
+
+        config_dir = data_path / "env" / ".internal" / "hatch-check-code" / ".config" / project_path.id
+        user_config = config_dir / "pyproject.toml"
+        user_config_path = platform.join_command_args([str(user_config)])
+
+        (project_path / "src" / "my_app" / "foo.py").touch()
+        git_commands = []
+
+        def run(command, **kwargs):
+            if kwargs.get("shell"):
+                return mocker.DEFAULT
+
+            # The executable is resolved to an absolute path on Windows
+            git_commands.append(command[1:])
+            if command[1] == "diff":
+                return subprocess.CompletedProcess(
+                    command, 0, stdout=b"src/my_app/__about__.py\nsrc/my_app/deleted.py\nREADME.md\n"
+                )
+
+            return subprocess.CompletedProcess(command, 0, stdout=b"src/my_app/foo.py\n")
+
+        env_run.side_effect = run
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch("check", "code", *option)
+
+        assert result.exit_code == 0, result.output
+        assert not result.output
+
+        assert git_commands == [
+            ["diff", "--name-only", "--relative", base],
+            ["ls-files", "--others", "--exclude-standard"],
+        ]
+        assert [call for call in env_run.call_args_list if call.kwargs.get("shell")] == [
+            mocker.call(
+                f"ruff check --config {user_config_path} --force-exclude src/my_app/__about__.py src/my_app/foo.py",
+                shell=True,
+            ),
+        ]
+
+    def test_no_changes(self, hatch, helpers, temp_dir, config_file, env_run):
+        config_file.model.template.plugins["default"]["tests"] = False
+        config_file.save()
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        data_path = temp_dir / "data"
+        data_path.mkdir()
+
+        env_run.side_effect = lambda command, **_: subprocess.CompletedProcess(command, 0, stdout=b"README.md\n")
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch("check", "code", "--changed")
+
+        assert result.exit_code == 0, result.output
+        assert result.output == helpers.dedent(
+            """
+            No changed files to process
+            """
+        )
+
+        assert not [call for call in env_run.call_args_list if call.kwargs.get("shell")]
+
+
+class TestConfigWrite:
+    @pytest.mark.usefixtures("env_run")
+    def test_unchanged_config_not_rewritten(self, hatch, temp_dir, config_file, defaults_file_stable):
+        config_file.model.template.plugins["default"]["tests"] = False
+        config_file.save()
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        data_path = temp_dir / "data"
+        data_path.mkdir()
+
+        config_dir = data_path / "env" / ".internal" / "hatch-check-code" / ".config" / project_path.id
+        default_config = config_dir / "ruff_defaults.toml"
+        user_config = config_dir / "pyproject.toml"
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch("check", "code")
+
+        assert result.exit_code == 0, result.output
+        assert default_config.read_text() == defaults_file_stable
+
+        for path in (default_config, user_config):
+            os.utime(path, (0, 0))
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch("check", "code")
+
+        assert result.exit_code == 0, result.output
+        assert default_config.stat().st_mtime == 0
+        assert user_config.stat().st_mtime == 0
+
+    @pytest.mark.usefixtures("env_run")
+    def test_generation_cached(self, hatch, temp_dir, config_file, mocker, defaults_file_stable):
+        from hatch.cli.fmt.core import StaticAnalysisEnvironment
+
+        config_file.model.template.plugins["default"]["tests"] = False
+        config_file.save()
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        data_path = temp_dir / "data"
+        data_path.mkdir()
+
+        config_dir = data_path / "env" / ".internal" / "hatch-check-code" / ".config" / project_path.id
+        default_config = config_dir / "ruff_defaults.toml"
+        generate = mocker.spy(StaticAnalysisEnvironment, "_generate_config_file")
+
+        for _ in range(2):
+            with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+                result = hatch("check", "code")
+
+            assert result.exit_code == 0, result.output
+
+        assert generate.call_count == 1
+        assert default_config.read_text() == defaults_file_stable
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch("check", "code", "--preview")
+
+        assert result.exit_code == 0, result.output
+        assert generate.call_count == 2
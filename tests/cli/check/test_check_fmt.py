@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import subprocess
+
 import pytest
 
 from hatch.config.constants import ConfigEnvVars
@@ -233,6 +235,48 @@ class TestArguments:
         assert default_config.read_text() == defaults_file_stable
 
 
+class TestChanged:
+    def test_selection(self, hatch, temp_dir, config_file, env_run, mocker, platform):
+        config_file.model.template.plugins["default"]["tests"] = False
+        config_file.save()
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        data_path = temp_dir / "data"
+        data_path.mkdir()
+
+        config_dir = data_path / "env" / ".internal" / "hatch-check-fmt" / ".config" / project_path.id
+        user_config = config_dir / "pyproject.toml"
+        user_config_path = platform.join_command_args([str(user_config)])
+
+        def run(command, **kwargs):
+            if kwargs.get("shell"):
+                return mocker.DEFAULT
+
+            if command[1] == "diff":
+                return subprocess.CompletedProcess(command, 0, stdout=b"src/my_app/__about__.py\nREADME.md\n")
+
+            return subprocess.CompletedProcess(command, 0, stdout=b"")
+
+        env_run.side_effect = run
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch("check", "fmt", "--fix", "--since", "origin/main")
+
+        assert result.exit_code == 0, result.output
+        assert not result.output
+
+        assert [call for call in env_run.call_args_list if call.kwargs.get("shell")] == [
+            mocker.call(f"ruff format --config {user_config_path} --force-exclude src/my_app/__about__.py", shell=True),
+        ]
+
+
 class TestConfigPath:
     @pytest.mark.usefixtures("env_run")
     def test_sync_without_config(self, hatch, helpers, temp_dir, config_file):
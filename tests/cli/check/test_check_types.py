@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+
 import pytest
 
 from hatch.config.constants import ConfigEnvVars
@@ -146,6 +148,58 @@ class TestGeneratedConfig:
         assert config["preset"] == "legacy"
         assert config["disable-search-path-heuristics"] is True
 
+    @pytest.mark.usefixtures("env_run")
+    def test_cached_until_layout_changes(self, hatch, temp_dir, config_file, mocker):
+        from hatch.cli.types.core import TypeCheckEnvironment
+
+        config_file.model.template.plugins["default"]["tests"] = False
+        config_file.save()
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        data_path = temp_dir / "data"
+        data_path.mkdir()
+
+        generate = mocker.spy(TypeCheckEnvironment, "_generate_config_file")
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch("check", "types")
+
+        assert result.exit_code == 0, result.output
+        assert generate.call_count == 1
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch("check", "types")
+
+        assert result.exit_code == 0, result.output
+        assert generate.call_count == 1
+
+        source_dir = project_path / "src"
+        new_package = source_dir / "other"
+        new_package.mkdir()
+        (new_package / "__init__.py").touch()
+        # Guarantee a distinct modification time on file systems with a coarse resolution
+        mtime_ns = source_dir.stat().st_mtime_ns + 10**9
+        os.utime(source_dir, ns=(mtime_ns, mtime_ns))
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch("check", "types")
+
+        assert result.exit_code == 0, result.output
+        assert generate.call_count == 2
+
+        config = load_toml_data(next(data_path.rglob("pyrefly.toml")).read_text())
+        assert sorted(config["project-includes"]) == [
+            f"{project_path.as_posix()}/src/my_app",
+            f"{project_path.as_posix()}/src/other",
+        ]
+
 
 class TestExistingConfig:
     @pytest.mark.usefixtures("env_run")
@@ -257,6 +257,23 @@ def test_specific_location(hatch, helpers, temp_dir_data, path_append, dist_name
     path_append.assert_not_called()
 
 
+def test_archives_cached(hatch, temp_dir_data, temp_dir_cache, path_append, dist_name, mocker):
+    dist_dir = temp_dir_data / "data" / "pythons" / dist_name
+    python_path = dist_dir / get_distribution(dist_name).python_path
+    install = mocker.patch(
+        "hatch.python.core.PythonManager.install",
+        autospec=True,
+        return_value=mocker.MagicMock(path=dist_dir, python_path=python_path),
+    )
+
+    result = hatch("python", "install", "--private", dist_name)
+
+    assert result.exit_code == 0, result.output
+    manager = install.call_args[0][0]
+    assert manager.cache_dir == temp_dir_cache / "cache" / "python"
+    path_append.assert_not_called()
+
+
 def test_all(hatch, temp_dir_data, path_append, default_shells, mocker, compatible_python_distributions):
     mocked_dists = []
     for name in compatible_python_distributions:
@@ -264,7 +281,9 @@ def test_all(hatch, temp_dir_data, path_append, default_shells, mocker, compatib
         python_path = dist_dir / get_distribution(name).python_path
         mocked_dists.append(mocker.MagicMock(path=dist_dir, python_path=python_path))
 
-    install = mocker.patch("hatch.python.core.PythonManager.install", side_effect=mocked_dists)
+    # Installations run concurrently so return values cannot depend on the call order
+    mocked_dists_by_name = dict(zip(compatible_python_distributions, mocked_dists, strict=True))
+    install = mocker.patch("hatch.python.core.PythonManager.install", side_effect=mocked_dists_by_name.get)
 
     result = hatch("python", "install", "all")
 
@@ -284,7 +303,7 @@ def test_all(hatch, temp_dir_data, path_append, default_shells, mocker, compatib
 
     assert result.output == "\n".join(expected_lines)
 
-    assert install.call_args_list == [mocker.call(name) for name in compatible_python_distributions]
+    assert sorted(install.call_args_list) == sorted(mocker.call(name) for name in compatible_python_distributions)
     assert path_append.call_args_list == [
         mocker.call(str(dist.python_path.parent), shells=default_shells) for dist in mocked_dists
     ]
@@ -73,7 +73,9 @@ def test_all(hatch, helpers, temp_dir_data, path_append, mocker):
         python_path = dist_dir / metadata["python_path"]
         mocked_dists.append(mocker.MagicMock(path=dist_dir, python_path=python_path))
 
-    install = mocker.patch("hatch.python.core.PythonManager.install", side_effect=mocked_dists)
+    # Installations run concurrently so return values cannot depend on the call order
+    mocked_dists_by_name = dict(zip(installed_distributions, mocked_dists, strict=True))
+    install = mocker.patch("hatch.python.core.PythonManager.install", side_effect=mocked_dists_by_name.get)
 
     result = hatch("python", "update", "all")
 
@@ -86,5 +88,5 @@ def test_all(hatch, helpers, temp_dir_data, path_append, mocker):
 
     assert result.output == "\n".join(expected_lines)
 
-    assert install.call_args_list == [mocker.call(name) for name in installed_distributions]
+    assert sorted(install.call_args_list) == sorted(mocker.call(name) for name in installed_distributions)
     path_append.assert_not_called()
@@ -1,3 +1,4 @@
+import json
 import os
 import signal
 import sys
@@ -2674,3 +2675,39 @@ class TestScriptRunner:
         executable = Path(output_file.read_text())
         assert executable.is_file()
         assert data_path in executable.parents
+
+
+def test_trace(hatch, helpers, temp_dir, config_file):
+    config_file.model.template.plugins["default"]["tests"] = False
+    config_file.save()
+
+    project_name = "My.App"
+
+    with temp_dir.as_cwd():
+        result = hatch("new", project_name)
+
+    assert result.exit_code == 0, result.output
+
+    project_path = temp_dir / "my-app"
+    data_path = temp_dir / "data"
+    data_path.mkdir()
+    trace_file = temp_dir / "trace.json"
+
+    project = Project(project_path)
+    helpers.update_project_environment(project, "default", {"skip-install": True, **project.config.envs["default"]})
+
+    with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+        result = hatch("--trace", str(trace_file), "--trace-format", "json", "run", "python", "-c", "pass")
+
+    assert result.exit_code == 0, result.output
+
+    trace = {node["name"]: node for node in json.loads(trace_file.read_text())}
+    assert "Load configuration" in trace
+    assert "Load environment: default" in trace
+    assert "Check compatibility: default" in trace
+    assert [node["name"] for node in trace["Prepare environment: default"]["children"]] == [
+        "Creation",
+        "Dependency state check",
+        "Dependency installation check",
+    ]
+    assert trace["Run command: python -c pass"]["attributes"] == {"source": "cmd"}
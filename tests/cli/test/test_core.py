@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+
+
+def write_coverage_data(path, measurements):
+    connection = sqlite3.connect(str(path))
+    try:
+        connection.executescript(
+            """
+            CREATE TABLE file (id integer primary key, path text, unique (path));
+            CREATE TABLE context (id integer primary key, context text, unique (context));
+            CREATE TABLE line_bits (file_id integer, context_id integer, numbits blob);
+            CREATE TABLE arc (file_id integer, context_id integer, fromno integer, tono integer);
+            """
+        )
+        for file_path, contexts in measurements.items():
+            file_id = connection.execute("INSERT INTO file (path) VALUES (?)", (file_path,)).lastrowid
+            for context in contexts:
+                connection.execute("INSERT OR IGNORE INTO context (context) VALUES (?)", (context,))
+                (context_id,) = connection.execute("SELECT id FROM context WHERE context = ?", (context,)).fetchone()
+                connection.execute("INSERT INTO arc VALUES (?, ?, 1, 2)", (file_id, context_id))
+
+        connection.commit()
+    finally:
+        connection.close()
+
+
+class TestSplitTestArguments:
+    def test_paths(self, temp_dir):
+        from hatch.cli.test.core import split_test_arguments
+
+        (temp_dir / "tests").mkdir()
+        (temp_dir / "tests" / "test_foo.py").touch()
+
+        with temp_dir.as_cwd():
+            assert split_test_arguments(["-x", "tests/test_foo.py::test_bar", "tests", "foo"]) == (
+                ["-x", "foo"],
+                ["tests/test_foo.py::test_bar", "tests"],
+            )
+
+    def test_option_values(self, temp_dir):
+        from hatch.cli.test.core import split_test_arguments
+
+        (temp_dir / "tests").mkdir()
+        (temp_dir / "tests" / "pytest.ini").touch()
+
+        with temp_dir.as_cwd():
+            assert split_test_arguments(["--rootdir", "tests", "-c", "tests/pytest.ini", "-v", "tests"]) == (
+                ["--rootdir", "tests", "-c", "tests/pytest.ini", "-v"],
+                ["tests"],
+            )
+
+    def test_inline_option_values(self, temp_dir):
+        from hatch.cli.test.core import split_test_arguments
+
+        (temp_dir / "tests").mkdir()
+
+        with temp_dir.as_cwd():
+            assert split_test_arguments(["--rootdir=tests", "tests"]) == (["--rootdir=tests"], ["tests"])
+
+
+class TestPartitionTestFiles:
+    def test_no_durations(self):
+        from hatch.cli.test.core import partition_test_files
+
+        assert partition_test_files({"env": ["a", "b", "c"]}, {}, 2) == [{"env": ["a", "c"]}, {"env": ["b"]}]
+
+    def test_longest_first(self):
+        from hatch.cli.test.core import partition_test_files
+
+        env_test_files = {"env1": ["a", "b", "c"], "env2": ["a", "d"]}
+        env_durations = {"env1": {"a::test1": 3.0, "a::test2": 3.0, "b::test": 2.0}}
+
+        assert partition_test_files(env_test_files, env_durations, 2) == [
+            {"env1": ["a"], "env2": ["d"]},
+            {"env1": ["b", "c"], "env2": ["a"]},
+        ]
+
+    def test_empty_shards(self):
+        from hatch.cli.test.core import partition_test_files
+
+        assert partition_test_files({"env": ["a"]}, {}, 3) == [{"env": ["a"]}, {}, {}]
+
+
+class TestCoverageDataFile:
+    def test_default(self, temp_dir):
+        from hatch.cli.test.core import PatchedCoverageConfig
+
+        assert PatchedCoverageConfig(temp_dir, temp_dir / "data").data_file == temp_dir / ".coverage"
+
+    def test_pyproject(self, temp_dir):
+        from hatch.cli.test.core import PatchedCoverageConfig
+
+        (temp_dir / "pyproject.toml").write_text('[tool.coverage.run]\ndata_file = "build/.coverage"\n')
+
+        assert PatchedCoverageConfig(temp_dir, temp_dir / "data").data_file == temp_dir / "build" / ".coverage"
+
+    def test_coveragerc(self, temp_dir):
+        from hatch.cli.test.core import PatchedCoverageConfig
+
+        (temp_dir / ".coveragerc").write_text("[run]\ndata_file = build/.coverage\n")
+
+        assert PatchedCoverageConfig(temp_dir, temp_dir / "data").data_file == temp_dir / "build" / ".coverage"
+
+
+class TestCoverageEraseData:
+    def test_erase(self, temp_dir):
+        from hatch.cli.test.core import PatchedCoverageConfig
+
+        (temp_dir / ".coverage").touch()
+        (temp_dir / ".coverage.host.1.2").touch()
+        (temp_dir / ".coveragerc").touch()
+
+        PatchedCoverageConfig(temp_dir, temp_dir / "data").erase_data()
+
+        assert sorted(path.name for path in temp_dir.iterdir()) == [".coveragerc"]
+
+    def test_missing_directory(self, temp_dir):
+        from hatch.cli.test.core import PatchedCoverageConfig
+
+        (temp_dir / "pyproject.toml").write_text('[tool.coverage.run]\ndata_file = "build/.coverage"\n')
+
+        PatchedCoverageConfig(temp_dir, temp_dir / "data").erase_data()
+
+        assert not (temp_dir / "build").exists()
+
+
+class TestCoverageContextIndex:
+    def test_missing_data_file(self, temp_dir):
+        from hatch.cli.test.core import CoverageContextIndex
+
+        index = CoverageContextIndex(temp_dir, temp_dir / "data")
+        index.update(temp_dir / ".coverage")
+
+        assert not index.exists()
+
+    def test_update(self, temp_dir):
+        from hatch.cli.test.core import CoverageContextIndex
+
+        project_root = temp_dir / "project"
+        project_root.mkdir()
+        data_file = project_root / ".coverage"
+        write_coverage_data(
+            data_file,
+            {
+                str(project_root / "src" / "foo.py"): ["tests/test_foo.py::test", ""],
+                str(project_root / "src" / "bar.py"): ["tests/test_bar.py::test", "tests/test_foo.py::test"],
+                str(temp_dir / "outside.py"): ["tests/test_bar.py::test"],
+            },
+        )
+
+        index = CoverageContextIndex(project_root, temp_dir / "data")
+        index.update(data_file)
+
+        assert index.get() == {
+            "src/bar.py": ["tests/test_bar.py::test", "tests/test_foo.py::test"],
+            "src/foo.py": ["tests/test_foo.py::test"],
+        }
+        assert index.select_tests(["src/foo.py", "README.md"]) == ["tests/test_foo.py::test"]
+
+    def test_incremental(self, temp_dir):
+        from hatch.cli.test.core import CoverageContextIndex
+
+        project_root = temp_dir / "project"
+        project_root.mkdir()
+
+        index = CoverageContextIndex(project_root, temp_dir / "data")
+        index.index_file.parent.ensure_dir_exists()
+        index.index_file.write_text(
+            json.dumps({
+                "src/bar.py": ["tests/test_bar.py::test", "tests/test_foo.py::test"],
+                "src/foo.py": ["tests/test_foo.py::test"],
+            })
+        )
+
+        data_file = project_root / ".coverage"
+        write_coverage_data(data_file, {str(project_root / "src" / "baz.py"): ["tests/test_foo.py::test"]})
+        index.update(data_file)
+
+        assert index.get() == {
+            "src/bar.py": ["tests/test_bar.py::test"],
+            "src/baz.py": ["tests/test_foo.py::test"],
+        }
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import hatch
+from hatch.utils.fs import Path
+from hatch.utils.structures import EnvVars
+
+
+@pytest.fixture
+def plugin():
+    from importlib.util import module_from_spec, spec_from_file_location
+
+    # Load the plugin standalone as test environments do, importing it from `hatch.cli` would import the
+    # command line interface before the test session is configured
+    path = Path(hatch.__file__).parent / "cli" / "test" / "scripts" / "hatch_test_durations.py"
+    spec = spec_from_file_location("hatch_test_durations", path)
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def get_items(*node_ids):
+    return [SimpleNamespace(nodeid=node_id) for node_id in node_ids]
+
+
+class TestOrdering:
+    def test_no_durations(self, plugin):
+        items = get_items("tests/test_a.py::test", "tests/test_b.py::test")
+
+        with EnvVars(exclude=["HATCH_TEST_DURATIONS"]):
+            plugin.pytest_collection_modifyitems(items)
+
+        assert [item.nodeid for item in items] == ["tests/test_a.py::test", "tests/test_b.py::test"]
+
+    def test_longest_modules_first(self, plugin, temp_dir):
+        durations_file = temp_dir / "durations.json"
+        durations_file.write_text(
+            json.dumps({
+                "tests/test_a.py::test1": 1.0,
+                "tests/test_a.py::test2": 1.0,
+                "tests/test_b.py::test": 5.0,
+                "tests/test_c.py::test": 0.5,
+            })
+        )
+        items = get_items(
+            "tests/test_a.py::test1",
+            "tests/test_a.py::test2",
+            "tests/test_c.py::test",
+            "tests/test_new.py::test",
+            "tests/test_b.py::test",
+        )
+
+        with EnvVars({"HATCH_TEST_DURATIONS": str(durations_file)}):
+            plugin.pytest_collection_modifyitems(items)
+
+        assert [item.nodeid for item in items] == [
+            "tests/test_b.py::test",
+            "tests/test_new.py::test",
+            "tests/test_a.py::test1",
+            "tests/test_a.py::test2",
+            "tests/test_c.py::test",
+        ]
+
+
+class TestRecording:
+    def test_write_report(self, plugin, temp_dir):
+        for when, duration in (("setup", 0.25), ("call", 1.0), ("teardown", 0.25)):
+            plugin.pytest_runtest_logreport(
+                SimpleNamespace(nodeid="tests/test_a.py::test", when=when, duration=duration)
+            )
+
+        report_file = temp_dir / "reports" / "report.json"
+        with EnvVars({"HATCH_TEST_DURATIONS_REPORT": str(report_file)}):
+            plugin.pytest_sessionfinish(SimpleNamespace(config=SimpleNamespace()))
+
+        assert json.loads(report_file.read_text()) == {"tests/test_a.py::test": 1.5}
+
+    def test_xdist_worker(self, plugin, temp_dir):
+        plugin.pytest_runtest_logreport(SimpleNamespace(nodeid="tests/test_a.py::test", duration=1.0))
+
+        report_file = temp_dir / "report.json"
+        with EnvVars({"HATCH_TEST_DURATIONS_REPORT": str(report_file)}):
+            plugin.pytest_sessionfinish(SimpleNamespace(config=SimpleNamespace(workerinput={})))
+
+        assert not report_file.exists()
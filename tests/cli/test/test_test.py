@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import json
+import os
+import subprocess
 import sys
+from contextlib import contextmanager
 
 import pytest
 
@@ -172,7 +176,7 @@ class TestArguments:
 
 
 class TestCoverage:
-    def test_flag(self, hatch, temp_dir, config_file, env_run, mocker):
+    def test_flag(self, hatch, temp_dir, config_file, helpers, env_run, mocker):
         config_file.model.template.plugins["default"]["tests"] = False
         config_file.save()
 
@@ -191,12 +195,16 @@ class TestCoverage:
             result = hatch("test", "--cover")
 
         assert result.exit_code == 0, result.output
-        assert not result.output
+        assert result.output == helpers.dedent(
+            """
+            cmd [1] | coverage run -m pytest -p no:randomly tests
+            cmd [2] | coverage combine --append
+            """
+        )
 
         assert env_run.call_args_list == [
-            mocker.call("coverage erase", shell=True),
             mocker.call("coverage run -m pytest -p no:randomly tests", shell=True),
-            mocker.call("coverage combine", shell=True),
+            mocker.call("coverage combine --append", shell=True),
             mocker.call("coverage report", shell=True),
         ]
 
@@ -209,7 +217,7 @@ class TestCoverage:
             "parallel = true",
         ]
 
-    def test_flag_with_arguments(self, hatch, temp_dir, config_file, env_run, mocker):
+    def test_flag_with_arguments(self, hatch, temp_dir, config_file, helpers, env_run, mocker):
         config_file.model.template.plugins["default"]["tests"] = False
         config_file.save()
 
@@ -228,12 +236,16 @@ class TestCoverage:
             result = hatch("test", "--cover", "--", "--flag", "--", "arg1", "arg2")
 
         assert result.exit_code == 0, result.output
-        assert not result.output
+        assert result.output == helpers.dedent(
+            """
+            cmd [1] | coverage run -m pytest -p no:randomly --flag -- arg1 arg2
+            cmd [2] | coverage combine --append
+            """
+        )
 
         assert env_run.call_args_list == [
-            mocker.call("coverage erase", shell=True),
             mocker.call("coverage run -m pytest -p no:randomly --flag -- arg1 arg2", shell=True),
-            mocker.call("coverage combine", shell=True),
+            mocker.call("coverage combine --append", shell=True),
             mocker.call("coverage report", shell=True),
         ]
 
@@ -246,7 +258,7 @@ class TestCoverage:
             "parallel = true",
         ]
 
-    def test_quiet_implicitly_enables(self, hatch, temp_dir, config_file, env_run, mocker):
+    def test_quiet_implicitly_enables(self, hatch, temp_dir, config_file, helpers, env_run, mocker):
         config_file.model.template.plugins["default"]["tests"] = False
         config_file.save()
 
@@ -265,12 +277,16 @@ class TestCoverage:
             result = hatch("test", "--cover-quiet")
 
         assert result.exit_code == 0, result.output
-        assert not result.output
+        assert result.output == helpers.dedent(
+            """
+            cmd [1] | coverage run -m pytest -p no:randomly tests
+            cmd [2] | coverage combine --append
+            """
+        )
 
         assert env_run.call_args_list == [
-            mocker.call("coverage erase", shell=True),
             mocker.call("coverage run -m pytest -p no:randomly tests", shell=True),
-            mocker.call("coverage combine", shell=True),
+            mocker.call("coverage combine --append", shell=True),
         ]
 
         root_config_path = data_path / ".config" / "coverage"
@@ -282,7 +298,112 @@ class TestCoverage:
             "parallel = true",
         ]
 
-    def test_legacy_config_define_section(self, hatch, temp_dir, config_file, env_run, mocker):
+    def test_erase_existing_data(self, hatch, temp_dir, config_file, helpers, env_run, mocker):
+        config_file.model.template.plugins["default"]["tests"] = False
+        config_file.save()
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        data_path = temp_dir / "data"
+        data_path.mkdir()
+
+        (project_path / ".coverage").touch()
+        (project_path / ".coverage.host.123.456").touch()
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch("test", "--cover")
+
+        assert result.exit_code == 0, result.output
+        assert result.output == helpers.dedent(
+            """
+            cmd [1] | coverage run -m pytest -p no:randomly tests
+            cmd [2] | coverage combine --append
+            """
+        )
+
+        assert env_run.call_args_list == [
+            mocker.call("coverage run -m pytest -p no:randomly tests", shell=True),
+            mocker.call("coverage combine --append", shell=True),
+            mocker.call("coverage report", shell=True),
+        ]
+
+        assert not (project_path / ".coverage").exists()
+        assert not (project_path / ".coverage.host.123.456").exists()
+
+    def test_matrix_combine_after_each_environment(self, hatch, temp_dir, config_file, env_run, mocker):
+        config_file.model.template.plugins["default"]["tests"] = False
+        config_file.save()
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        data_path = temp_dir / "data"
+        data_path.mkdir()
+
+        project = Project(project_path)
+        config = dict(project.raw_config)
+        config["tool"]["hatch"]["envs"] = {"hatch-test": {"matrix": [{"python": ["3.12", "3.10"]}]}}
+        project.save_config(config)
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch("test", "--all", "--cover", "--cover-xml", "--cover-json")
+
+        assert result.exit_code == 0, result.output
+
+        assert env_run.call_args_list == [
+            mocker.call("coverage run -m pytest -p no:randomly tests", shell=True),
+            mocker.call("coverage combine --append", shell=True),
+            mocker.call("coverage run -m pytest -p no:randomly tests", shell=True),
+            mocker.call("coverage combine --append", shell=True),
+            mocker.call("coverage report", shell=True),
+            mocker.call("coverage xml", shell=True),
+            mocker.call("coverage json", shell=True),
+        ]
+
+    def test_json_output(self, hatch, temp_dir, config_file, helpers, env_run, mocker):
+        config_file.model.template.plugins["default"]["tests"] = False
+        config_file.save()
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        data_path = temp_dir / "data"
+        data_path.mkdir()
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch("test", "--cover-quiet", "--cover-json", "--cover-json-output", "coverage.json")
+
+        assert result.exit_code == 0, result.output
+        assert result.output == helpers.dedent(
+            """
+            cmd [1] | coverage run -m pytest -p no:randomly tests
+            cmd [2] | coverage combine --append
+            """
+        )
+
+        assert env_run.call_args_list == [
+            mocker.call("coverage run -m pytest -p no:randomly tests", shell=True),
+            mocker.call("coverage combine --append", shell=True),
+            mocker.call("coverage json -o coverage.json", shell=True),
+        ]
+
+    def test_legacy_config_define_section(self, hatch, temp_dir, config_file, helpers, env_run, mocker):
         config_file.model.template.plugins["default"]["tests"] = False
         config_file.save()
 
@@ -303,12 +424,16 @@ class TestCoverage:
             result = hatch("test", "--cover")
 
         assert result.exit_code == 0, result.output
-        assert not result.output
+        assert result.output == helpers.dedent(
+            """
+            cmd [1] | coverage run -m pytest -p no:randomly tests
+            cmd [2] | coverage combine --append
+            """
+        )
 
         assert env_run.call_args_list == [
-            mocker.call("coverage erase", shell=True),
             mocker.call("coverage run -m pytest -p no:randomly tests", shell=True),
-            mocker.call("coverage combine", shell=True),
+            mocker.call("coverage combine --append", shell=True),
             mocker.call("coverage report", shell=True),
         ]
 
@@ -321,7 +446,7 @@ class TestCoverage:
             "parallel = true",
         ]
 
-    def test_legacy_config_enable_parallel(self, hatch, temp_dir, config_file, env_run, mocker):
+    def test_legacy_config_enable_parallel(self, hatch, temp_dir, config_file, helpers, env_run, mocker):
         config_file.model.template.plugins["default"]["tests"] = False
         config_file.save()
 
@@ -342,12 +467,16 @@ class TestCoverage:
             result = hatch("test", "--cover")
 
         assert result.exit_code == 0, result.output
-        assert not result.output
+        assert result.output == helpers.dedent(
+            """
+            cmd [1] | coverage run -m pytest -p no:randomly tests
+            cmd [2] | coverage combine --append
+            """
+        )
 
         assert env_run.call_args_list == [
-            mocker.call("coverage erase", shell=True),
             mocker.call("coverage run -m pytest -p no:randomly tests", shell=True),
-            mocker.call("coverage combine", shell=True),
+            mocker.call("coverage combine --append", shell=True),
             mocker.call("coverage report", shell=True),
         ]
 
@@ -778,7 +907,7 @@ class TestCustomScripts:
 
         assert not (data_path / ".config" / "coverage").exists()
 
-    def test_coverage(self, hatch, temp_dir, config_file, env_run, mocker):
+    def test_coverage(self, hatch, temp_dir, config_file, helpers, env_run, mocker):
         config_file.model.template.plugins["default"]["tests"] = False
         config_file.save()
 
@@ -811,10 +940,14 @@ class TestCustomScripts:
             result = hatch("test", "--cover")
 
         assert result.exit_code == 0, result.output
-        assert not result.output
+        assert result.output == helpers.dedent(
+            """
+            cmd [1] | combine coverage
+            cmd [2] | show coverage
+            """
+        )
 
         assert env_run.call_args_list == [
-            mocker.call("coverage erase", shell=True),
             mocker.call("test with coverage", shell=True),
             mocker.call("combine coverage", shell=True),
             mocker.call("show coverage", shell=True),
@@ -1090,6 +1223,558 @@ class TestFilters:
         assert not (data_path / ".config" / "coverage").exists()
 
 
+class TestShards:
+    @pytest.mark.usefixtures("env_run")
+    @pytest.mark.parametrize("option", ["--shards", "--shard-index"])
+    def test_options_used_together(self, hatch, temp_dir, config_file, helpers, option):
+        config_file.model.template.plugins["default"]["tests"] = False
+        config_file.save()
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        data_path = temp_dir / "data"
+        data_path.mkdir()
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch("test", option, "1")
+
+        assert result.exit_code == 1, result.output
+        assert result.output == helpers.dedent(
+            """
+            The --shards and --shard-index options must be used together.
+            """
+        )
+
+    @pytest.mark.usefixtures("env_run")
+    def test_index_out_of_range(self, hatch, temp_dir, config_file, helpers):
+        config_file.model.template.plugins["default"]["tests"] = False
+        config_file.save()
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        data_path = temp_dir / "data"
+        data_path.mkdir()
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch("test", "--shards", "2", "--shard-index", "2")
+
+        assert result.exit_code == 1, result.output
+        assert result.output == helpers.dedent(
+            """
+            The --shard-index option must be less than --shards: 2 >= 2
+            """
+        )
+
+    @pytest.mark.usefixtures("env_run")
+    def test_no_test_files(self, hatch, temp_dir, config_file, helpers):
+        config_file.model.template.plugins["default"]["tests"] = False
+        config_file.save()
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        data_path = temp_dir / "data"
+        data_path.mkdir()
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch("test", "--shards", "2", "--shard-index", "0")
+
+        assert result.exit_code == 1, result.output
+        assert result.output == helpers.dedent(
+            """
+            No test files found to split into shards.
+            """
+        )
+
+    @pytest.mark.parametrize(
+        ("shard_index", "expected_commands"),
+        [
+            (
+                "0",
+                [
+                    "test hatch-test.py3.12 tests/test_b.py",
+                    "test hatch-test.py3.10 tests/test_a.py tests/test_c.py",
+                    "test hatch-test.py3.8 tests/test_a.py tests/test_c.py",
+                ],
+            ),
+            (
+                "1",
+                [
+                    "test hatch-test.py3.12 tests/test_a.py tests/test_c.py",
+                    "test hatch-test.py3.10 tests/test_b.py",
+                    "test hatch-test.py3.8 tests/test_b.py",
+                ],
+            ),
+        ],
+    )
+    def test_matrix(self, hatch, temp_dir, config_file, env_run, mocker, shard_index, expected_commands):
+        config_file.model.template.plugins["default"]["tests"] = False
+        config_file.save()
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        data_path = temp_dir / "data"
+        data_path.mkdir()
+
+        tests_path = project_path / "tests"
+        tests_path.mkdir()
+        for name in ("a", "b", "c"):
+            (tests_path / f"test_{name}.py").touch()
+
+        (tests_path / "conftest.py").touch()
+
+        project = Project(project_path)
+        config = dict(project.raw_config)
+        config["tool"]["hatch"]["envs"] = {
+            "hatch-test": {
+                "matrix": [{"python": ["3.12", "3.10", "3.8"]}],
+                "scripts": {
+                    "run": "test {env_name} {args}",
+                    "run-cov": "test with coverage",
+                    "cov-combine": "combine coverage",
+                    "cov-report": "show coverage",
+                },
+            }
+        }
+        project.save_config(config)
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch("test", "--all", "--shards", "2", "--shard-index", shard_index)
+
+        assert result.exit_code == 0, result.output
+        assert env_run.call_args_list == [mocker.call(command, shell=True) for command in expected_commands]
+
+    def test_option_values_kept(self, hatch, temp_dir, config_file, env_run, mocker):
+        config_file.model.template.plugins["default"]["tests"] = False
+        config_file.save()
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        data_path = temp_dir / "data"
+        data_path.mkdir()
+
+        tests_path = project_path / "tests"
+        tests_path.mkdir()
+        for name in ("a", "b"):
+            (tests_path / f"test_{name}.py").touch()
+
+        project = Project(project_path)
+        config = dict(project.raw_config)
+        config["tool"]["hatch"]["envs"] = {
+            "hatch-test": {
+                "matrix": [{"python": ["3.12"]}],
+                "scripts": {
+                    "run": "test {env_name} {args}",
+                    "run-cov": "test with coverage",
+                    "cov-combine": "combine coverage",
+                    "cov-report": "show coverage",
+                },
+            }
+        }
+        project.save_config(config)
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch("test", "--shards", "2", "--shard-index", "1", "--", "--rootdir", "tests", "tests")
+
+        assert result.exit_code == 0, result.output
+        assert env_run.call_args_list == [
+            mocker.call("test hatch-test.py3.12 --rootdir tests tests/test_b.py", shell=True),
+        ]
+
+    def test_recorded_durations(self, hatch, temp_dir, config_file, env_run, mocker):
+        config_file.model.template.plugins["default"]["tests"] = False
+        config_file.save()
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        data_path = temp_dir / "data"
+        data_path.mkdir()
+
+        tests_path = project_path / "tests"
+        tests_path.mkdir()
+        for name in ("a", "b", "c"):
+            (tests_path / f"test_{name}.py").touch()
+
+        project = Project(project_path)
+        config = dict(project.raw_config)
+        config["tool"]["hatch"]["envs"] = {
+            "hatch-test": {
+                "matrix": [{"python": ["3.12", "3.10"]}],
+                "scripts": {
+                    "run": "test {env_name} {args}",
+                    "run-cov": "test with coverage",
+                    "cov-combine": "combine coverage",
+                    "cov-report": "show coverage",
+                },
+            }
+        }
+        project.save_config(config)
+
+        storage_path = data_path / "test" / project_path.id
+        durations_file = storage_path / "durations" / "hatch-test.py3.12.json"
+        durations_file.parent.ensure_dir_exists()
+        durations_file.write_text(
+            json.dumps({
+                "tests/test_a.py::test_foo": 6.0,
+                "tests/test_a.py::test_bar": 4.0,
+                "tests/test_b.py::test": 2.0,
+            })
+        )
+
+        report_path = storage_path / "reports" / "hatch-test.py3.12.json"
+
+        def write_report(*args, **kwargs):  # noqa: ARG001
+            report_path.parent.ensure_dir_exists()
+            report_path.write_text(
+                json.dumps({"tests/test_b.py::test": 3.5, "tests/test_c.py::TestFoo::test_bar": 1.25})
+            )
+            return mocker.DEFAULT
+
+        env_run.side_effect = write_report
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch("test", "-py", "3.12", "--shards", "2", "--shard-index", "1")
+
+        assert result.exit_code == 0, result.output
+        assert env_run.call_args_list == [
+            mocker.call("test hatch-test.py3.12 tests/test_b.py tests/test_c.py", shell=True),
+        ]
+
+        assert not report_path.exists()
+        assert json.loads(durations_file.read_text()) == {
+            "tests/test_a.py::test_bar": 4.0,
+            "tests/test_a.py::test_foo": 6.0,
+            "tests/test_b.py::test": 3.5,
+            "tests/test_c.py::TestFoo::test_bar": 1.25,
+        }
+
+
+class TestDurations:
+    def test_recording(self, hatch, temp_dir, config_file, env_run, mocker):
+        config_file.model.template.plugins["default"]["tests"] = False
+        config_file.save()
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        data_path = temp_dir / "data"
+        data_path.mkdir()
+
+        (project_path / "tests").mkdir()
+        (project_path / "tests" / "test_foo.py").touch()
+
+        storage_path = data_path / "test" / project_path.id
+        report_path = storage_path / "reports" / "hatch-test.py3.12.json"
+        durations_file = storage_path / "durations" / "hatch-test.py3.12.json"
+        durations_file.parent.ensure_dir_exists()
+        durations_file.write_text(json.dumps({"tests/test_foo.py::test_old": 1.0, "tests/test_bar.py::test": 1.0}))
+
+        env_vars = {}
+
+        def write_report(*args, **kwargs):  # noqa: ARG001
+            env_vars.update(os.environ)
+            report_path.parent.ensure_dir_exists()
+            report_path.write_text(json.dumps({"tests/test_foo.py::test_new": 0.5}))
+            return mocker.DEFAULT
+
+        env_run.side_effect = write_report
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch("test", "-py", "3.12")
+
+        assert result.exit_code == 0, result.output
+        assert env_run.call_args_list == [
+            mocker.call("pytest -p no:randomly tests", shell=True),
+        ]
+
+        plugin_dir = data_path / "test" / ".plugins"
+        assert (plugin_dir / "hatch_test_durations.py").is_file()
+        assert env_vars["PYTEST_PLUGINS"].split(",")[-1] == "hatch_test_durations"
+        assert env_vars["PYTHONPATH"].split(os.pathsep)[0] == str(plugin_dir)
+        assert env_vars["HATCH_TEST_DURATIONS_REPORT"] == str(report_path)
+        assert env_vars["HATCH_TEST_DURATIONS"] == str(durations_file)
+
+        assert not report_path.exists()
+        assert json.loads(durations_file.read_text()) == {
+            "tests/test_foo.py::test_new": 0.5,
+            "tests/test_foo.py::test_old": 1.0,
+        }
+
+    def test_environment_defined_plugin_variables_not_overridden(self, hatch, temp_dir, config_file, env_run, mocker):
+        config_file.model.template.plugins["default"]["tests"] = False
+        config_file.save()
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        data_path = temp_dir / "data"
+        data_path.mkdir()
+
+        project = Project(project_path)
+        config = dict(project.raw_config)
+        config["tool"]["hatch"]["envs"] = {
+            "hatch-test": {"env-vars": {"PYTHONPATH": "src", "PYTEST_PLUGINS": "foo"}},
+        }
+        project.save_config(config)
+
+        @contextmanager
+        def command_context(self):
+            with self.get_env_vars():
+                yield
+
+        mocker.patch("hatch.env.virtual.VirtualEnvironment.command_context", command_context)
+
+        env_vars = {}
+
+        def capture_env_vars(*args, **kwargs):  # noqa: ARG001
+            env_vars.update(os.environ)
+            return mocker.DEFAULT
+
+        env_run.side_effect = capture_env_vars
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch("test")
+
+        assert result.exit_code == 0, result.output
+        assert env_vars["PYTEST_PLUGINS"] == "foo"
+        assert env_vars["PYTHONPATH"] == "src"
+        assert "HATCH_TEST_DURATIONS_REPORT" not in env_vars
+
+    def test_randomize_disables_ordering(self, hatch, temp_dir, config_file, env_run, mocker):
+        config_file.model.template.plugins["default"]["tests"] = False
+        config_file.save()
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        data_path = temp_dir / "data"
+        data_path.mkdir()
+
+        env_vars = {}
+
+        def capture_env_vars(*args, **kwargs):  # noqa: ARG001
+            env_vars.update(os.environ)
+            return mocker.DEFAULT
+
+        env_run.side_effect = capture_env_vars
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch("test", "--randomize")
+
+        assert result.exit_code == 0, result.output
+        assert env_run.call_args_list == [
+            mocker.call("pytest tests", shell=True),
+        ]
+
+        assert "HATCH_TEST_DURATIONS_REPORT" in env_vars
+        assert "HATCH_TEST_DURATIONS" not in env_vars
+
+
+class TestChanged:
+    @pytest.mark.usefixtures("env_run")
+    def test_usage_with_shards(self, hatch, temp_dir, config_file, helpers):
+        config_file.model.template.plugins["default"]["tests"] = False
+        config_file.save()
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        data_path = temp_dir / "data"
+        data_path.mkdir()
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch("test", "--since", "main", "--shards", "2", "--shard-index", "0")
+
+        assert result.exit_code == 1, result.output
+        assert result.output == helpers.dedent(
+            """
+            The --changed option cannot be used with the --shards option.
+            """
+        )
+
+    def test_no_coverage_data(self, hatch, temp_dir, config_file, helpers, env_run, mocker):
+        config_file.model.template.plugins["default"]["tests"] = False
+        config_file.save()
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        data_path = temp_dir / "data"
+        data_path.mkdir()
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch("test", "--changed")
+
+        assert result.exit_code == 0, result.output
+        assert result.output == helpers.dedent(
+            """
+            No coverage data has been recorded yet, running all tests
+            """
+        )
+
+        assert env_run.call_args_list == [
+            mocker.call("pytest -p no:randomly tests", shell=True),
+        ]
+
+    @pytest.mark.parametrize(
+        ("option", "base"),
+        [
+            (["--changed"], "HEAD"),
+            (["--since", "origin/main"], "origin/main"),
+        ],
+    )
+    def test_selection(self, hatch, temp_dir, config_file, env_run, mocker, option, base):
+        config_file.model.template.plugins["default"]["tests"] = False
+        config_file.save()
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        data_path = temp_dir / "data"
+        data_path.mkdir()
+
+        tests_path = project_path / "tests"
+        tests_path.mkdir()
+        for name in ("foo", "bar", "baz"):
+            (tests_path / f"test_{name}.py").touch()
+
+        index_file = data_path / "test" / project_path.id / "coverage-contexts.json"
+        index_file.parent.ensure_dir_exists()
+        index_file.write_text(
+            json.dumps({
+                "src/my_app/foo.py": ["tests/test_bar.py::test", "tests/test_foo.py::TestFoo::test"],
+                "src/my_app/baz.py": ["tests/test_baz.py::test"],
+            })
+        )
+
+        git_commands = []
+
+        def run(command, **kwargs):
+            if kwargs.get("shell"):
+                return mocker.DEFAULT
+
+            # The executable is resolved to an absolute path on Windows
+            git_commands.append(command[1:])
+            if command[1] == "diff":
+                return subprocess.CompletedProcess(command, 0, stdout=b"src/my_app/foo.py\ntests/test_bar.py\n")
+
+            return subprocess.CompletedProcess(command, 0, stdout=b"README.md\n")
+
+        env_run.side_effect = run
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch("test", *option)
+
+        assert result.exit_code == 0, result.output
+        assert not result.output
+
+        assert git_commands == [
+            ["diff", "--name-only", "--relative", base],
+            ["ls-files", "--others", "--exclude-standard"],
+        ]
+        assert [call for call in env_run.call_args_list if call.kwargs.get("shell")] == [
+            mocker.call("pytest -p no:randomly tests/test_bar.py tests/test_foo.py::TestFoo::test", shell=True),
+        ]
+
+    def test_no_affected_tests(self, hatch, temp_dir, config_file, helpers, env_run):
+        config_file.model.template.plugins["default"]["tests"] = False
+        config_file.save()
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        data_path = temp_dir / "data"
+        data_path.mkdir()
+
+        index_file = data_path / "test" / project_path.id / "coverage-contexts.json"
+        index_file.parent.ensure_dir_exists()
+        index_file.write_text(json.dumps({"src/my_app/foo.py": ["tests/test_foo.py::test"]}))
+
+        env_run.side_effect = lambda command, **_: subprocess.CompletedProcess(command, 0, stdout=b"README.md\n")
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch("test", "--changed")
+
+        assert result.exit_code == 0, result.output
+        assert result.output == helpers.dedent(
+            """
+            No tests are affected by the changed files
+            """
+        )
+
+        assert not [call for call in env_run.call_args_list if call.kwargs.get("shell")]
+
+
 class TestShow:
     def test_default_compact(self, hatch, temp_dir, config_file, helpers):
         config_file.model.template.plugins["default"]["tests"] = False
@@ -1,6 +1,7 @@
+import json
 import os
 
-from hatch.config.constants import ConfigEnvVars
+from hatch.config.constants import AppEnvVars, ConfigEnvVars
 from hatch.config.user import ConfigFile
 from hatch.utils.structures import EnvVars
 
@@ -39,3 +40,33 @@ def test_no_config_file(hatch, config_file):
 
     assert result.exit_code == 1
     assert result.output == f"The selected config file `{config_file.path}` does not exist.\n"
+
+
+class TestTimings:
+    def test_display(self, hatch):
+        result = hatch("--timings", "config", "find")
+
+        assert result.exit_code == 0, result.output
+        assert "Timings (" in result.output
+        assert "Load configuration" in result.output
+
+    def test_trace_chrome(self, hatch, temp_dir):
+        trace_file = temp_dir / "trace.json"
+        result = hatch("--trace", str(trace_file), "config", "find")
+
+        assert result.exit_code == 0, result.output
+        assert "Timings (" not in result.output
+
+        trace = json.loads(trace_file.read_text())
+        assert [event["name"] for event in trace["traceEvents"]] == ["Load configuration"]
+
+    def test_trace_json_env_var(self, hatch, temp_dir):
+        trace_file = temp_dir / "trace.json"
+        with EnvVars({AppEnvVars.TRACE: str(trace_file), AppEnvVars.TRACE_FORMAT: "json"}):
+            result = hatch("config", "find")
+
+        assert result.exit_code == 0, result.output
+
+        trace = json.loads(trace_file.read_text())
+        assert [node["name"] for node in trace] == ["Load configuration"]
+        assert trace[0]["children"] == []
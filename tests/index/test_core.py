@@ -1,3 +1,4 @@
+import hashlib
 import json
 import platform
 
@@ -128,3 +129,72 @@ class TestUserAgent:
 
         assert data["distro"]["name"] == "macOS"
         assert data["distro"]["version"] == "14.0"
+
+
+class TestUploadArtifact:
+    @staticmethod
+    def mock_client(mocker, index, *status_codes):
+        responses = [httpx2.Response(code, request=httpx2.Request("POST", index.repo)) for code in status_codes]
+        client = mocker.MagicMock()
+        client.post.side_effect = responses
+        index.__dict__["client"] = client
+        return client
+
+    def test_digests(self, temp_dir, mocker):
+        artifact = temp_dir / "foo-1.0.tar.gz"
+        artifact.write_bytes(b"foo")
+        index = PackageIndex("https://foo.internal/a/b/")
+        client = self.mock_client(mocker, index, 200)
+
+        index.upload_artifact(artifact, {})
+
+        data = client.post.call_args.kwargs["data"]
+        assert data["sha256_digest"] == hashlib.sha256(b"foo").hexdigest()
+        assert data["md5_digest"] == hashlib.md5(b"foo").hexdigest()
+        assert data["blake2_256_digest"] == hashlib.blake2b(b"foo", digest_size=32).hexdigest()
+
+    def test_precomputed_digests(self, temp_dir, mocker):
+        artifact = temp_dir / "foo-1.0.tar.gz"
+        artifact.write_bytes(b"foo")
+        index = PackageIndex("https://foo.internal/a/b/")
+        client = self.mock_client(mocker, index, 200)
+        compute = mocker.patch("hatch.index.core.get_artifact_digests")
+
+        index.upload_artifact(artifact, {}, digests={"sha256_digest": "bar"})
+
+        assert client.post.call_args.kwargs["data"]["sha256_digest"] == "bar"
+        compute.assert_not_called()
+
+    def test_retry_server_error(self, temp_dir, mocker):
+        mocker.patch("time.sleep")
+        artifact = temp_dir / "foo-1.0.tar.gz"
+        artifact.write_bytes(b"foo")
+        index = PackageIndex("https://foo.internal/a/b/")
+        client = self.mock_client(mocker, index, 503, 200)
+
+        index.upload_artifact(artifact, {})
+
+        assert client.post.call_count == 2
+
+    def test_retry_limit(self, temp_dir, mocker):
+        mocker.patch("time.sleep")
+        artifact = temp_dir / "foo-1.0.tar.gz"
+        artifact.write_bytes(b"foo")
+        index = PackageIndex("https://foo.internal/a/b/")
+        client = self.mock_client(mocker, index, 503, 503)
+
+        with pytest.raises(httpx2.HTTPStatusError):
+            index.upload_artifact(artifact, {}, attempts=2)
+
+        assert client.post.call_count == 2
+
+    def test_no_retry_client_error(self, temp_dir, mocker):
+        artifact = temp_dir / "foo-1.0.tar.gz"
+        artifact.write_bytes(b"foo")
+        index = PackageIndex("https://foo.internal/a/b/")
+        client = self.mock_client(mocker, index, 400, 200)
+
+        with pytest.raises(httpx2.HTTPStatusError):
+            index.upload_artifact(artifact, {})
+
+        assert client.post.call_count == 1
@@ -242,3 +242,126 @@ class TestCheckHatchVersion:
         _ = project.metadata
 
         app.abort.assert_not_called()
+
+
+class TestEditableInstall:
+    @staticmethod
+    def _setup(temp_dir, mocker):
+        project_path = temp_dir / "project"
+        project_path.mkdir()
+        (project_path / "pyproject.toml").touch()
+        project = Project(project_path)
+        project.find_project_root()
+        project.save_config({"project": {"name": "foo", "version": "0.0.1", "dependencies": ["bar"]}})
+
+        app = mocker.MagicMock()
+        app.data_dir = temp_dir / "data"
+        project.set_app(app)
+
+        environment = mocker.MagicMock()
+        environment.name = "default"
+        environment.config = {"type": "virtual"}
+        environment.metadata = project.metadata
+        environment.features = []
+        environment.dev_mode = True
+        environment.skip_install = False
+        environment.locked = False
+        environment.dependency_hash.return_value = ""
+        environment.exists.return_value = False
+
+        return project, environment
+
+    @staticmethod
+    def _update_metadata(project, environment, *, tool=None, **fields):
+        config = {"project": {"name": "foo", "version": "0.0.1", "dependencies": ["bar"], **fields}}
+        if tool is not None:
+            config["tool"] = tool
+
+        project.save_config(config)
+
+        updated_project = Project(project.location)
+        updated_project.find_project_root()
+        updated_project.set_app(project.app)
+        environment.metadata = updated_project.metadata
+
+        return updated_project
+
+    def test_unchanged(self, temp_dir, mocker):
+        project, environment = self._setup(temp_dir, mocker)
+
+        project.prepare_environment(environment, keep_env=False)
+        assert environment.install_project_dev_mode.call_count == 1
+
+        environment.exists.return_value = True
+        project.prepare_environment(environment, keep_env=False)
+        assert environment.install_project_dev_mode.call_count == 1
+
+    def test_unrelated_change(self, temp_dir, mocker):
+        project, environment = self._setup(temp_dir, mocker)
+
+        project.prepare_environment(environment, keep_env=False)
+
+        project = self._update_metadata(project, environment, version="0.0.2", description="foo")
+        environment.exists.return_value = True
+        project.prepare_environment(environment, keep_env=False)
+
+        assert environment.install_project_dev_mode.call_count == 1
+
+    @pytest.mark.parametrize(
+        "fields",
+        [
+            pytest.param({"dependencies": ["baz"]}, id="dependencies"),
+            pytest.param({"scripts": {"foo": "foo:main"}}, id="scripts"),
+            pytest.param({"entry-points": {"foo": {"bar": "foo:bar"}}}, id="entry-points"),
+        ],
+    )
+    def test_changed(self, temp_dir, mocker, fields):
+        project, environment = self._setup(temp_dir, mocker)
+
+        project.prepare_environment(environment, keep_env=False)
+
+        project = self._update_metadata(project, environment, **fields)
+        environment.exists.return_value = True
+        project.prepare_environment(environment, keep_env=False)
+
+        assert environment.install_project_dev_mode.call_count == 2
+
+        project.prepare_environment(environment, keep_env=False)
+
+        assert environment.install_project_dev_mode.call_count == 2
+
+    def test_metadata_hooks(self, temp_dir, mocker):
+        project, environment = self._setup(temp_dir, mocker)
+        tool = {"hatch": {"metadata": {"hooks": {"unknown": {"option": "foo"}}}}}
+        project = self._update_metadata(project, environment, tool=tool, dynamic=["readme"])
+
+        # Unavailable metadata hooks would raise an error if they were executed
+        project.prepare_environment(environment, keep_env=False)
+        environment.exists.return_value = True
+        project.prepare_environment(environment, keep_env=False)
+
+        assert environment.install_project_dev_mode.call_count == 1
+
+        tool["hatch"]["metadata"]["hooks"]["unknown"]["option"] = "bar"
+        project = self._update_metadata(project, environment, tool=tool, dynamic=["readme"])
+        project.prepare_environment(environment, keep_env=False)
+
+        assert environment.install_project_dev_mode.call_count == 2
+
+    def test_untracked(self, temp_dir, mocker):
+        project, environment = self._setup(temp_dir, mocker)
+        environment.exists.return_value = True
+
+        project.prepare_environment(environment, keep_env=False)
+
+        assert environment.install_project_dev_mode.call_count == 0
+        assert project.env_metadata.editable_hash(environment) == project.editable_hash(environment)
+
+    def test_not_dev_mode(self, temp_dir, mocker):
+        project, environment = self._setup(temp_dir, mocker)
+        environment.dev_mode = False
+        environment.exists.return_value = True
+
+        project.prepare_environment(environment, keep_env=False)
+
+        assert not project.env_metadata.editable_hash(environment)
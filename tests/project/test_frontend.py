@@ -409,3 +409,61 @@ version = "9000.42"
         output = json.loads((output_dir / "output.json").read_text())
 
         assert output == []
+
+
+class TestHatchGetCoreMetadata:
+    def test_snapshot(self, temp_dir, temp_dir_data, platform, global_application):
+        project_dir = temp_dir / "project"
+        project_dir.mkdir()
+        (project_dir / "pyproject.toml").write_text(
+            """\
+[build-system]
+requires = ["hatchling"]
+build-backend = "hatchling.build"
+
+[project]
+name = "foo"
+version = "9000.42"
+dependencies = ["Bar"]
+"""
+        )
+
+        project = Project(project_dir)
+        project.build_env = MockEnvironment(
+            temp_dir,
+            project.metadata,
+            "default",
+            project.config.envs["default"],
+            {},
+            temp_dir_data,
+            temp_dir_data,
+            platform,
+            0,
+            global_application,
+        )
+
+        output_dir = temp_dir / "output"
+        output_dir.mkdir()
+        script = project.build_frontend.hatch.scripts.get_core_metadata(
+            output_dir=str(output_dir), project_root=str(project_dir)
+        )
+        platform.check_command([sys.executable, "-c", script])
+        output = json.loads((output_dir / "output.json").read_text())
+        snapshot = json.loads((output_dir / "snapshot.json").read_text())
+
+        assert output["dependencies"] == ["bar"]
+        assert snapshot["version"] == "9000.42"
+        assert snapshot["core"]["dependencies"] == ["bar"]
+
+        snapshot_dir = temp_dir / "snapshot"
+        snapshot_dir.mkdir()
+        (output_dir / "snapshot.json").replace(snapshot_dir / "snapshot.json")
+        script = project.build_frontend.hatch.scripts.get_core_metadata(
+            output_dir=str(output_dir),
+            project_root=str(project_dir),
+            metadata_snapshot=str(snapshot_dir / "snapshot.json"),
+        )
+        platform.check_command([sys.executable, "-c", script])
+
+        assert json.loads((output_dir / "output.json").read_text()) == output
+        assert json.loads((output_dir / "snapshot.json").read_text()) == snapshot
@@ -0,0 +1,73 @@
+import json
+
+from hatch.index.core import get_artifact_digests
+from hatch.publish.index import ArtifactDigestCache
+
+
+class TestArtifactDigestCache:
+    def test_compute(self, temp_dir):
+        artifact = temp_dir / "foo-1.0.tar.gz"
+        artifact.write_bytes(b"foo")
+        cache = ArtifactDigestCache(temp_dir / "cache" / "digests.json")
+
+        assert cache.get(artifact) == get_artifact_digests(artifact)
+
+    def test_persisted(self, temp_dir, mocker):
+        artifact = temp_dir / "foo-1.0.tar.gz"
+        artifact.write_bytes(b"foo")
+        cache_file = temp_dir / "cache" / "digests.json"
+        cache = ArtifactDigestCache(cache_file)
+        digests = cache.get(artifact)
+        cache.save()
+
+        compute = mocker.patch("hatch.index.core.get_artifact_digests")
+
+        assert ArtifactDigestCache(cache_file).get(artifact) == digests
+        compute.assert_not_called()
+
+    def test_modified_artifact(self, temp_dir):
+        artifact = temp_dir / "foo-1.0.tar.gz"
+        artifact.write_bytes(b"foo")
+        cache_file = temp_dir / "cache" / "digests.json"
+        cache = ArtifactDigestCache(cache_file)
+        cache.get(artifact)
+        cache.save()
+
+        artifact.write_bytes(b"foobar")
+
+        assert ArtifactDigestCache(cache_file).get(artifact) == get_artifact_digests(artifact)
+
+    def test_prune_missing_artifacts(self, temp_dir):
+        cache_file = temp_dir / "cache" / "digests.json"
+        cache = ArtifactDigestCache(cache_file)
+        for name in ("foo-1.0.tar.gz", "bar-1.0.tar.gz"):
+            artifact = temp_dir / name
+            artifact.write_bytes(b"foo")
+            cache.get(artifact)
+
+        (temp_dir / "bar-1.0.tar.gz").unlink()
+        cache.save()
+
+        assert list(json.loads(cache_file.read_text())) == [str((temp_dir / "foo-1.0.tar.gz").resolve())]
+
+    def test_concurrent(self, temp_dir):
+        from concurrent.futures import ThreadPoolExecutor
+
+        cache_file = temp_dir / "cache" / "digests.json"
+        cache = ArtifactDigestCache(cache_file)
+        artifacts = []
+        for i in range(32):
+            artifact = temp_dir / f"foo-{i}.tar.gz"
+            artifact.write_bytes(str(i).encode("ascii"))
+            artifacts.append(artifact)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            digests = list(executor.map(cache.get, artifacts))
+
+        cache.save()
+
+        data = json.loads(cache_file.read_text())
+        assert len(data) == len(artifacts)
+        for artifact, artifact_digests in zip(artifacts, digests, strict=True):
+            assert artifact_digests == get_artifact_digests(artifact)
+            assert data[str(artifact.resolve())]["digests"] == artifact_digests
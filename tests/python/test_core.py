@@ -118,3 +118,234 @@ class TestGetInstalled:
         assert installed["3.13t"].version == "3.13.15"
         assert "freethreaded" not in installed["3.13"].metadata["source"]
         assert "freethreaded" in installed["3.13t"].metadata["source"]
+
+
+def write_installed_distribution(directory, name):
+    dist = get_distribution(name)
+    path = directory / dist.name
+    path.mkdir()
+    metadata_file = path / InstalledDistribution.metadata_filename()
+    metadata_file.write_text(json.dumps({"source": dist.source}))
+    python_path = path / dist.python_path
+    python_path.parent.ensure_dir_exists()
+    python_path.touch()
+
+    return path
+
+
+class TestManifest:
+    def test_written(self, temp_dir):
+        write_installed_distribution(temp_dir, "3.10")
+
+        assert tuple(PythonManager(temp_dir).get_installed()) == ("3.10",)
+
+        manifest = json.loads((temp_dir / PythonManager.manifest_filename()).read_text())
+        assert manifest["entries"] == ["3.10"]
+        assert list(manifest["distributions"]) == ["3.10"]
+
+    def test_used(self, temp_dir):
+        path = write_installed_distribution(temp_dir, "3.10")
+        PythonManager(temp_dir).get_installed()
+
+        # Distribution metadata is not read again
+        (path / InstalledDistribution.metadata_filename()).unlink()
+
+        assert tuple(PythonManager(temp_dir).get_installed()) == ("3.10",)
+
+    def test_memoized(self, temp_dir):
+        manager = PythonManager(temp_dir)
+        write_installed_distribution(temp_dir, "3.10")
+        manager.get_installed()
+
+        write_installed_distribution(temp_dir, "3.11")
+
+        assert tuple(manager.get_installed()) == ("3.10",)
+
+    def test_stale(self, temp_dir):
+        write_installed_distribution(temp_dir, "3.10")
+        PythonManager(temp_dir).get_installed()
+
+        write_installed_distribution(temp_dir, "3.11")
+
+        assert tuple(PythonManager(temp_dir).get_installed()) == ("3.10", "3.11")
+
+    def test_invalid(self, temp_dir):
+        write_installed_distribution(temp_dir, "3.10")
+        (temp_dir / PythonManager.manifest_filename()).write_text("{")
+
+        assert tuple(PythonManager(temp_dir).get_installed()) == ("3.10",)
+
+    def test_remove(self, temp_dir):
+        write_installed_distribution(temp_dir, "3.10")
+        write_installed_distribution(temp_dir, "3.11")
+        manager = PythonManager(temp_dir)
+
+        manager.remove(manager.get_installed()["3.10"])
+
+        assert tuple(manager.get_installed()) == ("3.11",)
+        manifest = json.loads((temp_dir / PythonManager.manifest_filename()).read_text())
+        assert manifest["entries"] == ["3.11"]
+
+    def test_remove_last(self, temp_dir):
+        write_installed_distribution(temp_dir, "3.10")
+        manager = PythonManager(temp_dir)
+
+        manager.remove(manager.get_installed()["3.10"])
+
+        assert manager.get_installed() == {}
+        assert not any(temp_dir.iterdir())
+
+
+class TestGetArchive:
+    def test_download(self, temp_dir, mocker):
+        manager = PythonManager(temp_dir / "pythons", cache_dir=temp_dir / "cache")
+        dist = get_distribution("3.10")
+        download = mocker.patch(
+            "hatch.utils.network.download_file", side_effect=lambda path, *_, **__: path.write_bytes(b"foo")
+        )
+
+        archive_path = manager.get_archive(dist)
+
+        assert archive_path.name == dist.archive_name
+        assert archive_path.read_bytes() == b"foo"
+        assert archive_path.parent.parent == temp_dir / "cache" / dist.name
+        assert not archive_path.with_name(f"{dist.archive_name}.part").exists()
+        download.assert_called_once_with(
+            archive_path.with_name(f"{dist.archive_name}.part"), dist.source, follow_redirects=True, resume=True
+        )
+
+    def test_reuse_cached(self, temp_dir, mocker):
+        manager = PythonManager(temp_dir / "pythons", cache_dir=temp_dir / "cache")
+        dist = get_distribution("3.10")
+        download = mocker.patch(
+            "hatch.utils.network.download_file", side_effect=lambda path, *_, **__: path.write_bytes(b"foo")
+        )
+
+        archive_path = manager.get_archive(dist)
+
+        assert manager.get_archive(dist) == archive_path
+        download.assert_called_once()
+
+    def test_checksum_mismatch(self, temp_dir, mocker):
+        manager = PythonManager(temp_dir / "pythons", cache_dir=temp_dir / "cache")
+        dist = get_distribution("3.10")
+        download = mocker.patch(
+            "hatch.utils.network.download_file", side_effect=lambda path, *_, **__: path.write_bytes(b"foo")
+        )
+
+        archive_path = manager.get_archive(dist)
+        archive_path.write_bytes(b"bar")
+
+        assert manager.get_archive(dist) == archive_path
+        assert archive_path.read_bytes() == b"foo"
+        assert download.call_count == 2
+
+    def test_custom_sources_do_not_collide(self, temp_dir, mocker):
+        manager = PythonManager(temp_dir / "pythons", cache_dir=temp_dir / "cache")
+        mocker.patch("hatch.utils.network.download_file", side_effect=lambda path, *_, **__: path.write_bytes(b"foo"))
+
+        archive_paths = set()
+        for source in ("https://foo.test/python.tar.gz", "https://bar.test/python.tar.gz"):
+            with EnvVars({custom_env_var(PythonEnvVars.CUSTOM_SOURCE_PREFIX, "3.10"): source}):
+                archive_paths.add(manager.get_archive(get_distribution("3.10")))
+
+        assert len(archive_paths) == 2
+
+    def test_previous_releases_pruned(self, temp_dir, mocker):
+        manager = PythonManager(temp_dir / "pythons", cache_dir=temp_dir / "cache")
+        mocker.patch("hatch.utils.network.download_file", side_effect=lambda path, *_, **__: path.write_bytes(b"foo"))
+
+        other_archive_path = manager.get_archive(get_distribution("3.11"))
+        with EnvVars({custom_env_var(PythonEnvVars.CUSTOM_SOURCE_PREFIX, "3.10"): "https://foo.test/python.tar.gz"}):
+            old_archive_path = manager.get_archive(get_distribution("3.10"))
+
+        archive_path = manager.get_archive(get_distribution("3.10"))
+
+        assert archive_path.is_file()
+        assert not old_archive_path.parent.exists()
+        assert other_archive_path.is_file()
+
+
+def make_distribution_archive(python_path):
+    import io
+    import tarfile
+
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tf:
+        content = b"#!/bin/sh\n"
+        info = tarfile.TarInfo(python_path)
+        info.size = len(content)
+        info.mode = 0o755
+        tf.addfile(info, io.BytesIO(content))
+
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def mock_download(mocker):
+    from contextlib import contextmanager
+
+    requests = []
+
+    def make(content):
+        @contextmanager
+        def streaming_response(*args, **kwargs):
+            requests.append((args, kwargs))
+            chunks = [content[i : i + 100] for i in range(0, len(content), 100)]
+            yield mocker.MagicMock(status_code=200, headers={}, iter_bytes=lambda _: iter(chunks))
+
+        mocker.patch("hatch.utils.network.streaming_response", side_effect=streaming_response)
+        return requests
+
+    return make
+
+
+class TestInstallStreaming:
+    def test_no_cache(self, temp_dir, mock_download):
+        dist = get_distribution("3.10")
+        requests = mock_download(make_distribution_archive(dist.python_path))
+        manager = PythonManager(temp_dir / "pythons")
+
+        installed_dist = manager.install("3.10")
+
+        assert installed_dist.python_path.is_file()
+        assert len(requests) == 1
+        assert tuple(manager.get_installed()) == ("3.10",)
+        assert (manager.directory / PythonManager.manifest_filename()).is_file()
+
+    def test_cache_written_and_reused(self, temp_dir, mock_download):
+        dist = get_distribution("3.10")
+        archive = make_distribution_archive(dist.python_path)
+        requests = mock_download(archive)
+        manager = PythonManager(temp_dir / "pythons", cache_dir=temp_dir / "cache")
+
+        manager.install("3.10")
+
+        archive_path = manager.get_cached_archive(dist)
+        assert archive_path is not None
+        assert archive_path.read_bytes() == archive
+
+        installed_dist = manager.install("3.10")
+
+        assert installed_dist.python_path.is_file()
+        assert len(requests) == 1
+
+    def test_partial_download_resumed(self, temp_dir, mock_download, mocker):
+        dist = get_distribution("3.10")
+        archive = make_distribution_archive(dist.python_path)
+        mock_download(archive)
+        manager = PythonManager(temp_dir / "pythons", cache_dir=temp_dir / "cache")
+        stream_archive = mocker.spy(manager, "stream_archive")
+
+        cache_dir = temp_dir / "cache"
+        cache_dir.mkdir()
+        manager.get_archive(dist)
+        (archive_path,) = cache_dir.glob(f"*/*/{dist.archive_name}")
+        archive_path.replace(archive_path.with_name(f"{dist.archive_name}.part"))
+        archive_path.with_name(f"{dist.archive_name}.sha256").unlink()
+
+        installed_dist = manager.install("3.10")
+
+        assert installed_dist.python_path.is_file()
+        stream_archive.assert_not_called()
+        assert manager.get_cached_archive(dist) == archive_path
@@ -0,0 +1,63 @@
+from hatch.utils.cache import KeyedCache, compute_key, file_digest
+
+
+class TestKeyedCache:
+    def test_missing(self, temp_dir):
+        assert KeyedCache(temp_dir / "cache.json").get("key") is None
+
+    def test_round_trip(self, temp_dir):
+        cache = KeyedCache(temp_dir / "nested" / "cache.json")
+        cache.set("key", {"foo": ["bar"]})
+
+        assert cache.get("key") == {"foo": ["bar"]}
+
+    def test_key_mismatch(self, temp_dir):
+        cache = KeyedCache(temp_dir / "cache.json")
+        cache.set("key1", "value")
+
+        assert cache.get("key2") is None
+
+    def test_corrupt(self, temp_dir):
+        cache_file = temp_dir / "cache.json"
+        cache_file.write_text("{")
+
+        assert KeyedCache(cache_file).get("key") is None
+
+    def test_get_or_create(self, temp_dir):
+        cache = KeyedCache(temp_dir / "cache.json")
+        calls = []
+
+        def create():
+            calls.append(None)
+            return "value"
+
+        assert cache.get_or_create("key", create) == "value"
+        assert cache.get_or_create("key", create) == "value"
+        assert len(calls) == 1
+
+        assert cache.get_or_create("other", create) == "value"
+        assert len(calls) == 2
+
+
+class TestComputeKey:
+    def test_stable(self):
+        assert compute_key("foo", ["bar"], {"b": 1, "a": 2}) == compute_key("foo", ["bar"], {"a": 2, "b": 1})
+
+    def test_distinct(self):
+        assert compute_key("foo", 1) != compute_key("foo", 2)
+
+
+class TestFileDigest:
+    def test_none(self):
+        assert not file_digest(None)
+
+    def test_missing(self, temp_dir):
+        assert not file_digest(temp_dir / "missing")
+
+    def test_contents(self, temp_dir):
+        path = temp_dir / "file"
+        path.write_text("foo")
+        digest = file_digest(path)
+
+        path.write_text("bar")
+        assert file_digest(path) != digest
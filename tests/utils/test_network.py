@@ -0,0 +1,138 @@
+from contextlib import contextmanager
+
+import pytest
+
+from hatch.utils.network import ResponseStream, download_file, parse_content_range
+
+
+@pytest.fixture
+def mock_response(mocker):
+    requests = []
+    responses = []
+
+    @contextmanager
+    def streaming_response(*args, **kwargs):
+        requests.append((args, kwargs))
+        status_code, content, headers = responses.pop(0)
+        yield mocker.MagicMock(status_code=status_code, headers=headers, iter_bytes=lambda _: iter([content]))
+
+    mocker.patch("hatch.utils.network.streaming_response", side_effect=streaming_response)
+
+    def make(status_code, content, headers=None):
+        responses.append((status_code, content, headers or {}))
+        return requests
+
+    return make
+
+
+class TestDownloadFile:
+    def test_default(self, temp_dir, mock_response):
+        requests = mock_response(200, b"foo")
+        path = temp_dir / "file"
+        path.write_bytes(b"bar")
+
+        download_file(path, "https://foo.test")
+
+        assert path.read_bytes() == b"foo"
+        assert "headers" not in requests[0][1]
+
+    def test_resume(self, temp_dir, mock_response):
+        requests = mock_response(206, b"bar", {"Content-Range": "bytes 3-5/6"})
+        path = temp_dir / "file"
+        path.write_bytes(b"foo")
+
+        download_file(path, "https://foo.test", resume=True)
+
+        assert path.read_bytes() == b"foobar"
+        assert requests[0][1]["headers"] == {"Range": "bytes=3-"}
+
+    def test_resume_complete(self, temp_dir, mock_response):
+        requests = mock_response(416, b"", {"Content-Range": "bytes */3"})
+        path = temp_dir / "file"
+        path.write_bytes(b"foo")
+
+        download_file(path, "https://foo.test", resume=True)
+
+        assert path.read_bytes() == b"foo"
+        assert len(requests) == 1
+        assert requests[0][1]["allowed_statuses"] == (416,)
+
+    def test_resume_not_satisfiable(self, temp_dir, mock_response):
+        mock_response(416, b"", {"Content-Range": "bytes */2"})
+        requests = mock_response(200, b"ba")
+        path = temp_dir / "file"
+        path.write_bytes(b"foo")
+
+        download_file(path, "https://foo.test", resume=True)
+
+        assert path.read_bytes() == b"ba"
+        assert len(requests) == 2
+        assert "headers" not in requests[1][1]
+
+    def test_resume_range_mismatch(self, temp_dir, mock_response):
+        mock_response(206, b"obar", {"Content-Range": "bytes 2-5/6"})
+        requests = mock_response(200, b"foobar")
+        path = temp_dir / "file"
+        path.write_bytes(b"foo")
+
+        download_file(path, "https://foo.test", resume=True)
+
+        assert path.read_bytes() == b"foobar"
+        assert len(requests) == 2
+        assert "headers" not in requests[1][1]
+
+    def test_resume_unsupported(self, temp_dir, mock_response):
+        mock_response(200, b"foobar")
+        path = temp_dir / "file"
+        path.write_bytes(b"foo")
+
+        download_file(path, "https://foo.test", resume=True)
+
+        assert path.read_bytes() == b"foobar"
+
+    def test_resume_nothing_downloaded(self, temp_dir, mock_response):
+        requests = mock_response(200, b"foo")
+        path = temp_dir / "file"
+
+        download_file(path, "https://foo.test", resume=True)
+
+        assert path.read_bytes() == b"foo"
+        assert "headers" not in requests[0][1]
+
+
+class TestParseContentRange:
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("bytes 200-999/1000", (200, 1000)),
+            ("bytes 200-999/*", (200, None)),
+            ("bytes */1000", (None, 1000)),
+            ("items 0-9/10", (None, None)),
+            ("", (None, None)),
+        ],
+    )
+    def test_parse(self, value, expected):
+        assert parse_content_range(value) == expected
+
+
+class TestResponseStream:
+    def test_read(self):
+        chunks = []
+        stream = ResponseStream(iter([b"foo", b"bar", b"baz"]), chunks.append)
+
+        assert stream.read(2) == b"fo"
+        assert stream.read(2) == b"o"
+        assert stream.read() == b"barbaz"
+        assert stream.read() == b""
+        assert chunks == [b"foo", b"bar", b"baz"]
+
+    def test_exhaust(self):
+        chunks = []
+        stream = ResponseStream(iter([b"foo", b"bar", b"baz"]), chunks.append)
+
+        assert stream.read(1) == b"f"
+
+        stream.exhaust()
+
+        assert stream.read() == b""
+        assert chunks == [b"foo", b"bar", b"baz"]
@@ -1,10 +1,11 @@
 import os
 import stat
+import sys
 
 import pytest
 
 from hatch.utils.fs import Path
-from hatch.utils.platform import Platform
+from hatch.utils.platform import Platform, ProcessOutputReader
 from hatch.utils.structures import EnvVars
 
 
@@ -120,3 +121,28 @@ class TestLinux:
         kwargs["executable"] = "foo"
         platform.populate_default_popen_kwargs(kwargs, shell=True)
         assert kwargs["executable"] == "foo"
+
+
+class TestStreamProcessOutput:
+    def test_lines_intact(self):
+        platform = Platform()
+        script = "import sys\nfor i in range(10000): print(i)\nsys.stdout.write('end')"
+
+        with platform.capture_process([sys.executable, "-c", script]) as process:
+            batches = list(platform.stream_process_output(process))
+            process.communicate()
+
+        assert all(batch.endswith("\n") for batch in batches[:-1])
+        assert "".join(batches).splitlines() == [*map(str, range(10000)), "end"]
+
+    def test_split_multibyte_character(self, mocker):
+        process = mocker.MagicMock()
+        reader = ProcessOutputReader(process)
+        encoded = "fo\u00e9\nb\u00e9r".encode()
+        mocker.patch("os.read", side_effect=[encoded[:3], encoded[3:], b""])
+
+        assert not reader.read()
+        assert reader.read() == "fo\u00e9\n"
+        assert not reader.read()
+        assert reader.eof
+        assert reader.flush() == "b\u00e9r"
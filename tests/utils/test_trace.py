@@ -0,0 +1,65 @@
+import pytest
+
+from hatch.utils.trace import Tracer
+
+
+def test_disabled():
+    tracer = Tracer()
+    with tracer.span("foo"):
+        pass
+
+    assert not tracer.spans
+    assert tracer.to_json() == []
+
+
+def test_nested():
+    tracer = Tracer(enabled=True)
+    with tracer.span("foo", key="value"):
+        with tracer.span("bar"):
+            pass
+
+        with tracer.span("baz"):
+            pass
+
+    with tracer.span("qux"):
+        pass
+
+    assert [(span.name, span.depth) for span in tracer.spans] == [("foo", 0), ("bar", 1), ("baz", 1), ("qux", 0)]
+
+    foo, bar, baz, qux = tracer.spans
+    assert foo.start <= bar.start <= baz.start <= qux.start
+    assert foo.duration >= bar.duration + baz.duration
+
+    tree = tracer.to_json()
+    assert [node["name"] for node in tree] == ["foo", "qux"]
+    assert tree[0]["attributes"] == {"key": "value"}
+    assert [node["name"] for node in tree[0]["children"]] == ["bar", "baz"]
+    assert tree[1]["children"] == []
+
+
+def test_span_ends_on_error():
+    tracer = Tracer(enabled=True)
+    with pytest.raises(RuntimeError), tracer.span("foo"):
+        raise RuntimeError
+
+    with tracer.span("bar"):
+        pass
+
+    assert [(span.name, span.depth) for span in tracer.spans] == [("foo", 0), ("bar", 0)]
+
+
+def test_chrome_trace():
+    tracer = Tracer(enabled=True)
+    with tracer.span("foo", key="value"):
+        pass
+
+    trace = tracer.to_chrome_trace()
+    assert trace["displayTimeUnit"] == "ms"
+
+    (event,) = trace["traceEvents"]
+    span = tracer.spans[0]
+    assert event["name"] == "foo"
+    assert event["ph"] == "X"
+    assert event["ts"] == span.start * 1_000_000
+    assert event["dur"] == span.duration * 1_000_000
+    assert event["args"] == {"key": "value"}